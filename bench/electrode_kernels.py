@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the methods of `Metal` and `SC` against their unit-carrying expressions
+
+For each method, reports the cost of one call through the unit-free kernels of `tec.electrode._kernels`, which the methods now use, and of the equivalent `astropy.units.Quantity` expression the methods evaluated previously. The cache of the electrode is discarded before each timed call of a method ("cold"); the cost of a call answered from the cache is reported separately ("cached").
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_kernels.py
+"""
+import timeit
+
+setup = """
+import numpy as np
+from scipy import optimize
+from astropy import units, constants
+from tec.electrode import Metal, SC
+el = Metal(temp=1500., barrier=2., richardson=10., voltage=0.5)
+sc = SC(temp=300., barrier=1., richardson=100., bandgap=1.11, electron_effective_mass=9.84e-31, hole_effective_mass=7.38e-31, acceptor_concentration=1e18, acceptor_ionization_energy=45.)
+
+def charge_neutrality(fermi_energy):
+    fermi_energy = units.Quantity(fermi_energy, "eV")
+    exponent_1 = ((sc.bandgap - fermi_energy) / (constants.k_B * sc.temp)).decompose()
+    exponent_2 = (fermi_energy / (constants.k_B * sc.temp)).decompose()
+    exponent_3 = ((sc.acceptor_ionization_energy - fermi_energy) / (constants.k_B * sc.temp)).decompose()
+    el_carrier_conc = sc.cb_effective_dos() * np.exp(-exponent_1)
+    ho_carrier_conc = sc.vb_effective_dos() * np.exp(-exponent_2)
+    return (el_carrier_conc - ho_carrier_conc + sc.acceptor_concentration / (1 + 4 * np.exp(exponent_3))).value
+"""
+
+cases = [("Metal.motive",
+          "el.motive()",
+          "(el.barrier + constants.e.si * el.voltage).to('eV')"),
+         ("Metal.thermoelectron_current_density",
+          "el.thermoelectron_current_density()",
+          "(el.richardson * el.temp**2 * np.exp(-(el.barrier / (constants.k_B * el.temp)).decompose())).to('A/cm2')"),
+         ("Metal.thermoelectron_energy_flux",
+          "el.thermoelectron_energy_flux()",
+          "((el.barrier + 2 * constants.k_B * el.temp) / constants.e.to('C') * (el.richardson * el.temp**2 * np.exp(-(el.barrier / (constants.k_B * el.temp)).decompose())).to('A/cm2')).to('W/cm2')"),
+         ("SC.cb_effective_dos",
+          "sc.cb_effective_dos()",
+          "(2 * ((2 * np.pi * sc.electron_effective_mass * constants.k_B * sc.temp) / (constants.h ** 2))**(3. / 2)).to('1/cm3')"),
+         ("SC.fermi_energy",
+          "sc.fermi_energy()",
+          "units.Quantity(optimize.brentq(charge_neutrality, 0, sc.bandgap.value), 'eV')"), ]
+
+if __name__ == "__main__":
+    print "%-38s %12s %12s %12s" % ("method", "cold [us]", "cached [us]", "units [us]")
+    for label, kernel, quantity in cases:
+        number = 20 if label == "SC.fermi_energy" else 2000
+        # `el.motive()` -> `el._invalidate_memo(); el.motive()`
+        cold = "%s._invalidate_memo(); %s" % (kernel.split(".")[0], kernel)
+        times = [1e6 * min(timeit.repeat(stmt, setup=setup, number=number, repeat=3)) / number for stmt in [cold, quantity]]
+        # The first call fills the cache.
+        cached = 1e6 * min(timeit.repeat(kernel, setup=setup + kernel, number=2000, repeat=3)) / 2000
+        print "%-38s %12.1f %12.1f %12.1f" % (label, times[0], cached, times[1])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the memory footprint of electrode representations
+
+Reports the growth of the resident set size per electrode when 10^5 electrodes are held in memory as `Metal`/`SC` objects, as `SlottedMetal`/`SlottedSC` objects, and as an `ElectrodeBatch`. Each representation is measured in a fresh process. Linux only, since the resident set size is read from ``/proc/self/statm``.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_memory.py
+"""
+import os
+import resource
+import subprocess
+import sys
+
+num = 100000
+
+cases = [("Metal", "[Metal(temp=1000. + indx, barrier=2., richardson=10.) for indx in range(num)]"),
+         ("SlottedMetal", "[SlottedMetal(temp=1000. + indx, barrier=2., richardson=10.) for indx in range(num)]"),
+         ("ElectrodeBatch(Metal)", "ElectrodeBatch(Metal, temp=1000. + np.arange(num), barrier=2., richardson=10.)"),
+         ("SC", "[SC(temp=300. + indx, barrier=1., richardson=10., bandgap=1.1) for indx in range(num)]"),
+         ("SlottedSC", "[SlottedSC(temp=300. + indx, barrier=1., richardson=10., bandgap=1.1) for indx in range(num)]"),
+         ("ElectrodeBatch(SC)", "ElectrodeBatch(SC, temp=300. + np.arange(num), barrier=1., richardson=10., bandgap=1.1)"), ]
+
+
+def rss():
+    """
+    Resident set size of this process in bytes.
+    """
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def measure(stmt):
+    """
+    Bytes of resident set size per electrode held by the result of `stmt`.
+    """
+    import numpy as np
+    from tec.electrode import Metal, SC, SlottedMetal, SlottedSC, ElectrodeBatch
+    # Construct one of each first so that lazily built state isn't counted.
+    SlottedSC(temp=300., barrier=1., richardson=10., bandgap=1.1).to_electrode()
+    before = rss()
+    electrodes = eval(stmt)
+    return (rss() - before) / float(num)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print measure(sys.argv[1])
+    else:
+        for label, stmt in cases:
+            size = float(subprocess.check_output([sys.executable, __file__, stmt], env=os.environ))
+            print "%-24s %10.0f bytes per electrode" % (label, size)
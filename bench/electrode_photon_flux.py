@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the photon methods of `Metal` and `SC` with and without `BoseEinsteinTable`
+
+Reports the cost of `photon_energy_flux` for a single electrode and for an electrode whose temperature (and, for `SC`, bandgap) is an array, with the incomplete Bose-Einstein integrals interpolated from the table and computed by `ibei.uibei`. The memoized value is discarded before every call.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_photon_flux.py
+"""
+import timeit
+
+setup = """
+import numpy as np
+from tec.electrode import Metal, SC, BoseEinsteinTable
+BoseEinsteinTable.shared(3)
+metal = Metal(temp=1500., barrier=2., emissivity=0.5)
+sc = SC(temp=1500., barrier=2., richardson=10., bandgap=1.1, emissivity=0.5)
+metals = Metal(temp=np.linspace(300., 2000., 100), barrier=2., emissivity=0.5)
+scs = SC(temp=np.linspace(300., 2000., 10)[:, np.newaxis], barrier=2., richardson=10., bandgap=np.linspace(0.5, 2., 10), emissivity=0.5)
+"""
+
+cases = [("Metal", "metal"), ("SC", "sc"), ("Metal, 100 temperatures", "metals"), ("SC, 10 x 10 temperatures, bandgaps", "scs"), ]
+
+if __name__ == "__main__":
+    print "%-36s %12s %12s" % ("photon_energy_flux", "table [us]", "uibei [us]")
+    for label, el in cases:
+        times = []
+        for tabulated in [True, False]:
+            stmt = "%s.tabulated_photon_flux = %s; %s._invalidate_memo(); %s.photon_energy_flux()" % (el, tabulated, el, el)
+            number = 200 if tabulated else 2
+            times.append(1e6 * min(timeit.repeat(stmt, setup=setup, number=number, repeat=3)) / number)
+        print "%-36s %12.1f %12.1f" % (label, times[0], times[1])
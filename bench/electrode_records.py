@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark bulk construction of electrodes from records
+
+Reports the cost per electrode of constructing `Metal` objects from a list of dictionaries with `Metal.from_dict`, and with `Metal.from_records` from a list of dictionaries and from a structured array, returning either a list of objects or an `ElectrodeBatch`.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_records.py
+"""
+import timeit
+
+num = 10000
+
+setup = """
+import numpy as np
+from tec.electrode import Metal
+records = [{"temp": 1000. + indx, "barrier": 2., "richardson": 10., "emissivity": 0.5} for indx in range(%d)]
+array = np.zeros(len(records), dtype=[("temp", float), ("barrier", float), ("richardson", float), ("emissivity", float)])
+for name in array.dtype.names:
+    array[name] = [record[name] for record in records]
+""" % num
+
+cases = [("from_dict, dicts", "[Metal.from_dict(record) for record in records]"),
+         ("from_records, dicts -> list", "Metal.from_records(records)"),
+         ("from_records, dicts -> batch", "Metal.from_records(records, batch=True)"),
+         ("from_records, array -> list", "Metal.from_records(array)"),
+         ("from_records, array -> batch", "Metal.from_records(array, batch=True)"), ]
+
+if __name__ == "__main__":
+    for label, stmt in cases:
+        best = min(timeit.repeat(stmt, setup=setup, number=1, repeat=3))
+        print "%-32s %10.2f us per electrode" % (label, 1e6 * best / num)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark a collector-voltage sweep built with `Metal.replace`
+
+Builds a collector for each of 10^5 voltages, either by constructing a fresh `Metal` and assigning its `voltage` (as the tests of `Langmuir` do) or with `Metal.replace` on a base collector, and evaluates `motive` and `thermoelectron_current_density` at each point.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_replace.py
+"""
+import timeit
+
+num = 100000
+
+setup = """
+import numpy as np
+from tec.electrode import Metal
+co_params = {"temp": 300., "barrier": 1., "richardson": 10., "position": 10.}
+voltages = np.linspace(0, 2, %d)
+co = Metal(**co_params)
+
+def construct(voltage):
+    el = Metal(**co_params)
+    el.voltage = voltage
+    return el
+
+def evaluate(el):
+    el.motive()
+    el.thermoelectron_current_density()
+""" % num
+
+cases = [("construct and assign", "[construct(voltage) for voltage in voltages]"),
+         ("replace", "[co.replace(voltage=voltage) for voltage in voltages]"),
+         ("construct, assign and evaluate", "[evaluate(construct(voltage)) for voltage in voltages]"),
+         ("replace and evaluate", "co.thermoelectron_current_density(); [evaluate(co.replace(voltage=voltage)) for voltage in voltages]"), ]
+
+if __name__ == "__main__":
+    for label, stmt in cases:
+        best = min(timeit.repeat(stmt, setup=setup, number=1, repeat=3))
+        print "%-32s %8.2f s  %8.1f us per point" % (label, best, 1e6 * best / num)
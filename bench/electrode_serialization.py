@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark serialization of many electrodes
+
+For 10^5 `Metal` electrodes, reports the time to convert every electrode to a dictionary with `dict`, to export them all as JSON with `tec.io.to_json`, and to emit them into a structured array with `Metal.to_records` and `ElectrodeBatch.to_records`. The `dict` case is also timed with the attribute names found by `physicalproperty.find_PhysicalProperty` on each iteration, as `Metal.__iter__` did before `Metal.schema`.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/electrode_serialization.py
+"""
+import timeit
+
+num = 100000
+
+setup = """
+import json
+import itertools
+from physicalproperty import find_PhysicalProperty
+import tec.io
+from tec.electrode import Metal
+electrodes = Metal.from_records([{"temp": 1000. + indx * 1e-3, "barrier": 2., "richardson": 10.} for indx in range(%d)])
+batch = Metal.from_records(Metal.to_records(electrodes), batch=True)
+
+def reflected_items(el):
+    names = find_PhysicalProperty(el)
+    return itertools.chain([("__class__", type(el))], zip(names, [getattr(el, name).value for name in names]))
+""" % num
+
+cases = [("dict, reflection per call", "[dict(reflected_items(el)) for el in electrodes]"),
+         ("dict, cached schema", "[dict(el) for el in electrodes]"),
+         ("JSON export", "json.dumps(electrodes, default=tec.io.to_json)"),
+         ("Metal.to_records", "Metal.to_records(electrodes)"),
+         ("ElectrodeBatch.to_records", "batch.to_records()"), ]
+
+if __name__ == "__main__":
+    for label, stmt in cases:
+        best = min(timeit.repeat(stmt, setup=setup, number=1, repeat=3))
+        print "%-28s %10.3f s  %12.0f electrodes/s" % (label, best, num / best)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark `FermiTable` against solving the Fermi energy exactly
+
+For the parameters of a few semiconductors, reports the knots along each axis, the fraction of the table covered within its tolerance, `max_error` and the time to construct, save and load the table, and the size of the file. Then, for 10^6 random pairs of temperature and acceptor concentration in the table, reports the time per pair of calling the table, of `_kernels.fermi_energy_newton` and of `SC.fermi_energy` with array attributes, and the largest error of the table.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/fermi_table.py
+"""
+import os
+import time
+import tempfile
+import numpy as np
+from tec.electrode import FermiTable, SC
+
+# bandgap [eV], electron and hole effective masses [kg], acceptor ionization
+# energy [meV].
+materials = [("Si", (1.11, 9.84e-31, 7.38e-31, 45.)),
+             ("Ge", (0.67, 5.2e-31, 2.7e-31, 10.)),
+             ("GaAs", (1.42, 6e-32, 4.6e-31, 30.)),
+             ("GaN", (3.4, 1.8e-31, 7.3e-31, 200.)), ]
+
+num_pairs = 10**6
+
+
+def timed(fcn, *args):
+    """
+    Value of `fcn(*args)` and the time it took.
+    """
+    start = time.time()
+    value = fcn(*args)
+    return value, time.time() - start
+
+
+if __name__ == "__main__":
+    rs = np.random.RandomState(0)
+    temp = rs.uniform(200., 2000., num_pairs)
+    acceptor_concentration = 10**rs.uniform(10, 20, num_pairs)
+    filename = os.path.join(tempfile.mkdtemp(), "table.npz")
+
+    print "%-6s %6s %8s %9s %10s %8s %8s %8s %10s %10s %10s %9s" % ("", "knots", "covered", "max err", "build [s]", "save [s]", "load [s]", "file [MB]", "table [us]", "newton [us]", "SC [us]", "error")
+    for name, params in materials:
+        table, build = timed(FermiTable, *params)
+        _, save = timed(table.save, filename)
+        _, load = timed(FermiTable.load, filename)
+
+        values, query = timed(table, temp, acceptor_concentration)
+        exact, newton = timed(table._solve, np.log10(temp), np.log10(acceptor_concentration))
+        el = SC(temp=temp, barrier=1., richardson=100., bandgap=params[0], electron_effective_mass=params[1], hole_effective_mass=params[2], acceptor_concentration=acceptor_concentration, acceptor_ionization_energy=params[3])
+        _, sc = timed(el.fermi_energy)
+
+        print "%-6s %6d %8.3f %9.1e %10.2f %8.3f %8.3f %8.2f %10.2f %10.2f %10.2f %9.1e" % (name, table.log_temp.size, table.covered_cells.mean(), table.max_error, build, save, load, os.path.getsize(filename) / 1e6,
+                                                                                           1e6 * query / num_pairs, 1e6 * newton / num_pairs, 1e6 * sc / num_pairs, np.nanmax(np.abs(values - exact)))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark accuracy presets of `DimensionlessLangmuirPoissonSoln`
+
+For each entry of `DimensionlessLangmuirPoissonSoln.accuracy_presets`, and for the default fixed-grid construction, reports the number of points per branch, the time to construct both branches, the memory held by their interpolations, and the maximum absolute error in position relative to `quadrature_position` for motive up to the blend windows.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_accuracy.py
+"""
+import timeit
+import numpy as np
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+
+setup = """
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+"""
+
+motives = np.linspace(0, 1, 41)[1:]
+
+
+def memory(dps):
+    """
+    Bytes of knots and coefficients held by the interpolations of `dps`.
+    """
+    total = 0
+    for branch in dps.values():
+        for spl in branch.values():
+            # Position vs. motive of the presets wraps its spline.
+            t, c, k = getattr(spl, "spline", spl)._eval_args
+            total += t.nbytes + c.nbytes
+    return total
+
+
+def position_error(dps):
+    """
+    Maximum absolute error in position relative to quadrature.
+    """
+    error = 0
+    for branch, (lo, hi) in dps.motive_blend.items():
+        for motive in lo * motives:
+            error = max(error, abs(dps.position(motive, branch) - dps.quadrature_position(motive, branch)))
+    return error
+
+
+if __name__ == "__main__":
+    print "%-10s %8s %10s %10s %10s" % ("preset", "points", "time [ms]", "mem [kB]", "error")
+    for accuracy in [None] + sorted(DimensionlessLangmuirPoissonSoln.accuracy_presets):
+        dps = DimensionlessLangmuirPoissonSoln(accuracy=accuracy)
+        stmt = "DimensionlessLangmuirPoissonSoln(accuracy=%r)" % accuracy
+        best = min(timeit.repeat(stmt, setup=setup, number=3, repeat=3)) / 3
+        points = len(dps["rhs"]["motive_v_position"].get_coeffs())
+        print "%-10s %8d %10.1f %10.1f %10.2e" % (accuracy, points, 1e3 * best, memory(dps) / 1e3, position_error(dps))
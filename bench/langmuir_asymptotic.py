@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Accuracy and speed of `DimensionlessLangmuirPoissonSoln` by region
+
+For each branch, the motive axis is divided into the region served by interpolation, the region where interpolation is blended into the asymptotic solution, and the region served by the asymptotic solution alone. In each region, `position` and `motive` are compared against `DimensionlessLangmuirPoissonSoln.quadrature_position` and the latency of a scalar call is measured.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_asymptotic.py
+"""
+import timeit
+import numpy as np
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+
+regions = {"lhs": [("interpolated", 0.1, 8.), ("blended", 8., 10.), ("asymptotic", 10., 30.)],
+           "rhs": [("interpolated", 0.1, 100.), ("blended", 100., 200.), ("asymptotic", 200., 1e5)], }
+
+if __name__ == "__main__":
+    for interpolation in ["spline", "hermite"]:
+        dps = DimensionlessLangmuirPoissonSoln.shared(interpolation)
+        print "interpolation: %s" % interpolation
+        print "    %-4s %-13s %-20s %14s %14s %14s %14s" % ("", "region", "motive range", "position err", "motive err", "position (us)", "motive (us)")
+
+        for branch in ["lhs", "rhs"]:
+            for region, lo, hi in regions[branch]:
+                motives = np.linspace(lo, hi, 41)
+                positions = np.array([dps.quadrature_position(motive, branch) for motive in motives])
+
+                position_error = np.max(np.abs(dps.position(motives, branch) - positions))
+                motive_error = np.max(np.abs(dps.motive(positions) / motives - 1))
+
+                number = 20000
+                motive = 0.5 * (lo + hi)
+                position = dps.quadrature_position(motive, branch)
+                position_time = min(timeit.repeat(lambda: dps.position(motive, branch), number=number, repeat=3))
+                motive_time = min(timeit.repeat(lambda: dps.motive(position), number=number, repeat=3))
+
+                print "    %-4s %-13s %-20s %14.2e %14.2e %14.2f %14.2f" % (branch, region, "[%g, %g]" % (lo, hi), position_error, motive_error, 1e6 * position_time / number, 1e6 * motive_time / number)
+
+    print "Position errors are absolute; motive errors are relative."
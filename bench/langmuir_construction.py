@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark construction of `tec.models.Langmuir` objects
+
+Compares constructing `Langmuir` objects which share the process-wide `DimensionlessLangmuirPoissonSoln` (the default) against objects which compute a private copy (`shared_dps=False`).
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_construction.py
+"""
+import timeit
+
+setup = """
+from tec.electrode import Metal
+from tec.models import Langmuir
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+em = Metal(temp=1000., barrier=2., richardson=10.)
+co = Metal(temp=300., barrier=1., richardson=10., position=10.)
+DimensionlessLangmuirPoissonSoln.shared()
+"""
+
+cases = [("private solution (shared_dps=False)", "Langmuir(em, co, shared_dps=False)", 20),
+         ("shared solution (default)", "Langmuir(em, co)", 100000), ]
+
+if __name__ == "__main__":
+    for label, stmt, number in cases:
+        best = min(timeit.repeat(stmt, setup=setup, number=number, repeat=3))
+        print "%-40s %12.3f us per object" % (label, 1e6 * best / number)
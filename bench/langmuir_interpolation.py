@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark interpolation backends of `DimensionlessLangmuirPoissonSoln`
+
+Reports the maximum difference between "hermite" and "spline" interpolation and the latency of `position` and `motive` for scalar and array arguments with each backend.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_interpolation.py
+"""
+import timeit
+import numpy as np
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+
+setup = """
+import numpy as np
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln
+dps = DimensionlessLangmuirPoissonSoln.shared("%s")
+positions = np.linspace(-2.5, 100, 10000)
+motives = np.linspace(0, 18, 10000)
+"""
+
+cases = [("motive, scalar", "dps.motive(3.)", 100000),
+         ("position, scalar", "dps.position(3.)", 100000),
+         ("motive, array of 10^4", "dps.motive(positions)", 100),
+         ("position, array of 10^4", "dps.position(motives)", 100), ]
+
+if __name__ == "__main__":
+    spline = DimensionlessLangmuirPoissonSoln.shared("spline")
+    hermite = DimensionlessLangmuirPoissonSoln.shared("hermite")
+
+    print "Maximum absolute difference, hermite vs. spline"
+    for branch, differences in sorted(hermite.max_difference(spline).items()):
+        for name, difference in sorted(differences.items()):
+            print "    %s %-20s %.3e" % (branch, name, difference)
+
+    print "Latency"
+    for label, stmt, number in cases:
+        for interpolation in ["spline", "hermite"]:
+            best = min(timeit.repeat(stmt, setup=setup % interpolation, number=number, repeat=3))
+            print "    %-25s %-8s %12.3f us per call" % (label, interpolation, 1e6 * best / number)
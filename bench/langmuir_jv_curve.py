@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark J-V curves of `tec.models.Langmuir`
+
+Compares `Langmuir.jv_curve` against constructing one `Langmuir` object per voltage and calling `output_current_density`, which solves for the operating point with a root finder at every voltage, and reports the maximum relative difference in current density between the two in the space charge limited regime.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_jv_curve.py
+"""
+import timeit
+import numpy as np
+from tec.electrode import Metal
+from tec.models import Langmuir
+
+em = Metal(temp=1000., barrier=2., richardson=10.)
+co_params = {"temp": 300., "barrier": 1., "richardson": 10., "position": 10.}
+
+
+def voltage_driven(voltages):
+    """
+    Current densities from one `Langmuir` object per voltage.
+    """
+    return np.array([Langmuir(em, Metal(voltage=voltage, **co_params)).output_current_density().value for voltage in voltages])
+
+
+if __name__ == "__main__":
+    t = Langmuir(em, Metal(**co_params))
+    voltage, current_density = t.jv_curve()
+
+    # Voltages in the space charge limited regime. The voltage-driven
+    # root finder can fail right at the critical point, so the
+    # comparison stops short of it.
+    voltages = np.linspace(t.saturation_point_voltage().value, t.critical_point_voltage().value, 51)[:-1]
+    difference = np.max(np.abs(np.interp(voltages, voltage.value, current_density.value) / voltage_driven(voltages) - 1))
+
+    jv_time = min(timeit.repeat(lambda: Langmuir(em, Metal(**co_params)).jv_curve(), number=10, repeat=3)) / 10
+    driven_time = min(timeit.repeat(lambda: voltage_driven(voltages), number=1, repeat=3))
+
+    print "jv_curve, %d points          %10.3f ms" % (len(voltage), 1e3 * jv_time)
+    print "voltage-driven, %d points     %10.3f ms" % (len(voltages), 1e3 * driven_time)
+    print "maximum relative difference   %10.2e" % difference
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the cached operating point of `tec.models.Langmuir`
+
+For a `Langmuir` object in each operating regime, reports the number of root solves (`Langmuir.root_solves`) and the time of the first call to `efficiency()` and of a repeated call, which is served from the cache.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_operating_point.py
+"""
+import timeit
+from tec.electrode import Metal
+from tec.models import Langmuir
+
+em = Metal(temp=1000., barrier=2., richardson=10., emissivity=0.5)
+co_params = {"temp": 300., "barrier": 1., "richardson": 10., "position": 10., "emissivity": 0.5}
+
+
+def langmuir(voltage):
+    return Langmuir(em, Metal(voltage=voltage, **co_params))
+
+
+if __name__ == "__main__":
+    t = langmuir(0)
+    saturation_point_voltage = t.saturation_point_voltage().value
+    critical_point_voltage = t.critical_point_voltage().value
+
+    voltages = [("accelerating", saturation_point_voltage - 0.5),
+                ("space charge limited", (saturation_point_voltage + critical_point_voltage) / 2),
+                ("retarding", critical_point_voltage + 0.5), ]
+
+    print "%-22s %12s %14s %14s" % ("regime", "root solves", "first [ms]", "repeated [ms]")
+    for regime, voltage in voltages:
+        t = langmuir(voltage)
+        t.efficiency()
+        root_solves = t.root_solves
+
+        first = min(timeit.repeat("langmuir(voltage).efficiency()", setup="from __main__ import langmuir; voltage = %r" % voltage, number=10, repeat=3)) / 10
+        repeated = min(timeit.repeat(t.efficiency, number=100, repeat=3)) / 100
+        print "%-22s %12d %14.3f %14.3f" % (regime, root_solves, 1e3 * first, 1e3 * repeated)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark batched operating points of `tec.models.Langmuir`
+
+Compares `Langmuir.operating_points` on a grid of devices, spanning the accelerating, space charge limited and retarding regimes, with one `Langmuir` object per device, and reports the maximum differences between the two.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_operating_points.py
+"""
+import time
+import numpy as np
+from tec.electrode import Metal
+from tec.models import Langmuir
+
+num_devices = 100
+num_scalar = 100
+
+if __name__ == "__main__":
+    rng = np.random.RandomState(0)
+    emitter = {"temp": rng.uniform(800, 2000, num_devices), "barrier": rng.uniform(1., 2.5, num_devices), "richardson": 10.}
+    collector = {"temp": 300., "barrier": rng.uniform(0.5, 1.2, num_devices), "richardson": 10., "position": rng.uniform(1, 50, num_devices)}
+
+    # Spread the output voltages over the three regimes.
+    points = Langmuir.operating_points(emitter, collector)
+    saturation_point_voltage = points["saturation_point_voltage"].value
+    critical_point_voltage = points["critical_point_voltage"].value
+    collector["voltage"] = saturation_point_voltage + rng.uniform(-0.2, 1.2, num_devices) * (critical_point_voltage - saturation_point_voltage)
+
+    start = time.time()
+    points = Langmuir.operating_points(emitter, collector)
+    batch_time = time.time() - start
+
+    start = time.time()
+    current_density = []
+    max_motive = []
+    for indx in range(num_scalar):
+        em = Metal(temp=emitter["temp"][indx], barrier=emitter["barrier"][indx], richardson=10.)
+        co = Metal(temp=300., barrier=collector["barrier"][indx], richardson=10., position=collector["position"][indx], voltage=collector["voltage"][indx])
+        t = Langmuir(em, co)
+        current_density.append(t.output_current_density().value)
+        max_motive.append(t.max_motive().value)
+    scalar_time = time.time() - start
+
+    print "regimes: %s" % ", ".join("%d %s" % (np.sum(points["operating_regime"] == regime), regime) for regime in ["accelerating", "space charge limited", "retarding"])
+    print "operating_points, %d devices       %10.3f ms" % (num_devices, 1e3 * batch_time)
+    print "Langmuir objects, %d devices       %10.3f ms" % (num_scalar, 1e3 * scalar_time)
+    print "max. relative difference, output_current_density  %.2e" % np.max(np.abs(points["output_current_density"].value[:num_scalar] / current_density - 1))
+    print "max. absolute difference, max_motive [eV]         %.2e" % np.max(np.abs(points["max_motive"].value[:num_scalar] - max_motive))
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the root-finder target functions of `tec.models.Langmuir`
+
+Reports the cost of one evaluation of `critical_point_target_function` and `output_voltage_target_function`, which take and return unit-carrying values, and of the plain-float kernels beneath them which the root finders call.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/langmuir_target_functions.py
+"""
+import timeit
+
+setup = """
+from tec.electrode import Metal
+from tec.models import Langmuir
+em = Metal(temp=1000., barrier=2., richardson=10.)
+co = Metal(temp=300., barrier=1., richardson=10., position=10.)
+t = Langmuir(em, co)
+co.voltage = (t.saturation_point_voltage() + t.critical_point_voltage()) / 2
+current_density = 0.5 * (t.saturation_point_current_density() + t.critical_point_current_density()).value
+t.max_motive()
+params = t._target_params()
+"""
+
+cases = [("critical_point_target_function", "t.critical_point_target_function(current_density)"),
+         ("  kernel", "t._critical_point_target(current_density, params)"),
+         ("output_voltage_target_function", "t.output_voltage_target_function(current_density)"),
+         ("  kernel", "t._output_voltage_target(current_density, params)"), ]
+
+if __name__ == "__main__":
+    for label, stmt in cases:
+        number = 10000
+        best = min(timeit.repeat(stmt, setup=setup, number=number, repeat=3))
+        print "%-32s %10.2f us per evaluation" % (label, 1e6 * best / number)
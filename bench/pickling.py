@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark pickling of electrode and TEC objects
+
+Reports the size of the pickle (protocol 2) and the time of a `pickle.dumps`/`pickle.loads` round trip for a `Metal`, an `SC`, a `TECBase` and a `Langmuir` object whose operating point has been computed.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/pickling.py
+"""
+import timeit
+
+setup = """
+import cPickle as pickle
+from tec import TECBase
+from tec.electrode import Metal, SC
+from tec.models import Langmuir
+em = Metal(temp=1000., barrier=2., richardson=10., emissivity=0.5)
+co = Metal(temp=300., barrier=1., richardson=10., position=10., emissivity=0.5)
+objects = {"Metal": em,
+           "SC": SC(temp=300., barrier=1., richardson=100., bandgap=1.11, acceptor_concentration=1e18, acceptor_ionization_energy=45.),
+           "TECBase": TECBase(em, co),
+           "Langmuir": Langmuir(em, co), }
+objects["Langmuir"].efficiency()
+"""
+
+if __name__ == "__main__":
+    namespace = {}
+    exec setup in namespace
+    print "%-10s %12s %16s" % ("class", "size [B]", "round trip [us]")
+    for name in ["Metal", "SC", "TECBase", "Langmuir"]:
+        size = len(namespace["pickle"].dumps(namespace["objects"][name], 2))
+        stmt = "pickle.loads(pickle.dumps(objects[%r], 2))" % name
+        number = 20 if name == "Langmuir" else 200
+        best = min(timeit.repeat(stmt, setup=setup, number=number, repeat=3)) / number
+        print "%-10s %12d %16.1f" % (name, size, 1e6 * best)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark `SC.fermi_energy` over a grid of temperature, acceptor concentration and bandgap
+
+Reports the time to map the Fermi energy over a 20 x 20 x 20 grid with one scalar `SC` per point, and with a single `SC` whose attributes are arrays broadcasting to the grid, together with the largest difference between the two.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/sc_fermi_energy.py
+"""
+import time
+import itertools
+import numpy as np
+from tec.electrode import SC
+
+params = {"barrier": 1.0,
+          "richardson": 100.0,
+          "electron_effective_mass": 9.84e-31,
+          "hole_effective_mass": 7.38e-31,
+          "acceptor_ionization_energy": 45., }
+
+temp = np.linspace(100., 1500., 20)
+acceptor_concentration = np.logspace(12, 20, 20)
+bandgap = np.linspace(0.3, 3., 20)
+
+if __name__ == "__main__":
+    start = time.time()
+    scalar = np.empty((temp.size, acceptor_concentration.size, bandgap.size))
+    for indx, jndx, kndx in itertools.product(range(temp.size), range(acceptor_concentration.size), range(bandgap.size)):
+        el = SC(temp=temp[indx], acceptor_concentration=acceptor_concentration[jndx], bandgap=bandgap[kndx], **params)
+        scalar[indx, jndx, kndx] = el.fermi_energy().value
+    scalar_time = time.time() - start
+
+    start = time.time()
+    el = SC(temp=temp[:, np.newaxis, np.newaxis], acceptor_concentration=acceptor_concentration[:, np.newaxis], bandgap=bandgap, **params)
+    vectorized = el.fermi_energy().value
+    vectorized_time = time.time() - start
+
+    print "%d points" % scalar.size
+    print "%-12s %10.3f s" % ("scalar", scalar_time)
+    print "%-12s %10.3f s" % ("vectorized", vectorized_time)
+    print "max |difference| %.2e eV" % np.max(np.abs(vectorized - scalar))
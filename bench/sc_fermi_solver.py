@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the solvers of `SC.fermi_energy` selected by `SC.fermi_solver`
+
+For each solver, reports the mean and largest number of evaluations of the target function and the time per Fermi energy, both for scalar `SC` objects and for one `SC` with array attributes, over a grid of temperature and acceptor concentration for Si. The largest difference between the solvers is reported last.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/sc_fermi_solver.py
+"""
+import timeit
+import numpy as np
+from tec.electrode import SC
+
+setup = """
+from tec.electrode import SC
+from __main__ import params, temp, acceptor_concentration
+el = SC(temp=temp[%(indx)s], acceptor_concentration=acceptor_concentration[%(indx)s], **params)
+el.fermi_solver = %(solver)r
+"""
+
+params = {"barrier": 1.0,
+          "richardson": 100.0,
+          "bandgap": 1.11,
+          "electron_effective_mass": 9.84e-31,
+          "hole_effective_mass": 7.38e-31,
+          "acceptor_ionization_energy": 45., }
+
+temp, acceptor_concentration = np.meshgrid(np.linspace(100., 1500., 15), np.logspace(12, 20, 17))
+temp = temp.ravel()
+acceptor_concentration = acceptor_concentration.ravel()
+
+if __name__ == "__main__":
+    print "%-8s %10s %10s %14s %14s" % ("solver", "mean evals", "max evals", "scalar [us]", "array [us]")
+    fermi_energy = {}
+    for solver in ["brentq", "newton"]:
+        el = SC(temp=temp, acceptor_concentration=acceptor_concentration, **params)
+        el.fermi_solver = solver
+        stats = el.carrier_statistics()
+        fermi_energy[solver] = stats["fermi_energy"].value
+        evaluations = stats["fermi_energy_evaluations"]
+
+        # The memo is discarded so that every call solves afresh.
+        stmt = "el._invalidate_memo(); el.fermi_energy()"
+        scalar = np.mean([min(timeit.repeat(stmt, setup=setup % {"indx": indx, "solver": solver}, number=20, repeat=3)) / 20 for indx in range(0, temp.size, 16)])
+        array = min(timeit.repeat(stmt, setup=setup % {"indx": ":", "solver": solver}, number=5, repeat=3)) / 5 / temp.size
+
+        print "%-8s %10.1f %10d %14.1f %14.2f" % (solver, evaluations.mean(), evaluations.max(), 1e6 * scalar, 1e6 * array)
+
+    print "max |difference| %.2e eV" % np.max(np.abs(fermi_energy["brentq"] - fermi_energy["newton"]))
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark `SC.carrier_statistics_sweep` against solving each point of a sweep afresh
+
+For sweeps of temperature and acceptor concentration of Si with increasing numbers of points, reports the mean number of evaluations of the target function per point and the time per point of the continuation, of an array-valued `SC` with `fermi_solver` set to `"newton"` and with the default `"brentq"`.
+
+Run from the root of the repository with `tec` importable:
+
+    $ PYTHONPATH=. python bench/sc_fermi_sweep.py
+"""
+import timeit
+import numpy as np
+from tec.electrode import SC
+
+setup = """
+import numpy as np
+from tec.electrode import SC
+from __main__ import el, sweeps
+name, values = sweeps[%(sweep)r](%(num_points)d)
+swept = el.replace(**{name: values})
+swept.fermi_solver = %(solver)r
+"""
+
+el = SC(temp=300., barrier=1., richardson=100., bandgap=1.11, electron_effective_mass=9.84e-31, hole_effective_mass=7.38e-31, acceptor_concentration=1e16, acceptor_ionization_energy=45.)
+
+sweeps = {"temp": lambda num_points: ("temp", np.linspace(300., 1500., num_points)),
+          "acceptor_concentration": lambda num_points: ("acceptor_concentration", np.logspace(12, 20, num_points)), }
+
+if __name__ == "__main__":
+    print "%-24s %8s %18s %18s %18s" % ("sweep", "points", "continuation", "newton", "brentq")
+    for sweep in sorted(sweeps):
+        for num_points in [100, 1000, 100000]:
+            name, values = sweeps[sweep](num_points)
+            columns = []
+
+            evaluations = el.carrier_statistics_sweep(name, values)["fermi_energy_evaluations"]
+            stmt = "el.carrier_statistics_sweep(name, values)"
+            best = min(timeit.repeat(stmt, setup=setup % {"sweep": sweep, "num_points": num_points, "solver": None}, number=3, repeat=3)) / 3
+            columns.append((evaluations.mean(), best))
+
+            for solver in ["newton", "brentq"]:
+                swept = el.replace(**{name: values})
+                swept.fermi_solver = solver
+                evaluations = swept.carrier_statistics()["fermi_energy_evaluations"]
+                # The memo is discarded so that every call solves afresh.
+                stmt = "swept._invalidate_memo(); swept.carrier_statistics()"
+                best = min(timeit.repeat(stmt, setup=setup % {"sweep": sweep, "num_points": num_points, "solver": solver}, number=3, repeat=3)) / 3
+                columns.append((evaluations.mean(), best))
+
+            print "%-24s %8d" % (sweep, num_points) + "".join(" %5.1f / %6.2f us" % (mean, 1e6 * best / num_points) for mean, best in columns)
@@ -9,6 +9,7 @@ setup(name="tec",
     packages=["tec",
         "tec/electrode", 
         "tec/models"],
+    package_data={"tec/models": ["*.npy"]},
     url="https://github.com/jrsmith3/tec",
     license="MIT",
     description="Utils for simulating vacuum thermionic energy conversion devices",
@@ -20,7 +21,7 @@ setup(name="tec",
                  "Topic :: Scientific/Engineering :: Physics",
                  "Natural Language :: English", ],
     install_requires=["numpy",
-        "scipy>0.15",
+        "scipy>=1.0",
         "astropy",
         "physicalproperty",
         "ibei"], )
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Numerical helpers shared by `tec.electrode` and `tec.models`
+"""
+
+import numpy as np
+
+
+def read_only(value):
+    """
+    Make `value`, or the arrays among its values if it's a dictionary, read-only, and return it.
+    """
+    if isinstance(value, dict):
+        for item in value.values():
+            read_only(item)
+    elif isinstance(value, np.ndarray):
+        value.flags.writeable = False
+
+    return value
+
+
+def chandrupatla(f, a, b, xtol=1e-12, rtol=4 * np.finfo(float).eps, maxiter=100):
+    """
+    Roots of many scalar functions by Chandrupatla's bracketed method.
+
+    :param f: Function of `(x, indx)` returning, for each element of the integer array `indx`, the value of the function with that index at the corresponding element of `x`.
+    :param a: Array of lower ends of the brackets.
+    :param b: Array of upper ends of the brackets.
+    :param float xtol: Absolute tolerance on the roots.
+    :param float rtol: Relative tolerance on the roots.
+    :param int maxiter: Maximum number of iterations.
+    :returns: 2-tuple of numpy arrays: the roots and a mask which is `True` where the root converged.
+
+    Each iteration takes an inverse quadratic interpolation step where it is safe and a bisection step elsewhere, so convergence is never slower than bisection. The functions are evaluated only at the elements which have not yet converged. Elements whose brackets do not change sign, or at which a function evaluates to NaN, return NaN and are not converged.
+    """
+    a = np.array(a, dtype=float).ravel()
+    b = np.array(b, dtype=float).ravel()
+    indx = np.arange(a.size)
+    fa = f(a, indx)
+    fb = f(b, indx)
+
+    root = np.where(np.abs(fa) < np.abs(fb), a, b)
+    root[np.isnan(fa) | np.isnan(fb)] = np.NaN
+    converged = (fa == 0) | (fb == 0)
+    root[fa == 0] = a[fa == 0]
+
+    with np.errstate(invalid="ignore"):
+        bracketed = np.sign(fa) * np.sign(fb) < 0
+    root[~(bracketed | converged)] = np.NaN
+
+    c = np.empty_like(a)
+    fc = np.empty_like(a)
+    t = np.empty_like(a)
+    t.fill(0.5)
+
+    active = np.flatnonzero(bracketed)
+    for iteration in range(maxiter):
+        if not active.size:
+            break
+
+        # Shrink the bracket [a, b] to [xt, a] or [xt, b]; c is the end
+        # dropped from the bracket.
+        i = active
+        xt = a[i] + t[i] * (b[i] - a[i])
+        ft = f(xt, i)
+
+        samesign = np.sign(ft) == np.sign(fa[i])
+        c[i] = np.where(samesign, a[i], b[i])
+        fc[i] = np.where(samesign, fa[i], fb[i])
+        b[i] = np.where(samesign, b[i], a[i])
+        fb[i] = np.where(samesign, fb[i], fa[i])
+        a[i] = xt
+        fa[i] = ft
+
+        closest = np.abs(fa[i]) < np.abs(fb[i])
+        root[i] = np.where(closest, a[i], b[i])
+        fm = np.where(closest, fa[i], fb[i])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tol = 2 * rtol * np.abs(root[i]) + xtol
+            tlim = tol / np.abs(b[i] - c[i])
+            done = (fm == 0) | (tlim > 0.5)
+
+            xi = (a[i] - b[i]) / (c[i] - b[i])
+            phi = (fa[i] - fb[i]) / (fc[i] - fb[i])
+            iqi = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t_iqi = fa[i] / (fb[i] - fa[i]) * fc[i] / (fb[i] - fc[i]) + (c[i] - a[i]) / (b[i] - a[i]) * fa[i] / (fc[i] - fa[i]) * fb[i] / (fc[i] - fb[i])
+        t[i] = np.clip(np.where(iqi, t_iqi, 0.5), tlim, 1 - tlim)
+
+        failed = np.isnan(ft)
+        root[i[failed]] = np.NaN
+        converged[i[done & ~failed]] = True
+        active = i[~(done | failed)]
+
+    return root, converged
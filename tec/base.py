@@ -67,6 +67,12 @@ class TECBase(object):
         self.emitter = emitter
         self.collector = collector
 
+    def __reduce__(self):
+        """
+        Pickle the electrodes only
+        """
+        return (type(self), (self.emitter, self.collector))
+
     def __iter__(self):
         """
         Returns iterator from iterelectrodesdicts method
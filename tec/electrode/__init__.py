@@ -10,3 +10,7 @@ Base Library (:mod:`electrode`)
 
 from metal import *
 from semiconductor import *
+from blackbody import *
+from batch import *
+from slotted import *
+from fermi import *
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+Unit-free kernels beneath the methods of `Metal` and `SC`
+
+Each function operates on plain floats or numpy arrays expressed in the default units of the corresponding `PhysicalProperty` attributes (:math:`K`, :math:`eV`, :math:`V`, :math:`A cm^{-2} K^{-2}`, :math:`kg`, :math:`cm^{-3}`) and returns a plain float or array in the default unit of the corresponding public method. The physical constants they need are resolved to floats once, at import, so no `astropy.units.Quantity` is created during a call.
+
+The public methods attach units to the results only on return; ``bench/electrode_kernels.py`` compares their latency with the equivalent unit-carrying expressions. For example, with the cache of the electrode discarded before each call, `Metal.thermoelectron_current_density` costs about 16 us instead of 530 us and `SC.fermi_energy` about 130 us instead of 12 ms; a call answered from the cache costs about 0.2 us.
+
+The module also holds :func:`fermi_energy_newton`, the Newton alternative to :func:`fermi_energy`, with its continuation :func:`fermi_energy_continuation`. :func:`fermi_energy` finds its roots with `tec._util.chandrupatla`.
+"""
+
+import math
+import numpy as np
+from astropy import constants
+from tec._util import chandrupatla
+
+# Boltzmann's constant; eV K-1.
+k_B = constants.k_B.to("eV/K").value
+
+# Prefactor of the effective density of states, such that
+# 2 (2 pi m k T / h^2)^(3/2) = dos_prefactor * (m T)^(3/2) in cm-3 with m in kg
+# and T in K.
+dos_prefactor = 2 * (2 * np.pi * constants.k_B.si.value / constants.h.si.value**2)**1.5 * 1e-6
+
+# 2 pi k^(n+1) / (h^3 c^2) for the incomplete Bose-Einstein integral of order
+# n, such that multiplied by T^(n+1) and the reduced integral it gives the
+# photon flux in s-1 cm-2 (n = 2) or the photon energy flux in W cm-2 (n = 3).
+bose_einstein_prefactor = dict((order, 2 * np.pi * constants.k_B.si.value**(order + 1) / (constants.h.si.value**3 * constants.c.si.value**2) * 1e-4) for order in [2, 3])
+
+# Logarithm of the degeneracy factor of the acceptors.
+_log4 = math.log(4)
+
+
+def motive(barrier, voltage):
+    """
+    Motive just outside the electrode in :math:`eV`.
+    """
+    # A potential of 1 V gives an electron 1 eV.
+    return barrier + voltage
+
+
+def thermoelectron_current_density(temp, barrier, richardson):
+    """
+    Richardson current density in :math:`A cm^{-2}`; 0 wherever `temp` is 0.
+    """
+    zero_temp = np.equal(temp, 0)
+    if not np.any(zero_temp):
+        return richardson * temp**2 * np.exp(-barrier / (k_B * temp))
+
+    # Python floats raise rather than warn on division by zero.
+    temp = np.asarray(temp, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        current_density = richardson * temp**2 * np.exp(-barrier / (k_B * temp))
+
+    return np.where(zero_temp, 0., current_density)
+
+
+def thermoelectron_energy_flux(temp, barrier, richardson):
+    """
+    Thermoelectron energy flux in :math:`W cm^{-2}`.
+    """
+    # (eV / e) * A cm-2 = W cm-2.
+    return (barrier + 2 * k_B * temp) * thermoelectron_current_density(temp, barrier, richardson)
+
+
+def effective_dos(effective_mass, temp):
+    """
+    Band effective density of states in :math:`cm^{-3}`.
+    """
+    return dos_prefactor * (effective_mass * temp)**1.5
+
+
+def carrier_concentrations(fermi_energy, temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy):
+    """
+    Electron, hole and ionized acceptor concentrations in :math:`cm^{-3}` at the Fermi energy relative to the valence band maximum.
+
+    All energies are in :math:`eV`.
+
+    :returns: 3-tuple of floats or numpy arrays.
+    """
+    kt = k_B * temp
+    el_carrier_conc = cb_dos * np.exp((fermi_energy - bandgap) / kt)
+    ho_carrier_conc = vb_dos * np.exp(-fermi_energy / kt)
+    ionized_acceptor_conc = acceptor_concentration / (1 + 4 * np.exp((acceptor_ionization_energy - fermi_energy) / kt))
+
+    return el_carrier_conc, ho_carrier_conc, ionized_acceptor_conc
+
+
+def charge_neutrality(fermi_energy, temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy):
+    """
+    Net charge density in :math:`cm^{-3}` as a function of the Fermi energy relative to the valence band maximum.
+
+    All energies are in :math:`eV`.
+    """
+    el_carrier_conc, ho_carrier_conc, ionized_acceptor_conc = carrier_concentrations(fermi_energy, temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy)
+
+    return el_carrier_conc - ho_carrier_conc + ionized_acceptor_conc
+
+
+def log_charge_balance(fermi_energy, temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy):
+    """
+    Logarithm of the ratio of negative to positive charge density, :math:`\ln((n_{0} + N_{A}^{-}) / p_{0})`, and its derivative with respect to the Fermi energy in :math:`eV^{-1}`.
+
+    The arguments are those of :func:`charge_neutrality`. The logarithm increases monotonically with the Fermi energy, with a slope between :math:`1/kT` and :math:`2/kT`, and is 0 where :func:`charge_neutrality` is. It is evaluated from the logarithms of the terms, so it doesn't overflow.
+
+    :returns: 2-tuple of floats or numpy arrays.
+    """
+    kt = k_B * temp
+    log_el_carrier_conc = np.log(cb_dos) + (fermi_energy - bandgap) / kt
+    log_ho_carrier_conc = np.log(vb_dos) - fermi_energy / kt
+    # Logarithm of the ratio of neutral to ionized acceptors.
+    log_neutral_ratio = np.log(4) + (acceptor_ionization_energy - fermi_energy) / kt
+    log_acceptor_ratio = np.logaddexp(0, log_neutral_ratio)
+    log_ionized_acceptor_conc = np.log(acceptor_concentration) - log_acceptor_ratio
+    log_negative_charge = np.logaddexp(log_el_carrier_conc, log_ionized_acceptor_conc)
+
+    # Fractions of the negative charge on electrons and of the acceptors
+    # which are neutral.
+    el_fraction = np.exp(log_el_carrier_conc - log_negative_charge)
+    neutral_fraction = np.exp(log_neutral_ratio - log_acceptor_ratio)
+    derivative = (el_fraction + (1 - el_fraction) * neutral_fraction + 1) / kt
+
+    return log_negative_charge - log_ho_carrier_conc, derivative
+
+
+def bose_einstein_flux(order, energy_lo, temp, table):
+    """
+    Blackbody photon flux (order 2) in :math:`s^{-1} cm^{-2}` or energy flux (order 3) in :math:`W cm^{-2}` above `energy_lo` :math:`eV`.
+
+    `table` is the `BoseEinsteinTable` of the given order; the result is NaN wherever the reduced energy is outside of it.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reduced_energy = np.divide(energy_lo, k_B * np.asarray(temp, dtype=float))
+
+    return bose_einstein_prefactor[order] * np.power(temp, order + 1) * table(reduced_energy)
+
+
+def fermi_energy(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy, xtol=1e-12, maxiter=100):
+    """
+    Fermi energy in :math:`eV` relative to the valence band maximum, elementwise over arrays.
+
+    The arguments are those of :func:`charge_neutrality` following the Fermi energy, broadcast against each other. For each element, the root of :func:`charge_neutrality` in [0, `bandgap`] is found by `tec._util.chandrupatla` to within `xtol`.
+
+    :returns: 3-tuple of numpy arrays of the broadcast shape: the Fermi energies, a mask which is `True` where the root converged and the number of evaluations of :func:`charge_neutrality` for each element. Elements which did not converge, e.g. because charge neutrality can't be satisfied within the bandgap, are NaN.
+    """
+    params = [np.ravel(param) for param in np.broadcast_arrays(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy)]
+    shape = np.broadcast(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy).shape
+    evaluations = np.zeros(params[0].size, dtype=int)
+
+    def target(fermi_energy, indx):
+        evaluations[indx] += 1
+        with np.errstate(over="ignore"):
+            return charge_neutrality(fermi_energy, *[param[indx] for param in params])
+
+    root, converged = chandrupatla(target, np.zeros_like(params[1]), params[1], xtol=xtol, maxiter=maxiter)
+    root[~converged] = np.NaN
+
+    return root.reshape(shape), converged.reshape(shape), evaluations.reshape(shape)
+
+
+def fermi_energy_newton(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy, xtol=1e-12, maxiter=100, guess=None):
+    """
+    Fermi energy in :math:`eV` relative to the valence band maximum by safeguarded Newton iteration, elementwise over arrays.
+
+    The arguments and return values are those of :func:`fermi_energy`, with the evaluations counting those of :func:`log_charge_balance`. Newton's method is applied to :func:`log_charge_balance` with its analytic derivative, starting from the middle of [0, `bandgap`]. The bracket is narrowed by the sign of each evaluation, and a step which would leave it is replaced by bisection, so every element whose bracket changes sign converges. An element converges when its Newton step, or its bracket, is smaller than `xtol`.
+
+    :param guess: Optional estimates of the Fermi energies, broadcast against the other arguments. Since the slope of :func:`log_charge_balance` is between :math:`1/kT` and :math:`2/kT`, a single evaluation at an estimate bounds the root to within :math:`2kT` times the magnitude of the evaluation, on the side given by its sign; the iteration then starts from the estimate within that bracket. The ends of [0, `bandgap`] are only evaluated where the bracket reaches them. Elements whose estimate is NaN or outside of (0, `bandgap`) start from the middle of the full bracket.
+
+    If all of the arguments are scalars and there is no `guess`, the return values are a float, a bool and an int, and the iteration runs on Python floats with `math`, which is several times faster than numpy on scalars.
+    """
+    args = (temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy)
+    if guess is None and all(np.ndim(arg) == 0 for arg in args):
+        return _fermi_energy_newton_scalar(args, xtol, maxiter)
+
+    params = [np.ravel(param).astype(float) for param in np.broadcast_arrays(*args)]
+    shape = np.broadcast(*args).shape
+
+    lo = np.zeros_like(params[1])
+    hi = params[1].copy()
+    x = 0.5 * (lo + hi)
+    evaluations = np.zeros(lo.size, dtype=int)
+    root = np.empty_like(lo)
+    root.fill(np.NaN)
+    converged = np.zeros(lo.size, dtype=bool)
+    # Ends of the brackets at which the sign of the balance is unknown.
+    check_lo = np.ones(lo.size, dtype=bool)
+    check_hi = np.ones(lo.size, dtype=bool)
+
+    if guess is not None:
+        guess = np.ravel(np.broadcast_to(guess, shape)).astype(float)
+        with np.errstate(invalid="ignore"):
+            i = np.flatnonzero((guess > lo) & (guess < hi))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            balance, derivative = log_charge_balance(guess[i], *[param[i] for param in params])
+        evaluations[i] += 1
+
+        width = 2 * np.abs(balance) * k_B * params[0][i]
+        above = balance < 0
+        check_lo[i] = ~above & (guess[i] - width <= lo[i])
+        check_hi[i] = above & (guess[i] + width >= hi[i])
+        lo[i] = np.where(above, guess[i], np.maximum(guess[i] - width, lo[i]))
+        hi[i] = np.where(above, np.minimum(guess[i] + width, hi[i]), guess[i])
+        with np.errstate(invalid="ignore"):
+            x[i] = guess[i] - balance / derivative
+
+        exact = i[balance == 0]
+        root[exact] = guess[exact]
+        converged[exact] = True
+        check_lo[exact] = check_hi[exact] = False
+
+    bracketed = ~converged
+    for end, check, sign in [(lo, check_lo, -1), (hi, check_hi, 1)]:
+        j = np.flatnonzero(check)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            balance, _ = log_charge_balance(end[j], *[param[j] for param in params])
+        evaluations[j] += 1
+        root[j[balance == 0]] = end[j[balance == 0]]
+        converged[j[balance == 0]] = True
+        with np.errstate(invalid="ignore"):
+            bracketed[j] &= np.sign(balance) == sign
+
+    active = np.flatnonzero(bracketed & ~converged)
+    with np.errstate(invalid="ignore"):
+        outside = ~((x[active] > lo[active]) & (x[active] < hi[active]))
+    x[active[outside]] = 0.5 * (lo[active[outside]] + hi[active[outside]])
+    for iteration in range(maxiter):
+        if not active.size:
+            break
+
+        i = active
+        with np.errstate(divide="ignore", invalid="ignore"):
+            balance, derivative = log_charge_balance(x[i], *[param[i] for param in params])
+        evaluations[i] += 1
+
+        below = balance < 0
+        lo[i] = np.where(below, x[i], lo[i])
+        hi[i] = np.where(below, hi[i], x[i])
+
+        with np.errstate(invalid="ignore"):
+            step = balance / derivative
+            newton = x[i] - step
+            # The last step of a converged element may round onto the end of
+            # the bracket, which is x itself.
+            small = np.abs(step) <= xtol
+            # Bisect wherever a larger step leaves the bracket (or is NaN).
+            inside = (newton > lo[i]) & (newton < hi[i])
+            done = small | (hi[i] - lo[i] <= xtol)
+        x[i] = np.where(inside | small, newton, 0.5 * (lo[i] + hi[i]))
+
+        root[i[done]] = x[i[done]]
+        converged[i[done]] = True
+        active = i[~done]
+
+    return root.reshape(shape), converged.reshape(shape), evaluations.reshape(shape)
+
+
+def fermi_energy_continuation(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy, xtol=1e-12, maxiter=100, stride=8):
+    """
+    Fermi energy in :math:`eV` relative to the valence band maximum by continuation along a sweep.
+
+    The arguments and return values are those of :func:`fermi_energy_newton`; the arguments must broadcast to one dimension, along which neighbouring elements are close, e.g. a sorted sweep of one parameter. Every `stride`-th element, and the last, is solved on the full bracket by :func:`fermi_energy_newton`. The solutions are interpolated linearly in between, and the other elements are solved by :func:`fermi_energy_newton` seeded with the interpolation, which bounds each of them to a narrow bracket. Elements next to one which can't be solved are solved on the full bracket.
+    """
+    params = [np.ravel(param) for param in np.broadcast_arrays(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy)]
+    shape = np.broadcast(temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy).shape
+    if len(shape) != 1:
+        raise ValueError("Arguments must broadcast to one dimension.")
+
+    indx = np.arange(shape[0])
+    coarse = np.zeros(shape, dtype=bool)
+    coarse[::stride] = True
+    coarse[-1] = True
+
+    root = np.empty(shape)
+    converged = np.empty(shape, dtype=bool)
+    evaluations = np.empty(shape, dtype=int)
+
+    root[coarse], converged[coarse], evaluations[coarse] = fermi_energy_newton(*[param[coarse] for param in params], xtol=xtol, maxiter=maxiter)
+    guess = np.interp(indx[~coarse], indx[coarse], root[coarse])
+    root[~coarse], converged[~coarse], evaluations[~coarse] = fermi_energy_newton(*[param[~coarse] for param in params], xtol=xtol, maxiter=maxiter, guess=guess)
+
+    return root, converged, evaluations
+
+
+def _log(x):
+    """
+    Natural logarithm of a float; minus infinity at 0.
+    """
+    if x == 0:
+        return -np.inf
+    return math.log(x)
+
+
+def _logaddexp(x1, x2):
+    """
+    `np.logaddexp` of two floats.
+    """
+    hi = max(x1, x2)
+    if hi == -np.inf:
+        return hi
+    return hi + math.log1p(math.exp(min(x1, x2) - hi))
+
+
+def _log_charge_balance_scalar(fermi_energy, temp, bandgap, cb_dos, vb_dos, acceptor_concentration, acceptor_ionization_energy):
+    """
+    :func:`log_charge_balance` of floats, by `math` rather than numpy.
+    """
+    kt = k_B * temp
+    log_el_carrier_conc = _log(cb_dos) + (fermi_energy - bandgap) / kt
+    log_ho_carrier_conc = _log(vb_dos) - fermi_energy / kt
+    log_neutral_ratio = _log4 + (acceptor_ionization_energy - fermi_energy) / kt
+    log_acceptor_ratio = _logaddexp(0, log_neutral_ratio)
+    log_ionized_acceptor_conc = _log(acceptor_concentration) - log_acceptor_ratio
+    log_negative_charge = _logaddexp(log_el_carrier_conc, log_ionized_acceptor_conc)
+
+    el_fraction = math.exp(log_el_carrier_conc - log_negative_charge)
+    neutral_fraction = math.exp(log_neutral_ratio - log_acceptor_ratio)
+    derivative = (el_fraction + (1 - el_fraction) * neutral_fraction + 1) / kt
+
+    return log_negative_charge - log_ho_carrier_conc, derivative
+
+
+def _fermi_energy_newton_scalar(params, xtol, maxiter):
+    """
+    :func:`fermi_energy_newton` for scalar arguments.
+    """
+    lo = 0.
+    hi = float(params[1])
+    balance_lo, _ = _log_charge_balance_scalar(lo, *params)
+    balance_hi, _ = _log_charge_balance_scalar(hi, *params)
+    evaluations = 2
+
+    if balance_lo == 0:
+        return lo, True, evaluations
+    if balance_hi == 0:
+        return hi, True, evaluations
+    if not balance_lo < 0 < balance_hi:
+        return np.NaN, False, evaluations
+
+    x = 0.5 * (lo + hi)
+    for iteration in range(maxiter):
+        balance, derivative = _log_charge_balance_scalar(x, *params)
+        evaluations += 1
+
+        if balance < 0:
+            lo = x
+        else:
+            hi = x
+
+        step = balance / derivative
+        newton = x - step
+        if abs(step) <= xtol:
+            return newton, True, evaluations
+        if hi - lo <= xtol:
+            return x, True, evaluations
+        x = newton if lo < newton < hi else 0.5 * (lo + hi)
+
+    return np.NaN, False, evaluations
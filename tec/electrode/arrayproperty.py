@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+import numpy as np
+from astropy import units
+from physicalproperty import PhysicalProperty
+
+
+class ArrayPhysicalProperty(PhysicalProperty):
+    """
+    `PhysicalProperty` which can hold a numpy array
+
+    :param unit: Default unit of the property.
+    :param lo_bnd: Lower bound on the value of the property.
+    :param up_bnd: Upper bound on the value of the property.
+
+    Values are coerced to `astropy.units.Quantity` in the default unit, as with `PhysicalProperty`, but may be arrays as well as scalars. The bounds are checked with a single comparison over the whole array; if any element is out of bounds, a `ValueError` is raised and the value is not set.
+
+    After a value is set, the owner's `_invalidate_memo` method, if it has one, is called so that it can discard values derived from the old one.
+    """
+
+    def __init__(self, unit=None, lo_bnd=None, up_bnd=None):
+        PhysicalProperty.__init__(self, unit=unit, lo_bnd=lo_bnd, up_bnd=up_bnd)
+        self.unit = unit
+        # Parsing a composite unit string is slow, so it's done once.
+        self._unit = units.Unit(unit) if unit is not None else None
+        self.lo_bnd = lo_bnd
+        self.up_bnd = up_bnd
+        self.data = weakref.WeakKeyDictionary()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self.data[instance]
+
+    def __set__(self, instance, value):
+        self.data[instance] = self.coerce(value)
+
+        invalidate = getattr(instance, "_invalidate_memo", None)
+        if invalidate is not None:
+            invalidate()
+
+    def coerce(self, value):
+        """
+        Value coerced to the default unit and checked against the bounds
+
+        :param value: Number, numpy array, or `astropy.units.Quantity`.
+        :returns: `astropy.units.Quantity` in the default unit.
+        """
+        value = units.Quantity(value, self._unit)
+
+        if self.lo_bnd is not None and np.any(value.value < self.lo_bnd):
+            raise ValueError("value is less than lower bound %s." % self.lo_bnd)
+        if self.up_bnd is not None and np.any(value.value > self.up_bnd):
+            raise ValueError("value is greater than upper bound %s." % self.up_bnd)
+
+        return value
+
+    def out_of_bounds(self, value):
+        """
+        Elementwise check of a value against the bounds
+
+        :param value: Float or numpy array in the default unit.
+        :returns: Boolean numpy array, true where `value` is out of bounds.
+        """
+        out = np.zeros(np.shape(value), dtype=bool)
+        if self.lo_bnd is not None:
+            out |= np.less(value, self.lo_bnd)
+        if self.up_bnd is not None:
+            out |= np.greater(value, self.up_bnd)
+
+        return out
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+import numpy as np
+from astropy import units
+from metal import Metal
+from slotted import _SlottedElectrode
+
+
+class ElectrodeBatch(object):
+    """
+    Struct-of-arrays container of many electrodes of one class
+
+    An `ElectrodeBatch` is instantiated with the electrode class and values to populate its columns. There is one column per `PhysicalProperty` attribute of the electrode class, named after the attribute. Each argument can be a number, a numpy array, or an `astropy.units.Quantity` so long as the units are compatible with those of the attribute; arguments are broadcast against each other to one dimension. Missing arguments take the defaults of the electrode class's `__init__` method, and each argument must satisfy the constraints of the corresponding attribute.
+
+    Arguments which are not attributes of the electrode class are ignored.
+
+    :param electrode_class: `Metal` or a subclass such as `SC`.
+
+    Each column is stored as one contiguous `float64` numpy array in the default unit of its attribute, so an `ElectrodeBatch` costs 8 bytes per attribute per electrode: 48 bytes per electrode for `Metal` and 104 bytes per electrode for `SC` (see `nbytes`). A batch can be indexed with an integer (giving an electrode object), a slice, a boolean mask or an integer array (giving an `ElectrodeBatch`), and batches can be joined with :meth:`concatenate`.
+
+    Columns are read as attributes and returned as `astropy.units.Quantity` arrays. Every physics method of the electrode class has a batched counterpart of the same name: calling it on the batch calls it on an electrode whose attributes are the columns (see :meth:`electrode`), so the method returns an array with one element per electrode.
+
+    Examples
+    ========
+    >>> from tec.electrode import Metal, ElectrodeBatch
+    >>> batch = ElectrodeBatch(Metal, temp=[1000, 1200, 1400], barrier=2., richardson=10.)
+    >>> batch.thermoelectron_current_density().shape
+    (3,)
+    """
+
+    def __init__(self, electrode_class, **kwargs):
+        if Metal not in inspect.getmro(electrode_class):
+            raise TypeError("electrode_class must be an electrode type.")
+
+        self.electrode_class = electrode_class
+        self.units = {}
+        self._columns = {}
+
+        defaults = self._defaults(electrode_class)
+        values = {}
+        for name, prop in self._properties(electrode_class).items():
+            if name in kwargs:
+                value = kwargs[name]
+            elif name in defaults:
+                value = defaults[name]
+            else:
+                raise TypeError("Missing value for '%s'." % name)
+
+            values[name] = prop.coerce(value)
+            self.units[name] = values[name].unit
+
+        shape = np.broadcast(*[np.atleast_1d(value.value) for value in values.values()]).shape
+        if len(shape) != 1:
+            raise ValueError("Columns must broadcast to one dimension.")
+
+        for name, value in values.items():
+            self._columns[name] = np.ascontiguousarray(np.broadcast_to(value.value, shape), dtype=np.float64)
+
+    @staticmethod
+    def _properties(electrode_class):
+        """
+        Dictionary of the `PhysicalProperty` attributes of `electrode_class` by name.
+        """
+        return dict(electrode_class.schema())
+
+    @staticmethod
+    def _defaults(electrode_class):
+        """
+        Dictionary of the default arguments of `electrode_class.__init__` by name.
+        """
+        argspec = inspect.getargspec(electrode_class.__init__)
+        if not argspec.defaults:
+            return {}
+        return dict(zip(argspec.args[-len(argspec.defaults):], argspec.defaults))
+
+    @classmethod
+    def from_records(cls, electrode_class, records):
+        """
+        Construct batch from records of attribute values
+
+        :param electrode_class: `Metal` or a subclass such as `SC`.
+        :param records: Non-empty sequence of dictionaries, or a one-dimensional numpy structured array, whose keys (or field names) are names of attributes of `electrode_class`.
+
+        Values are numbers in the default units of the attributes. Missing attributes take the defaults of `electrode_class.__init__`; other keys are ignored. Each column is converted and checked against the constraints of its attribute once, as an array. A `TypeError` or `ValueError` names the first offending row and column.
+        """
+        if isinstance(records, np.ndarray):
+            if records.ndim != 1 or records.dtype.names is None:
+                raise TypeError("records must be a one-dimensional structured array.")
+            fields = records.dtype.names
+        else:
+            records = list(records)
+        if len(records) == 0:
+            raise ValueError("records cannot be empty.")
+
+        defaults = cls._defaults(electrode_class)
+        columns = {}
+        for name, prop in cls._properties(electrode_class).items():
+            if isinstance(records, np.ndarray):
+                if name in fields:
+                    column = records[name]
+                elif name in defaults:
+                    column = defaults[name]
+                else:
+                    raise TypeError("Records are missing column '%s'." % name)
+            else:
+                column = []
+                for indx, record in enumerate(records):
+                    if name in record:
+                        column.append(record[name])
+                    elif name in defaults:
+                        column.append(defaults[name])
+                    else:
+                        raise TypeError("Row %d is missing column '%s'." % (indx, name))
+
+            try:
+                column = units.Quantity(column, prop.unit).value
+            except (TypeError, ValueError, units.UnitsError):
+                cls._raise_row_error(name, prop, column)
+
+            out_of_bounds = np.flatnonzero(prop.out_of_bounds(column))
+            if len(out_of_bounds) > 0:
+                indx = out_of_bounds[0]
+                if prop.lo_bnd is not None and column[indx] < prop.lo_bnd:
+                    bound = "less than lower bound %s" % prop.lo_bnd
+                else:
+                    bound = "greater than upper bound %s" % prop.up_bnd
+                raise ValueError("Row %d, column '%s': value %r is %s." % (indx, name, column[indx], bound))
+
+            columns[name] = units.Quantity(column, prop.unit, copy=False)
+
+        return cls(electrode_class, **columns)
+
+    @staticmethod
+    def _raise_row_error(name, prop, column):
+        """
+        Raise the error of the first element of `column` which can't be converted to the unit of `prop`.
+        """
+        for indx, value in enumerate(column):
+            try:
+                units.Quantity(value, prop.unit)
+            except (TypeError, ValueError, units.UnitsError) as error:
+                raise type(error)("Row %d, column '%s': %s" % (indx, name, error))
+
+        raise TypeError("Column '%s' cannot be converted to %s." % (name, prop.unit))
+
+    @classmethod
+    def from_electrodes(cls, electrodes):
+        """
+        Construct batch from a sequence of electrodes
+
+        :param electrodes: Non-empty sequence of electrode objects, all of the same class.
+        """
+        electrodes = list(electrodes)
+        if not electrodes:
+            raise ValueError("electrodes cannot be empty.")
+
+        electrode_class = type(electrodes[0])
+        if any(type(electrode) is not electrode_class for electrode in electrodes):
+            raise TypeError("electrodes must all be of the same class.")
+
+        kwargs = {}
+        for name in cls._properties(electrode_class):
+            unit = getattr(electrodes[0], name).unit
+            kwargs[name] = units.Quantity([getattr(electrode, name).to(unit).value for electrode in electrodes], unit)
+
+        return cls(electrode_class, **kwargs)
+
+    def to_records(self):
+        """
+        Structured array with one `float64` field per column and one element per electrode
+
+        The fields are in the order of the electrode class's `schema`; the result can be passed to :meth:`from_records`.
+        """
+        schema = self.electrode_class.schema()
+        records = np.empty(len(self), dtype=[(name, np.float64) for name, _ in schema])
+        for name, _ in schema:
+            records[name] = self._columns[name]
+
+        return records
+
+    def replace(self, **kwargs):
+        """
+        Copy of the batch with some columns changed
+
+        :param kwargs: New values of columns, as accepted by the constructor.
+        :returns: New `ElectrodeBatch` of the same electrode class.
+
+        As for `Metal.replace`, a `TypeError` is raised for a name which isn't a column.
+        """
+        for name in kwargs:
+            if name not in self._columns:
+                raise TypeError("'%s' is not a column of the batch." % name)
+
+        columns = dict((name, units.Quantity(column, self.units[name])) for name, column in self._columns.items())
+        columns.update(kwargs)
+        return type(self)(self.electrode_class, **columns)
+
+    def to_electrodes(self):
+        """
+        List of electrode objects, one per row of the batch
+        """
+        quantities = [(name, units.Quantity(column, self.units[name], copy=False)) for name, column in self._columns.items()]
+        return [self.electrode_class._from_validated(dict((name, quantity[indx]) for name, quantity in quantities)) for indx in range(len(self))]
+
+    @classmethod
+    def concatenate(cls, batches):
+        """
+        Join batches of the same electrode class end to end
+
+        :param batches: Non-empty sequence of `ElectrodeBatch` objects.
+        """
+        batches = list(batches)
+        if not batches:
+            raise ValueError("batches cannot be empty.")
+
+        electrode_class = batches[0].electrode_class
+        if any(batch.electrode_class is not electrode_class for batch in batches):
+            raise TypeError("batches must all have the same electrode class.")
+
+        kwargs = {}
+        for name, unit in batches[0].units.items():
+            kwargs[name] = units.Quantity(np.concatenate([batch._columns[name] for batch in batches]), unit)
+
+        return cls(electrode_class, **kwargs)
+
+    def __len__(self):
+        return len(self._columns.values()[0])
+
+    def __getitem__(self, index):
+        """
+        Electrode object for an integer index, `ElectrodeBatch` otherwise
+        """
+        if isinstance(index, (int, long, np.integer)):
+            # Columns were checked on construction of the batch.
+            values = dict((name, units.Quantity(column[index], self.units[name])) for name, column in self._columns.items())
+            return self.electrode_class._from_validated(values)
+
+        kwargs = dict((name, units.Quantity(column[index], self.units[name])) for name, column in self._columns.items())
+        return type(self)(self.electrode_class, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for names which are not found the usual way.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name in self._columns:
+            return units.Quantity(self._columns[name], self.units[name], copy=False)
+
+        # Only the physics methods are batched: not classmethods such as
+        # `from_dict`, nor the methods specific to the storage of the
+        # electrode class, which the slotted variants leave out too.
+        method = getattr(self.electrode_class, name, None)
+        if inspect.ismethod(method) and method.__self__ is None and name not in _SlottedElectrode._machinery:
+            return getattr(self.electrode(), name)
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def __repr__(self):
+        return "%s(%s, %d electrodes)" % (type(self).__name__, self.electrode_class.__name__, len(self))
+
+    def electrode(self):
+        """
+        Electrode whose attributes are the columns of the batch
+
+        :returns: Object of the batch's electrode class with array-valued attributes.
+
+        The columns were checked on construction of the batch, so the electrode is built with `_from_validated` rather than `__init__`, which would check every column again. Its attributes are read-only views of the columns.
+        """
+        values = {}
+        for name, column in self._columns.items():
+            values[name] = units.Quantity(column, self.units[name], copy=False)
+            values[name].flags.writeable = False
+
+        return self.electrode_class._from_validated(values)
+
+    @property
+    def nbytes(self):
+        """
+        Bytes occupied by the columns
+        """
+        return sum(column.nbytes for column in self._columns.values())
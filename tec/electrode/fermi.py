@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import numpy as np
+from scipy import interpolate
+from astropy import units
+from semiconductor import SC
+import _kernels
+
+
+class FermiTable(object):
+    """
+    Tabulated Fermi energy of a semiconductor over temperature and acceptor concentration
+
+    The table interpolates the Fermi energy relative to the valence band maximum (see `SC.fermi_energy`) of a semiconductor with fixed `bandgap`, effective masses and acceptor ionization energy, over temperature and the logarithm of the acceptor concentration, so that it can be evaluated at many pairs of them at once without solving the charge neutrality condition.
+
+    :param bandgap: Bandgap (:math:`E_{g}`).
+    :param electron_effective_mass: Density-of-states electron effective mass (:math:`m_{n}^{*}`).
+    :param hole_effective_mass: Density-of-states hole effective mass (:math:`m_{p}^{*}`).
+    :param acceptor_ionization_energy: Acceptor ionization energy relative to valence band edge (:math:`E_{A}`).
+    :param temp_range: 2-tuple of the lowest and highest temperatures in the table, in :math:`K`.
+    :param acceptor_concentration_range: 2-tuple of the lowest and highest acceptor concentrations in the table, in :math:`cm^{-3}`.
+    :param float tolerance: Bound on the absolute error of the interpolation in :math:`eV`.
+    :param int num_points: Initial number of knots along each axis.
+    :param int max_points: Largest number of knots along each axis.
+
+    The first four arguments are subject to the same constraints and take the same units as the corresponding attributes of `SC`; their values in the default units of those attributes are stored as `key`.
+
+    The Fermi energy is solved by `_kernels.fermi_energy_newton` on a grid uniform in :math:`\log_{10} T` and :math:`\log_{10} N_{A}`, whose knots are stored as `log_temp` and `log_acceptor_concentration`, and interpolated with a bicubic spline. (The Fermi energy varies fastest where the intrinsic carrier concentration, which changes exponentially with :math:`1/T`, is close to :math:`N_{A}`; for Si, the spline in :math:`\log T` is about 20 times more accurate than in :math:`T` on the same number of knots.) On construction, the interpolation is compared with the solution at four points inside every cell of the grid, and the largest error of each cell is stored in `cell_error`. Since the largest error in a cell can exceed that at the four points, a cell is within `tolerance` if twice its `cell_error` is. As long as any cell isn't, the number of intervals along both axes is doubled, up to `max_points` knots. Cells still not within `tolerance` after that, e.g. because charge neutrality can't be satisfied within the bandgap at some of their points, are not covered by the table: calling it there solves the Fermi energy exactly, as it does outside of the table. The largest `cell_error` of the covered cells is stored as `max_error`. With the defaults, the table for Si (1.11 eV, 45 meV) has 257 x 257 knots, covers every cell with a `max_error` of :math:`5 \times 10^{-8} eV` and takes about 0.4 s to construct; evaluating it takes about 0.4 us per pair, against about 0.9 us for `_kernels.fermi_energy_newton` and 2 us for `SC.fermi_energy` with array attributes (see ``bench/fermi_table.py``).
+
+    Use :meth:`save` and :meth:`load` to keep a table on disk, and :meth:`shared` to construct one table per set of parameters per process.
+
+    >>> table = FermiTable(1.11, 9.84e-31, 7.38e-31, 45.)
+    >>> abs(table(300., 1e16) - SC(300., 1., 100., 1.11, 9.84e-31, 7.38e-31, 1e16, 45.).fermi_energy().value) < table.tolerance
+    True
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    # Fractions of each cell along each axis at which the interpolation is
+    # checked, and the factor by which the largest error at them may
+    # underestimate the largest error in the cell.
+    _check_fractions = [0.25, 0.75]
+    _safety_factor = 2
+
+    def __init__(self, bandgap, electron_effective_mass, hole_effective_mass, acceptor_ionization_energy, temp_range=(200., 2000.), acceptor_concentration_range=(1e10, 1e20), tolerance=1e-6, num_points=17, max_points=257):
+        self.key = tuple(getattr(SC, name).coerce(value).value for name, value in [("bandgap", bandgap),
+                                                                                    ("electron_effective_mass", electron_effective_mass),
+                                                                                    ("hole_effective_mass", hole_effective_mass),
+                                                                                    ("acceptor_ionization_energy", acceptor_ionization_energy)])
+        if not all(np.ndim(value) == 0 for value in self.key):
+            raise TypeError("Parameters of FermiTable must be scalars.")
+        if not 0 < temp_range[0] < temp_range[1]:
+            raise ValueError("temp_range must be increasing and positive.")
+        if not 0 < acceptor_concentration_range[0] < acceptor_concentration_range[1]:
+            raise ValueError("acceptor_concentration_range must be increasing and positive.")
+
+        self.tolerance = tolerance
+
+        while True:
+            self.log_temp = np.linspace(np.log10(temp_range[0]), np.log10(temp_range[1]), num_points)
+            self.log_acceptor_concentration = np.linspace(np.log10(acceptor_concentration_range[0]), np.log10(acceptor_concentration_range[1]), num_points)
+            self.fermi_energy = self._solve(self.log_temp[:, np.newaxis], self.log_acceptor_concentration)
+            self._build()
+            self.cell_error = self._cell_error()
+
+            if self.covered_cells.all() or 2 * num_points - 1 > max_points:
+                break
+            num_points = 2 * num_points - 1
+
+        covered_cells = self.covered_cells
+        self.max_error = np.max(self.cell_error[covered_cells]) if covered_cells.any() else np.NaN
+
+    @classmethod
+    def shared(cls, electrode):
+        """
+        Process-wide table with the default ranges for the parameters of an electrode
+
+        :param electrode: `SC` whose `bandgap`, effective masses and `acceptor_ionization_energy` are scalars.
+
+        The table is constructed on the first call for each `key` and the same object is returned afterwards, to any thread; it must be treated as read-only.
+        """
+        key = tuple(value.value for value in cls._electrode_params(electrode))
+        table = cls._shared.get(key)
+
+        if table is None:
+            with cls._shared_lock:
+                table = cls._shared.get(key)
+                if table is None:
+                    table = cls._shared[key] = cls(*key)
+
+        return table
+
+    @classmethod
+    def from_electrode(cls, electrode, **kwargs):
+        """
+        Table for the parameters of an electrode
+
+        :param electrode: `SC` whose `bandgap`, effective masses and `acceptor_ionization_energy` are scalars.
+        :param kwargs: Other arguments of `__init__`.
+        """
+        return cls(*cls._electrode_params(electrode), **kwargs)
+
+    @staticmethod
+    def _electrode_params(electrode):
+        """
+        Attributes of `electrode` which are the first four arguments of `__init__`.
+        """
+        if not isinstance(electrode, SC):
+            raise TypeError("electrode must be an instance of SC.")
+
+        return (electrode.bandgap, electrode.electron_effective_mass, electrode.hole_effective_mass, electrode.acceptor_ionization_energy)
+
+    def save(self, filename):
+        """
+        Write the table to disk.
+
+        :param str filename: Destination; the file is in `numpy` `.npz` format.
+
+        The knots, the tabulated Fermi energies and the errors are written, so that :meth:`load` restores the table without solving the charge neutrality condition.
+        """
+        np.savez(filename, key=np.array(self.key), tolerance=self.tolerance, log_temp=self.log_temp, log_acceptor_concentration=self.log_acceptor_concentration, fermi_energy=self.fermi_energy, cell_error=self.cell_error, max_error=self.max_error)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Read a table written by :meth:`save`.
+
+        :param str filename: File written by :meth:`save`.
+        """
+        data = np.load(filename)
+
+        table = cls.__new__(cls)
+        table.key = tuple(float(value) for value in data["key"])
+        table.tolerance = float(data["tolerance"])
+        table.max_error = float(data["max_error"])
+        for name in ["log_temp", "log_acceptor_concentration", "fermi_energy", "cell_error"]:
+            setattr(table, name, data[name])
+        table._build()
+
+        return table
+
+    def __call__(self, temp, acceptor_concentration):
+        """
+        Fermi energy relative to the valence band maximum
+
+        :param temp: Temperature in :math:`K`; float or numpy array.
+        :param acceptor_concentration: Acceptor concentration in :math:`cm^{-3}`; float or numpy array.
+        :returns: Numpy array of the broadcast shape of the arguments, in :math:`eV`.
+
+        Pairs which the table covers are interpolated; the others are solved exactly, and are NaN where charge neutrality can't be satisfied within the bandgap.
+        """
+        log_temp, log_acceptor_concentration = self._log_args(temp, acceptor_concentration)
+
+        covered = self._covered(log_temp, log_acceptor_concentration)
+        fermi_energy = np.empty(log_temp.shape)
+        fermi_energy[covered] = self.spline.ev(log_temp[covered], log_acceptor_concentration[covered])
+        if not covered.all():
+            fermi_energy[~covered] = self._solve(log_temp[~covered], log_acceptor_concentration[~covered])
+
+        return fermi_energy
+
+    def covered(self, temp, acceptor_concentration):
+        """
+        Whether the table covers pairs of temperature and acceptor concentration
+
+        :param temp: Temperature in :math:`K`; float or numpy array.
+        :param acceptor_concentration: Acceptor concentration in :math:`cm^{-3}`; float or numpy array.
+        :returns: Boolean numpy array of the broadcast shape of the arguments which is `True` where calling the table interpolates.
+        """
+        return self._covered(*self._log_args(temp, acceptor_concentration))
+
+    @property
+    def covered_cells(self):
+        """
+        Boolean array which is `True` for each cell of the grid within `tolerance`.
+        """
+        return self._safety_factor * self.cell_error <= self.tolerance
+
+    @staticmethod
+    def _log_args(temp, acceptor_concentration):
+        """
+        Logarithms of the arguments of `__call__`, broadcast against each other.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.broadcast_arrays(np.log10(temp, dtype=float), np.log10(acceptor_concentration, dtype=float))
+
+    def _covered(self, log_temp, log_acceptor_concentration):
+        """
+        `covered` of arrays of the logarithms of temperature and acceptor concentration.
+        """
+        with np.errstate(invalid="ignore"):
+            inside = (log_temp >= self.log_temp[0]) & (log_temp <= self.log_temp[-1]) & (log_acceptor_concentration >= self.log_acceptor_concentration[0]) & (log_acceptor_concentration <= self.log_acceptor_concentration[-1])
+
+        covered = np.zeros(log_temp.shape, dtype=bool)
+        i = self._cell(self.log_temp, log_temp[inside])
+        j = self._cell(self.log_acceptor_concentration, log_acceptor_concentration[inside])
+        covered[inside] = self.covered_cells[i, j]
+
+        return covered
+
+    @staticmethod
+    def _cell(knots, values):
+        """
+        Index of the interval of `knots` containing each of `values`.
+        """
+        return np.clip(np.searchsorted(knots, values, side="right") - 1, 0, knots.size - 2)
+
+    def _build(self):
+        """
+        Construct the spline from the tabulated Fermi energies.
+        """
+        # NaN (no solution) is replaced for the spline; the cells around it
+        # are not covered.
+        self.spline = interpolate.RectBivariateSpline(self.log_temp, self.log_acceptor_concentration, np.nan_to_num(self.fermi_energy), kx=3, ky=3, s=0)
+
+    def _cell_error(self):
+        """
+        Largest error of the spline at the check points of each cell; infinite for cells with a corner or check point without a solution.
+        """
+        fractions = np.array(self._check_fractions)
+        log_temp = (self.log_temp[:-1, np.newaxis] + fractions * np.diff(self.log_temp)[:, np.newaxis]).ravel()
+        log_acceptor_concentration = (self.log_acceptor_concentration[:-1, np.newaxis] + fractions * np.diff(self.log_acceptor_concentration)[:, np.newaxis]).ravel()
+
+        exact = self._solve(log_temp[:, np.newaxis], log_acceptor_concentration)
+        error = np.abs(self.spline(log_temp, log_acceptor_concentration) - exact)
+        error[np.isnan(error)] = np.inf
+
+        num_cells = [self.log_temp.size - 1, self.log_acceptor_concentration.size - 1]
+        cell_error = error.reshape(num_cells[0], fractions.size, num_cells[1], fractions.size).max(axis=(1, 3))
+
+        unsolved = np.isnan(self.fermi_energy)
+        corners = unsolved[:-1, :-1] | unsolved[1:, :-1] | unsolved[:-1, 1:] | unsolved[1:, 1:]
+        cell_error[corners] = np.inf
+
+        return cell_error
+
+    def _solve(self, log_temp, log_acceptor_concentration):
+        """
+        Fermi energy in :math:`eV` solved by `_kernels.fermi_energy_newton`, broadcast over the logarithms of temperature and acceptor concentration; NaN where there is no solution.
+        """
+        bandgap, electron_effective_mass, hole_effective_mass, acceptor_ionization_energy = self.key
+        log_temp, log_acceptor_concentration = np.broadcast_arrays(log_temp, log_acceptor_concentration)
+        if not log_temp.size:
+            return np.empty(log_temp.shape)
+
+        temp = 10**log_temp
+
+        fermi_energy, _, _ = _kernels.fermi_energy_newton(temp,
+                                                          bandgap,
+                                                          _kernels.effective_dos(electron_effective_mass, temp),
+                                                          _kernels.effective_dos(hole_effective_mass, temp),
+                                                          10**log_acceptor_concentration,
+                                                          units.Quantity(acceptor_ionization_energy, SC.acceptor_ionization_energy._unit).to_value("eV"))
+        return fermi_energy
@@ -1,11 +1,91 @@
 # -*- coding: utf-8 -*-
 
+import inspect
 import itertools
+import functools
 import numpy as np
-from astropy import units, constants
-from physicalproperty import PhysicalProperty, find_PhysicalProperty
+from astropy import units
+from physicalproperty import PhysicalProperty
 from ibei import uibei
+from arrayproperty import ArrayPhysicalProperty
+from blackbody import BoseEinsteinTable
+import _kernels
 import tec
+from tec._util import read_only
+
+# Units attached to the values returned by `_kernels`. Parsing a composite unit
+# string costs far more than the kernels themselves, so it's done once here.
+_eV = units.Unit("eV")
+_A_cm2 = units.Unit("A/cm2")
+_W_cm2 = units.Unit("W/cm2")
+_cm3 = units.Unit("1/cm3")
+_s_cm2 = units.Unit("1/(s*cm2)")
+_ibei_units = {2: _s_cm2, 3: _W_cm2}
+
+
+def _uibei(order, energy_lo, temp, tabulated):
+    """
+    Blackbody photon flux (order 2) or energy flux (order 3) above `energy_lo`, elementwise over arrays.
+
+    :param int order: Order of the incomplete Bose-Einstein integral.
+    :param energy_lo: Lower limit of integration in :math:`eV`; float or numpy array.
+    :param temp: Temperature in :math:`K`; float or numpy array.
+    :param bool tabulated: Whether to interpolate `BoseEinsteinTable.shared(order)`.
+    :returns: Float or numpy array in :math:`s^{-1} cm^{-2}` (order 2) or :math:`W cm^{-2}` (order 3).
+
+    `energy_lo` and `temp` are broadcast against each other. Elements not covered by the table, or all of them if `tabulated` is false, are computed with `ibei.uibei` with zero chemical potential.
+    """
+    shape = np.broadcast(energy_lo, temp).shape
+    if tabulated:
+        values = np.ravel(_kernels.bose_einstein_flux(order, energy_lo, temp, BoseEinsteinTable.shared(order)))
+    else:
+        values = np.full(int(np.prod(shape)), np.nan)
+
+    fallback = np.flatnonzero(np.isnan(values))
+    if len(fallback) > 0:
+        energy_lo = np.broadcast_to(energy_lo, shape).ravel()
+        temp = np.broadcast_to(temp, shape).ravel()
+        for indx in fallback:
+            value = uibei(order, units.Quantity(energy_lo[indx], _eV), units.Quantity(temp[indx], "K"), 0)
+            values[indx] = value.to(_ibei_units[order]).value
+
+    return values.reshape(shape)
+
+
+def _unpickle(cls, values):
+    """
+    Reconstruct an electrode pickled by `Metal.__reduce__`.
+    """
+    return cls._from_validated(dict((name, units.Quantity(value, prop._unit)) for (name, prop), value in zip(cls.schema(), values)))
+
+
+def _memoize(*depends_on):
+    """
+    Cache the value of an electrode method until an attribute is assigned.
+
+    :param depends_on: Names of the `PhysicalProperty` attributes the value depends on, directly or through other methods. :meth:`Metal.replace` keeps the cached value if none of them is changed.
+
+    The cached value is returned on every call, so it's made read-only to keep in-place operations on it from changing the cache.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self):
+            try:
+                value = self._memo[name]
+            except KeyError:
+                self.memo_misses += 1
+                value = self._memo[name] = read_only(method(self))
+            else:
+                self.memo_hits += 1
+            return value
+
+        wrapper.depends_on = frozenset(depends_on)
+        wrapper.method = method
+        return wrapper
+
+    return decorator
 
 
 class Metal(object):
@@ -16,22 +96,32 @@ class Metal(object):
 
     Arguments in addition to the ones listed will be ignored.
 
+    Each argument can also be a numpy array (or an array-valued `astropy.units.Quantity`), provided that the arguments broadcast against each other; the methods then return arrays of the broadcast shape. In particular, the zero-temperature case of :meth:`thermoelectron_current_density` is handled elementwise.
+
     :param temp: Temperature (:math:`T`).
     :param barrier: Emission barrier (a.k.a. work function). The barrier is the difference between the vacuum energy of the surface and the Fermi energy. (:math:`\phi`)
     :param richardson: Richardson's constant (:math:`A`)
     :param voltage: Bias voltage relative to ground (:math:`V`).
     :param position: Position (:math:`x`).
     :param emissivity: Radiative emissivity (:math:`epsilon`).
+
+    The values returned by the methods are cached on the object; assigning any `PhysicalProperty` attribute discards the cache. Modifying an array-valued attribute in place is not detected. The returned values are read-only: operate on a copy (e.g. `el.motive().copy()`) to change them in place. The attributes `memo_hits` and `memo_misses` count the method calls answered from the cache and those computed.
+
+    The photon methods interpolate the incomplete Bose-Einstein integrals from :class:`BoseEinsteinTable` (relative error below :math:`10^{-9}`) and call `ibei.uibei` only outside of the table. Set the class or instance attribute `tabulated_photon_flux` to `False` to call `ibei.uibei` throughout; values already cached are kept.
     """
 
-    temp = PhysicalProperty(unit="K", lo_bnd=0)
-    barrier = PhysicalProperty(unit="eV", lo_bnd=0)
-    richardson = PhysicalProperty(unit="A/(cm2 K2)", lo_bnd=0)
-    voltage = PhysicalProperty(unit="V")
-    position = PhysicalProperty(unit="um")
-    emissivity = PhysicalProperty(lo_bnd=0, up_bnd=1)
+    temp = ArrayPhysicalProperty(unit="K", lo_bnd=0)
+    barrier = ArrayPhysicalProperty(unit="eV", lo_bnd=0)
+    richardson = ArrayPhysicalProperty(unit="A/(cm2 K2)", lo_bnd=0)
+    voltage = ArrayPhysicalProperty(unit="V")
+    position = ArrayPhysicalProperty(unit="um")
+    emissivity = ArrayPhysicalProperty(lo_bnd=0, up_bnd=1)
+
+    tabulated_photon_flux = True
 
     def __init__(self, temp, barrier, richardson=120, voltage=0, position=0, emissivity=0, **kwargs):
+        self.memo_hits = 0
+        self.memo_misses = 0
         self.temp = temp
         self.barrier = barrier
         self.richardson = richardson
@@ -50,22 +140,145 @@ class Metal(object):
         """
         return cls(**kwargs)
 
+    @classmethod
+    def from_records(cls, records, batch=False):
+        """
+        Construct many objects from records
+
+        :param records: Non-empty sequence of dictionaries, or a one-dimensional numpy structured array, with keys (or field names) identical to the arguments of the `__init__` method. Values are numbers in the default units of the corresponding attributes.
+        :param bool batch: Return an `ElectrodeBatch` instead of a list of objects.
+
+        Unlike calling :meth:`from_dict` once per record, each attribute is converted and checked against its constraints once for all records; see :meth:`ElectrodeBatch.from_records`, which also describes the errors raised. Additional keys will be silently ignored.
+        """
+        from batch import ElectrodeBatch
+
+        electrodes = ElectrodeBatch.from_records(cls, records)
+        if batch:
+            return electrodes
+        return electrodes.to_electrodes()
+
+    @classmethod
+    def _from_validated(cls, values):
+        """
+        Construct object without calling `__init__`
+
+        :param values: Dictionary of every `PhysicalProperty` attribute name and its value, an `astropy.units.Quantity` already in the default unit and within bounds.
+        """
+        self = cls.__new__(cls)
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self._memo = {}
+        for name, value in values.items():
+            getattr(cls, name).data[self] = value
+
+        return self
+
+    @classmethod
+    def schema(cls):
+        """
+        `PhysicalProperty` attributes of the class
+
+        :returns: Tuple of `(name, PhysicalProperty)` pairs. Attributes which are arguments of the `__init__` method come first, in the order of the arguments, followed by any others sorted by name.
+
+        The schema is found by inspecting the class and its bases once per class; later calls return the same tuple.
+        """
+        if "_schema" not in vars(cls):
+            properties = {}
+            for klass in reversed(inspect.getmro(cls)):
+                for name, value in vars(klass).items():
+                    if isinstance(value, PhysicalProperty):
+                        properties[name] = value
+
+            arguments = inspect.getargspec(cls.__init__).args
+            names = [name for name in arguments if name in properties]
+            names += sorted(set(properties) - set(names))
+
+            cls._schema = tuple((name, properties[name]) for name in names)
+
+        return cls._schema
+
+    @classmethod
+    def to_records(cls, electrodes):
+        """
+        Structured array of the attributes of many objects
+
+        :param electrodes: Sequence of objects of this class or of its subclasses, each with scalar attributes.
+        :returns: One-dimensional numpy structured array with one `float64` field per entry of :meth:`schema`, in the default units of the attributes, and one element per object.
+
+        The result can be passed to :meth:`from_records`.
+        """
+        electrodes = list(electrodes)
+        if not all(isinstance(electrode, cls) for electrode in electrodes):
+            raise TypeError("electrodes must be instances of %s." % cls.__name__)
+
+        schema = cls.schema()
+        records = np.empty(len(electrodes), dtype=[(name, np.float64) for name, _ in schema])
+        for name, prop in schema:
+            data = prop.data
+            records[name] = [data[electrode].value for electrode in electrodes]
+
+        return records
+
+    def replace(self, **kwargs):
+        """
+        Copy of the object with some attributes changed
+
+        :param kwargs: New values of `PhysicalProperty` attributes, as accepted by `__init__`.
+        :returns: New object of the same class.
+
+        Only the new values are converted and checked against their constraints; the copy shares the values of the other attributes with this object, which are made read-only for both objects. An in-place operation on such an attribute, e.g. `variant.temp *= 1.5`, raises `ValueError`; assign a new value instead (`variant.temp = variant.temp * 1.5`). Cached method values which don't depend on the changed attributes are carried over, so e.g. a collector whose `voltage` is changed keeps its `thermoelectron_current_density`.
+
+        A `TypeError` is raised for a name which isn't a `PhysicalProperty` attribute.
+        """
+        cls = type(self)
+        schema = dict(cls.schema())
+        for name in kwargs:
+            if name not in schema:
+                raise TypeError("'%s' is not an attribute of %s." % (name, cls.__name__))
+
+        # Shared read-only, so that an in-place operation on an attribute
+        # of either object can't change the other or leave its cache stale.
+        values = dict((name, read_only(prop.data[self])) for name, prop in schema.items() if name not in kwargs)
+        for name, value in kwargs.items():
+            values[name] = schema[name].coerce(value)
+
+        variant = cls._from_validated(values)
+        # Other instance attributes, e.g. `tabulated_photon_flux`.
+        for name, value in vars(self).items():
+            if name not in vars(variant):
+                setattr(variant, name, value)
+
+        changed = frozenset(kwargs)
+        for name, value in self._memo.items():
+            if not getattr(cls, name).depends_on & changed:
+                variant._memo[name] = value
+
+        return variant
+
+    def __reduce__(self):
+        """
+        Pickle the values of the attributes as floats (or arrays) in their default units
+
+        Cached method values aren't pickled and the counters start afresh; other instance attributes such as `tabulated_photon_flux` are.
+        """
+        values = tuple(prop.data[self].value for _, prop in self.schema())
+        # Python floats pickle in 9 bytes; numpy scalars in about 100.
+        values = tuple(float(value) if np.ndim(value) == 0 else value for value in values)
+        state = dict((name, value) for name, value in vars(self).items() if name not in ["_memo", "memo_hits", "memo_misses"])
+
+        return (_unpickle, (type(self), values), state or None)
+
     def __iter__(self):
         """
         Implement iterator functionality
 
-        This iterator functionality returns tuples such that the data contained in the object can be converted into a dictionary. All `PhysicalProperty` attributes appear once and only once during the iteration. The order of these atttibutes are not guaranteed. The values corresponding to an attribute are returned as floats; their unit is defined by the default unit of the corresponding `PhysicalProperty`.
+        This iterator functionality returns tuples such that the data contained in the object can be converted into a dictionary. All `PhysicalProperty` attributes appear once and only once during the iteration, in the order of :meth:`schema`. The values corresponding to an attribute are returned as floats; their unit is defined by the default unit of the corresponding `PhysicalProperty`.
 
-        Additionally, this iteration returns the following attribute:
+        Additionally, this iteration returns the following attribute first:
 
         * `__class__`: The object's class returned by `type(self)`.
         """
-        # Crappy implmentation -- should use iterators/iterables.
-        # Construct a list of tuples to return.
-        physical_prop_names = find_PhysicalProperty(self)
-        physical_prop_vals = [getattr(self, prop).value for prop in physical_prop_names]
-
-        attribs = zip(physical_prop_names, physical_prop_vals)
+        attribs = [(name, prop.data[self].value) for name, prop in self.schema()]
 
         ext_attribs = [("__class__", type(self),)]
 
@@ -74,6 +287,17 @@ class Metal(object):
     def __repr__(self):
         return str(dict(self))
 
+    def _invalidate_memo(self):
+        """
+        Discard the cached values of the methods.
+
+        Called by `ArrayPhysicalProperty` whenever an attribute is assigned.
+        """
+        # Rebinding rather than clearing leaves the cache of a shallow copy
+        # intact.
+        self._memo = {}
+
+    @_memoize("barrier", "voltage")
     def motive(self):
         """
         Motive just outside electrode
@@ -83,9 +307,9 @@ class Metal(object):
         :returns: `astropy.units.Quantity` in units of :math:`eV`.
         :symbol: :math:`\psi_{E}` (for the emitter, for example)
         """
-        motive = self.barrier + constants.e.si * self.voltage
-        return motive.to("eV")
+        return units.Quantity(_kernels.motive(self.barrier.value, self.voltage.value), _eV)
 
+    @_memoize("temp", "barrier", "richardson")
     def thermoelectron_current_density(self):
         """
         Thermoelectron emission current density
@@ -96,20 +320,15 @@ class Metal(object):
 
             J_{RD} = A T^{2} \exp \left( \\frac{\phi}{kT} \\right)
 
-        If either the `temp` or `richardson` attributes are equal to 0, this  method returns a value of 0.
+        If either the `temp` or `richardson` attributes are equal to 0, this  method returns a value of 0 (elementwise, if the attributes are arrays).
 
         :returns: `astropy.units.Quantity` in units of :math:`A cm^{-2}`.
         :symbol: :math:`J_{RD}`
         """
-        if self.temp.value == 0:
-            current_density = units.Quantity(0, "A/cm2")
-        else:
-            exponent = (self.barrier / (constants.k_B * self.temp)).decompose()
-            coefficient = self.richardson * self.temp**2
-            current_density = coefficient * np.exp(-exponent)
-
-        return current_density.to("A/cm2")
+        current_density = _kernels.thermoelectron_current_density(self.temp.value, self.barrier.value, self.richardson.value)
+        return units.Quantity(current_density, _A_cm2)
 
+    @_memoize("temp", "barrier", "richardson")
     def thermoelectron_energy_flux(self):
         """
         Energy flux emitted via thermoelectrons
@@ -122,21 +341,20 @@ class Metal(object):
         :returns: `astropy.units.Quantity` in units of :math:`W cm^{-2}`.
         :symbol: None
         """
-        kt2 = 2 * constants.k_B * self.temp
-        thermal_potential = (self.barrier + kt2) / constants.e.to("C")
-        energy_flux = thermal_potential * self.thermoelectron_current_density()
-
-        return energy_flux.to("W/cm2")
+        energy_flux = _kernels.thermoelectron_energy_flux(self.temp.value, self.barrier.value, self.richardson.value)
+        return units.Quantity(energy_flux, _W_cm2)
 
+    @_memoize("temp", "emissivity")
     def photon_flux(self):
         """
         Number of photons per unit time per unit area
 
         :returns: `astropy.units.Quantity` in units of :math:`s^{-1} cm^{-2}`.
         """
-        photon_flux = self.emissivity * uibei(2, 0, self.temp, 0)
-        return photon_flux.to("1/(s*cm2)")
+        photon_flux = self.emissivity.value * _uibei(2, 0., self.temp.value, self.tabulated_photon_flux)
+        return units.Quantity(photon_flux, _s_cm2)
 
+    @_memoize("temp", "emissivity")
     def photon_energy_flux(self):
         """
         Energy flux emitted by Stefan-Boltzmann radiation
@@ -149,5 +367,5 @@ class Metal(object):
 
         :returns: `astropy.units.Quantity` in units of :math:`W cm^{-2}`.
         """
-        energy_flux = self.emissivity * uibei(3, 0, self.temp, 0)
-        return energy_flux.to("W/cm2")
+        energy_flux = self.emissivity.value * _uibei(3, 0., self.temp.value, self.tabulated_photon_flux)
+        return units.Quantity(energy_flux, _W_cm2)
@@ -3,9 +3,9 @@
 import numpy as np
 from scipy import optimize
 from astropy import units, constants
-from metal import Metal
-from physicalproperty import PhysicalProperty, find_PhysicalProperty
-from ibei import uibei
+from metal import Metal, _uibei, _memoize, _eV, _cm3, _s_cm2, _W_cm2
+from arrayproperty import ArrayPhysicalProperty
+import _kernels
 
 
 class SC(Metal):
@@ -29,17 +29,25 @@ class SC(Metal):
     :param voltage: Bias voltage relative to ground (:math:`V`).
     :param position: Position (:math:`x`).
     :param emissivity: Radiative emissivity (:math:`epsilon`).
+
+    As with `Metal`, the values returned by the methods are cached until an attribute is assigned.
+
+    The class or instance attribute `fermi_solver` selects how the charge neutrality condition is solved for the Fermi energy: `"brentq"` (the default) or `"newton"`; see :meth:`fermi_energy`. As with `tabulated_photon_flux`, values already cached are kept when it is changed.
     """
 
-    electron_effective_mass = PhysicalProperty(unit="kg", lo_bnd=0)
-    hole_effective_mass = PhysicalProperty(unit="kg", lo_bnd=0)
-    acceptor_concentration = PhysicalProperty(unit="1/cm3", lo_bnd=0)
-    acceptor_ionization_energy = PhysicalProperty(unit="meV", lo_bnd=0)
-    donor_concentration = PhysicalProperty(unit="1/cm3", lo_bnd=0)
-    donor_ionization_energy = PhysicalProperty(unit="meV", lo_bnd=0)
-    bandgap = PhysicalProperty(unit="eV", lo_bnd=0)
+    electron_effective_mass = ArrayPhysicalProperty(unit="kg", lo_bnd=0)
+    hole_effective_mass = ArrayPhysicalProperty(unit="kg", lo_bnd=0)
+    acceptor_concentration = ArrayPhysicalProperty(unit="1/cm3", lo_bnd=0)
+    acceptor_ionization_energy = ArrayPhysicalProperty(unit="meV", lo_bnd=0)
+    donor_concentration = ArrayPhysicalProperty(unit="1/cm3", lo_bnd=0)
+    donor_ionization_energy = ArrayPhysicalProperty(unit="meV", lo_bnd=0)
+    bandgap = ArrayPhysicalProperty(unit="eV", lo_bnd=0)
+
+    fermi_solver = "brentq"
 
     def __init__(self, temp, barrier, richardson, bandgap, electron_effective_mass=constants.m_e, hole_effective_mass=constants.m_e, acceptor_concentration=0, acceptor_ionization_energy=0, donor_concentration=0, donor_ionization_energy=0, voltage=0, position=0, emissivity=0, **kwargs):
+        self.memo_hits = 0
+        self.memo_misses = 0
         self.temp = temp
         self.barrier = barrier
         self.richardson = richardson
@@ -54,6 +62,7 @@ class SC(Metal):
         self.position = position
         self.emissivity = emissivity
 
+    @_memoize("temp", "electron_effective_mass")
     def cb_effective_dos(self):
         """
         Conduction band effective density of states
@@ -66,10 +75,11 @@ class SC(Metal):
         :returns: `astropy.units.Quantity` in units of :math:`cm^{-3}`
         :symbol: :math:`N_{C}`
         """
-        dos = 2 * ((2 * np.pi * self.electron_effective_mass * constants.k_B * self.temp) / (constants.h ** 2))**(3. / 2)
+        dos = _kernels.effective_dos(self.electron_effective_mass.value, self.temp.value)
 
-        return dos.to("1/cm3")
+        return units.Quantity(dos, _cm3)
 
+    @_memoize("temp", "hole_effective_mass")
     def vb_effective_dos(self):
         """
         Valence band effective density of states
@@ -82,10 +92,11 @@ class SC(Metal):
         :returns: `astropy.units.Quantity` in units of :math:`cm^{-3}`
         :symbol: :math:`N_{V}`
         """
-        dos = 2 * ((2 * np.pi * self.hole_effective_mass * constants.k_B * self.temp) / (constants.h ** 2))**(3. / 2)
+        dos = _kernels.effective_dos(self.hole_effective_mass.value, self.temp.value)
 
-        return dos.to("1/cm3")
+        return units.Quantity(dos, _cm3)
 
+    @_memoize("temp", "bandgap", "electron_effective_mass", "hole_effective_mass", "acceptor_concentration", "acceptor_ionization_energy")
     def electron_concentration(self):
         """
         Equlibrium conduction band electron concentration
@@ -98,10 +109,9 @@ class SC(Metal):
         :returns: `astropy.units.Quantity` in units of :math:`cm^{-3}`
         :symbol: :math:`n_{0}`
         """
-        exponent = ((self.bandgap - self.fermi_energy()) / (constants.k_B * self.temp)).decompose()
-
-        return self.cb_effective_dos() * np.exp(-exponent)
+        return self.carrier_statistics()["electron_concentration"]
 
+    @_memoize("temp", "bandgap", "electron_effective_mass", "hole_effective_mass", "acceptor_concentration", "acceptor_ionization_energy")
     def hole_concentration(self):
         """
         Equlibrium valence band hole concentration
@@ -114,10 +124,9 @@ class SC(Metal):
         :returns: `astropy.units.Quantity` in units of :math:`cm^{-3}`
         :symbol: :math:`p_{0}`
         """
-        exponent = (self.fermi_energy() / (constants.k_B * self.temp)).decompose()
-
-        return self.vb_effective_dos() * np.exp(-exponent)
+        return self.carrier_statistics()["hole_concentration"]
 
+    @_memoize("temp", "bandgap", "electron_effective_mass", "hole_effective_mass", "acceptor_concentration", "acceptor_ionization_energy")
     def fermi_energy(self):
         """
         Value of Fermi energy relative to valence band maximum
@@ -138,42 +147,118 @@ class SC(Metal):
         .. math::
             E_{F} - E_{V}
 
+        With `fermi_solver` set to `"brentq"`, the condition is solved on the bracket [0, :math:`E_{g}`] by `scipy.optimize.brentq`. If any of the attributes the Fermi energy depends on is an array, it is instead solved for every element of their broadcast shape at once by Chandrupatla's bracketed method (see `_kernels.fermi_energy`), which agrees with the scalar solution to within :math:`10^{-11} eV`.
+
+        With `fermi_solver` set to `"newton"`, Newton's method is applied to the logarithm of the ratio of negative to positive charge density, which increases monotonically with :math:`E_{F}`, using its analytic derivative (see `_kernels.fermi_energy_newton`). Steps which would leave the bracket are replaced by bisection, so the iteration converges wherever the bracket does. Scalars and arrays are solved alike, and agree with the `"brentq"` solution to within :math:`10^{-11} eV`.
+
+        The number of evaluations of the target function is returned by :meth:`carrier_statistics`. Elements at which charge neutrality can't be satisfied within the bandgap are NaN, whereas for scalar attributes a `ValueError` is raised.
+
         :returns: `astropy.units.Quantity` in units of :math:`eV`
         :symbol: :math:`E_{F}`
         """
-        lo = 0
-        hi = self.bandgap.value
+        return self.carrier_statistics()["fermi_energy"]
 
-        fermi_energy = optimize.brentq(self._charge_neutrality_target_fcn, lo, hi)
+    @_memoize("temp", "bandgap", "electron_effective_mass", "hole_effective_mass", "acceptor_concentration", "acceptor_ionization_energy")
+    def carrier_statistics(self):
+        """
+        Equilibrium carrier statistics from a single solution of the charge neutrality condition
 
-        return units.Quantity(fermi_energy, "eV")
+        The charge neutrality condition is solved once for :math:`E_{F}` as described in :meth:`fermi_energy`, and the carrier concentrations are evaluated at it in the same pass. :meth:`fermi_energy`, :meth:`electron_concentration` and :meth:`hole_concentration` return the corresponding values of this method, so any of them, in any order, costs one root solve until an attribute is assigned.
 
-    def _charge_neutrality_target_fcn(self, fermi_energy):
+        :returns: Dictionary of `astropy.units.Quantity` keyed by `"fermi_energy"` (:math:`eV`), `"electron_concentration"`, `"hole_concentration"`, `"cb_effective_dos"`, `"vb_effective_dos"` and `"ionized_acceptor_concentration"` (:math:`N_{A}^{-}`, all in :math:`cm^{-3}`), together with `"fermi_energy_evaluations"`, the number of evaluations of the target function by the solver selected by `fermi_solver` (an int, or an integer array for array attributes). The dictionary is cached along with the values of the other methods and must be treated as read-only.
         """
-        Target function of charge neutrality condition.
+        params = self._charge_neutrality_params()
+        scalar = all(np.ndim(param) == 0 for param in params)
+
+        if self.fermi_solver == "brentq":
+            if scalar:
+                lo = 0
+                hi = self.bandgap.value
+                fermi_energy, result = optimize.brentq(_kernels.charge_neutrality, lo, hi, args=params, full_output=True)
+                evaluations = result.function_calls
+            else:
+                fermi_energy, _, evaluations = _kernels.fermi_energy(*params)
+        elif self.fermi_solver == "newton":
+            fermi_energy, converged, evaluations = _kernels.fermi_energy_newton(*params)
+            if scalar and not converged:
+                raise ValueError("Charge neutrality can't be satisfied within the bandgap.")
+        else:
+            raise ValueError("fermi_solver must be 'brentq' or 'newton', not %r." % (self.fermi_solver, ))
+
+        el_carrier_conc, ho_carrier_conc, ionized_acceptor_conc = _kernels.carrier_concentrations(fermi_energy, *params)
+
+        return {"fermi_energy": units.Quantity(fermi_energy, _eV),
+                "electron_concentration": units.Quantity(el_carrier_conc, _cm3),
+                "hole_concentration": units.Quantity(ho_carrier_conc, _cm3),
+                "cb_effective_dos": self.cb_effective_dos(),
+                "vb_effective_dos": self.vb_effective_dos(),
+                "ionized_acceptor_concentration": units.Quantity(ionized_acceptor_conc, _cm3),
+                "fermi_energy_evaluations": evaluations, }
+
+    def carrier_statistics_sweep(self, name, values):
         """
-        fermi_energy = units.Quantity(fermi_energy, "eV")
+        Carrier statistics along a sweep of one attribute
 
-        exponent_1 = ((self.bandgap - fermi_energy) / (constants.k_B * self.temp)).decompose()
-        exponent_2 = (fermi_energy / (constants.k_B * self.temp)).decompose()
-        exponent_3 = ((self.acceptor_ionization_energy - fermi_energy) / (constants.k_B * self.temp)).decompose()
+        :param str name: Name of an attribute the Fermi energy depends on, e.g. `"temp"` or `"acceptor_concentration"`.
+        :param values: One-dimensional array of values of the attribute, as accepted by `__init__`, ordered so that neighbouring values are close, e.g. sorted.
+        :returns: Dictionary with the keys of :meth:`carrier_statistics`, whose values are arrays with one element per entry of `values`.
 
-        el_carrier_conc = self.cb_effective_dos() * np.exp(-exponent_1)
-        ho_carrier_conc = self.vb_effective_dos() * np.exp(-exponent_2)
+        The attributes other than `name` must be scalars. The Fermi energy is solved by continuation along `values` (see `_kernels.fermi_energy_continuation`): every eighth point is solved on the full bracket, and the points in between are seeded with the interpolated solutions of their neighbours, which bounds each of them to a narrow bracket. All points are solved by Newton's method as for `fermi_solver` set to `"newton"`, whatever its value. Along a fine sweep, a point takes about three evaluations of the target function on average, instead of about six for Newton's method and fourteen for brentq on the full bracket. The results agree with :meth:`fermi_energy` to within :math:`10^{-11} eV`; points at which charge neutrality can't be satisfied within the bandgap are NaN.
 
-        ret_val = el_carrier_conc - ho_carrier_conc + self.acceptor_concentration / (1 + 4 * np.exp(exponent_3))
+        Neither this object nor its cached values are changed.
+        """
+        depends_on = type(self).carrier_statistics.depends_on
+        if name not in depends_on:
+            raise ValueError("The Fermi energy doesn't depend on '%s'." % name)
+        if any(getattr(self, other).ndim for other in depends_on - set([name])):
+            raise ValueError("Attributes other than '%s' must be scalars." % name)
+
+        swept = self.replace(**{name: values})
+        if getattr(swept, name).ndim != 1:
+            raise ValueError("values must be one-dimensional.")
+
+        params = swept._charge_neutrality_params()
+
+        fermi_energy, _, evaluations = _kernels.fermi_energy_continuation(*params)
+        el_carrier_conc, ho_carrier_conc, ionized_acceptor_conc = _kernels.carrier_concentrations(fermi_energy, *params)
+        shape = fermi_energy.shape
+
+        return {"fermi_energy": units.Quantity(fermi_energy, _eV),
+                "electron_concentration": units.Quantity(el_carrier_conc, _cm3),
+                "hole_concentration": units.Quantity(ho_carrier_conc, _cm3),
+                "cb_effective_dos": units.Quantity(np.broadcast_to(params[2], shape), _cm3),
+                "vb_effective_dos": units.Quantity(np.broadcast_to(params[3], shape), _cm3),
+                "ionized_acceptor_concentration": units.Quantity(ionized_acceptor_conc, _cm3),
+                "fermi_energy_evaluations": evaluations, }
+
+    def _charge_neutrality_params(self):
+        """
+        Arguments following the Fermi energy of `_kernels.charge_neutrality`.
+        """
+        return (self.temp.value,
+                self.bandgap.value,
+                self.cb_effective_dos().value,
+                self.vb_effective_dos().value,
+                self.acceptor_concentration.value,
+                self.acceptor_ionization_energy.to_value("eV"), )
 
-        return ret_val.value
+    def _charge_neutrality_target_fcn(self, fermi_energy):
+        """
+        Target function of charge neutrality condition.
+        """
+        return _kernels.charge_neutrality(fermi_energy, *self._charge_neutrality_params())
 
+    @_memoize("temp", "bandgap", "emissivity")
     def photon_flux(self):
         """
         Number of photons per unit time per unit area
 
         :returns: `astropy.units.Quantity` in units of :math:`s^{-1} cm^{-2}`.
         """
-        photon_flux = self.emissivity * uibei(2, self.bandgap, self.temp, 0)
-        return photon_flux.to("1/(s*cm2)")
+        photon_flux = self.emissivity.value * _uibei(2, self.bandgap.value, self.temp.value, self.tabulated_photon_flux)
+        return units.Quantity(photon_flux, _s_cm2)
 
+    @_memoize("temp", "bandgap", "emissivity")
     def photon_energy_flux(self):
         """
         Energy flux emitted by Stefan-Boltzmann radiation
@@ -186,5 +271,5 @@ class SC(Metal):
 
         :returns: `astropy.units.Quantity` in units of :math:`W cm^{-2}`.
         """
-        energy_flux = self.emissivity * uibei(3, self.bandgap, self.temp, 0)
-        return energy_flux.to("W/cm2")
+        energy_flux = self.emissivity.value * _uibei(3, self.bandgap.value, self.temp.value, self.tabulated_photon_flux)
+        return units.Quantity(energy_flux, _W_cm2)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+from astropy import units
+from physicalproperty import PhysicalProperty
+from metal import Metal
+from semiconductor import SC
+
+
+class SlotProperty(object):
+    """
+    Data descriptor storing the value of a `PhysicalProperty` as a float in a slot
+
+    :param prop: `ArrayPhysicalProperty` of the full electrode class whose unit and bounds apply.
+    :param member: Member descriptor of the slot holding the value.
+
+    Values are coerced and checked exactly as by `prop`, and must be scalars. Reading the attribute returns an `astropy.units.Quantity` in the default unit.
+    """
+
+    def __init__(self, prop, member):
+        self.prop = prop
+        self.member = member
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return units.Quantity(self.member.__get__(instance, owner), self.prop._unit)
+
+    def __set__(self, instance, value):
+        value = self.prop.coerce(value)
+        if not value.isscalar:
+            raise TypeError("value must be a scalar.")
+        self.member.__set__(instance, float(value.value))
+
+
+class _SlottedElectrode(object):
+    """
+    Base class of the slotted electrode variants
+
+    Subclasses set `electrode_class` and declare one slot per `PhysicalProperty` attribute of it, named after the attribute with a leading underscore; :func:`_populate` then adds the attributes and methods.
+    """
+
+    __slots__ = ()
+
+    # Names of the full class which are specific to its storage, or which
+    # the slotted classes define themselves.
+    _machinery = frozenset(["from_dict", "from_records", "_from_validated", "to_records", "replace", "carrier_statistics_sweep", "schema", "_schema", "_invalidate_memo"])
+
+    def __init__(self, *args, **kwargs):
+        arguments = inspect.getcallargs(self.electrode_class.__init__, self, *args, **kwargs)
+        for name, _ in self.schema():
+            setattr(self, name, arguments[name])
+
+    @classmethod
+    def from_dict(cls, kwargs):
+        """
+        Construct object from dictionary
+
+        :param kwargs: Dictionary containing keys with names identical to the arguments of the `__init__` method and values which are legal corresponding to the arguments of `__init__`.
+
+        Additional key/value pairs will be silently ignored.
+        """
+        return cls(**kwargs)
+
+    @classmethod
+    def from_electrode(cls, electrode):
+        """
+        Construct object from an object of the full electrode class
+
+        :param electrode: Object of `electrode_class` with scalar attributes.
+        """
+        if not isinstance(electrode, cls.electrode_class):
+            raise TypeError("electrode must be an instance of %s." % cls.electrode_class.__name__)
+
+        self = cls.__new__(cls)
+        for name, prop in cls.schema():
+            # Values are already checked, so the slot is written directly.
+            prop.member.__set__(self, float(getattr(electrode, name).value))
+
+        return self
+
+    def to_electrode(self):
+        """
+        Object of the full electrode class with the same attribute values
+        """
+        values = dict((name, units.Quantity(prop.member.__get__(self), prop.prop._unit)) for name, prop in self.schema())
+        return self.electrode_class._from_validated(values)
+
+    @classmethod
+    def schema(cls):
+        """
+        `SlotProperty` attributes of the class
+
+        :returns: Tuple of `(name, SlotProperty)` pairs in the order of `electrode_class.schema()`.
+        """
+        return tuple((name, getattr(cls, name)) for name, _ in cls.electrode_class.schema())
+
+    def __iter__(self):
+        """
+        Implement iterator functionality
+
+        As for the full electrode class, the iteration returns `("__class__", type(self))` followed by the name and float value of each attribute in the order of :meth:`schema`.
+        """
+        attribs = [("__class__", type(self))]
+        attribs.extend((name, prop.member.__get__(self)) for name, prop in self.schema())
+        return iter(attribs)
+
+    def __repr__(self):
+        return str(dict(self))
+
+    def __reduce__(self):
+        return (_unpickle, (type(self), tuple(prop.member.__get__(self) for _, prop in self.schema())))
+
+
+def _unpickle(cls, values):
+    """
+    Reconstruct a slotted electrode pickled by `_SlottedElectrode.__reduce__`.
+    """
+    self = cls.__new__(cls)
+    for (_, prop), value in zip(cls.schema(), values):
+        prop.member.__set__(self, value)
+    return self
+
+
+def _populate(slotted_class):
+    """
+    Add the attributes and methods of `slotted_class.electrode_class` to `slotted_class`.
+
+    Each `PhysicalProperty` becomes a `SlotProperty` over the corresponding slot. Methods and other class attributes are copied, with memoized methods unwrapped, since the slotted variant has nowhere to cache their values.
+    """
+    electrode_class = slotted_class.electrode_class
+    for klass in reversed(inspect.getmro(electrode_class)):
+        for name, value in vars(klass).items():
+            if name.startswith("__") or name in slotted_class._machinery:
+                continue
+            if isinstance(value, PhysicalProperty):
+                setattr(slotted_class, name, SlotProperty(value, getattr(slotted_class, "_" + name)))
+            elif not isinstance(value, (classmethod, staticmethod)):
+                setattr(slotted_class, name, getattr(value, "method", value))
+
+
+class SlottedMetal(_SlottedElectrode):
+    """
+    Lightweight `Metal` with scalar attributes stored as floats
+
+    A `SlottedMetal` is instantiated with the same arguments as `Metal`, subject to the same constraints, and has the same attributes and methods, which return the same values, except for `replace`, `from_records` and `to_records`. Each attribute must be a scalar; it is stored as a float in its default unit in a slot, and reading it returns an `astropy.units.Quantity`. Objects have no `__dict__`, so no other attributes can be set on them.
+
+    Unlike `Metal`, a `SlottedMetal` doesn't cache the values of its methods; each call computes its value afresh. Use :meth:`from_electrode` and :meth:`to_electrode` to convert to and from `Metal` without loss; the TEC models accept only the full classes.
+
+    Held in a list, a `SlottedMetal` (the object with its six slots and the float objects they refer to) costs about 280 bytes of memory, against about 4.9 kB for a `Metal` and 48 bytes per electrode for an `ElectrodeBatch`; see ``bench/electrode_memory.py``.
+    """
+
+    __slots__ = tuple("_" + name for name, _ in Metal.schema())
+
+    electrode_class = Metal
+
+
+class SlottedSC(SlottedMetal):
+    """
+    Lightweight `SC` with scalar attributes stored as floats
+
+    `SlottedSC` is to `SC` what :class:`SlottedMetal` is to `Metal`. It costs about 510 bytes of memory, against about 9.6 kB for an `SC`.
+    """
+
+    __slots__ = tuple("_" + name for name, _ in SC.schema() if name not in dict(Metal.schema()))
+
+    electrode_class = SC
+
+    def carrier_statistics_sweep(self, name, values):
+        """
+        Carrier statistics along a sweep of one attribute
+
+        Same as `SC.carrier_statistics_sweep`, which is called on :meth:`to_electrode`.
+        """
+        return self.to_electrode().carrier_statistics_sweep(name, values)
+
+
+_populate(SlottedMetal)
+_populate(SlottedSC)
@@ -1,19 +1,227 @@
 # -*- coding: utf-8 -*-
 
+import os
+import math
+import functools
+import threading
 import numpy as np
 from scipy import interpolate, optimize, integrate, special
 from astropy import units, constants
 from tec import TECBase
+from tec._util import chandrupatla, read_only
 
+TABULATION_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dimensionless_langmuir_poisson_soln.npy")
 
-class DimensionlessLangmuirPoissonSoln(dict):
+
+class TabulatedSpline(object):
+    """
+    B-spline evaluated directly from its knots and coefficients.
+
+    :param t: Knots.
+    :param c: Coefficients.
+    :param int k: Degree.
+
+    The knots and coefficients are not copied, so they can be views into a `numpy.memmap`; see the `tabulation` argument of :class:`DimensionlessLangmuirPoissonSoln`. Calling the object has the same semantics as calling an `scipy.interpolate.InterpolatedUnivariateSpline` (values outside of the knots are extrapolated).
+    """
+
+    def __init__(self, t, c, k):
+        self.tck = (t, c, k)
+
+    def __call__(self, x, nu=0):
+        return interpolate.splev(x, self.tck, der=nu)
+
+
+class HermiteTable(object):
+    """
+    Cubic Hermite interpolation on a uniform grid.
+
+    :param float lo: Abscissa of the first grid point.
+    :param float step: Grid spacing.
+    :param values: Ordinates at the grid points.
+    :param slopes: Derivatives of the ordinates at the grid points.
+    :param bool sqrt: If `True`, the grid is uniform in the square root of the abscissa rather than in the abscissa itself; negative abscissae then evaluate to NaN.
+
+    The interval containing an abscissa is found by index arithmetic rather than by a search, so evaluation is O(1). Abscissae outside of the grid are extrapolated with the polynomial of the nearest interval. Calling the object with a float returns a float; calling it with a numpy array returns an array of the same shape.
+    """
+
+    def __init__(self, lo, step, values, slopes, sqrt=False):
+        self.lo = float(lo)
+        self.step = float(step)
+        self.sqrt = sqrt
+        self.values = np.array(values, dtype=float)
+        # Slopes are stored with respect to the normalized coordinate
+        # within an interval.
+        self.slopes = np.array(slopes, dtype=float) * self.step
+        self._last = len(self.values) - 2
+
+        # Python lists make scalar lookups considerably cheaper than
+        # indexing numpy arrays.
+        self._values = self.values.tolist()
+        self._slopes = self.slopes.tolist()
+
+    def __call__(self, x):
+        if isinstance(x, np.ndarray) and x.ndim > 0:
+            return self._call_array(np.asarray(x, dtype=float))
+
+        x = float(x)
+        if self.sqrt:
+            if not x >= 0:
+                return np.NaN
+            x = math.sqrt(x)
+
+        u = (x - self.lo) / self.step
+        if u != u:
+            return np.NaN
+        elif u < 1:
+            indx = 0
+        elif u >= self._last:
+            indx = self._last
+        else:
+            indx = int(u)
+        t = u - indx
+
+        y0 = self._values[indx]
+        y1 = self._values[indx + 1]
+        d0 = self._slopes[indx]
+        d1 = self._slopes[indx + 1]
+
+        return y0 + t * (d0 + t * (3 * (y1 - y0) - 2 * d0 - d1 + t * (2 * (y0 - y1) + d0 + d1)))
+
+    def _call_array(self, x):
+        with np.errstate(invalid="ignore"):
+            if self.sqrt:
+                # Negative abscissae become NaN.
+                x = np.sqrt(x)
+
+            u = (x - self.lo) / self.step
+            # `fmax` maps NaN to index 0; the NaN propagates through `t`.
+            indx = np.fmin(np.fmax(np.floor(u), 0), self._last).astype(np.intp)
+        t = u - indx
+
+        y0 = self.values[indx]
+        y1 = self.values[indx + 1]
+        d0 = self.slopes[indx]
+        d1 = self.slopes[indx + 1]
+
+        return y0 + t * (d0 + t * (3 * (y1 - y0) - 2 * d0 - d1 + t * (2 * (y0 - y1) + d0 + d1)))
+
+
+class SquareRootSpline(object):
+    """
+    Cubic spline in the square root of the abscissa.
+
+    :param x: Abscissae >= 0, increasing.
+    :param y: Ordinates.
+
+    Position is proportional to the square root of motive near the origin, so position vs. motive is smooth in the square root of motive although it is not smooth in motive. Negative abscissae evaluate to NaN; abscissae beyond the last are extrapolated.
+    """
+
+    def __init__(self, x, y):
+        self.spline = interpolate.InterpolatedUnivariateSpline(np.sqrt(x), y)
+
+    def __call__(self, x):
+        with np.errstate(invalid="ignore"):
+            return self.spline(np.sqrt(x))
+
+
+def _smoothstep(x):
+    """
+    Smooth step from 0 at `x` <= 0 to 1 at `x` >= 1.
+    """
+    x = np.clip(x, 0, 1)
+    return x * x * (3 - 2 * x)
+
+
+class _GuardedDict(dict):
+    """
+    Dictionary which can't be modified once its `_read_only` attribute is set.
+    """
+
+    _read_only = False
+
+    def _check_writable(self):
+        if self._read_only:
+            raise TypeError("shared DimensionlessLangmuirPoissonSoln is read-only.")
+
+    def __setitem__(self, key, value):
+        self._check_writable()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._check_writable()
+        dict.__delitem__(self, key)
+
+    def clear(self):
+        self._check_writable()
+        dict.clear(self)
+
+    def pop(self, *args):
+        self._check_writable()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._check_writable()
+        return dict.popitem(self)
+
+    def setdefault(self, *args):
+        self._check_writable()
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._check_writable()
+        dict.update(self, *args, **kwargs)
+
+
+class DimensionlessLangmuirPoissonSoln(_GuardedDict):
     """
     Numerical solution of Langmuir's dimensionless Poisson's equation.
 
     The purpose of this class is to provide an API to the solution of Langmuir's dimensionless Poisson's equation :cite:`10.1103/PhysRev.21.419` to provide the appropriate level of simplicity to the user. Via the class methods, the user can access either the dimensionless motive vs. dimensionless position or the dimensionless position vs. dimensionless motive, both of which are necessary in the Langmuir model. This class uses an ode solver to approximate the solution to the ode, then interpolation to return values at arbitrary abscissae -- see the source for details of the ode solver and interpolation algorithm.
+
+    The solution does not depend on any parameter of a TEC, so a single read-only instance can be shared by every object in the process; see :meth:`shared`.
+
+    :param tabulation: Filename of a tabulation written by :meth:`tabulate`. If `None` (the default), the ode is solved.
+    :param str interpolation: Either "spline" (the default) or "hermite".
+    :param accuracy: Name of one of the `accuracy_presets` or a dictionary with the same keys as a preset. If `None` (the default), the ode is solved on a fixed grid of 1000 points per branch (see :meth:`calc_branch`).
+
+    When a tabulation is given, the solution is read from disk through a read-only `numpy.memmap` instead of being computed, so processes which load the same file share a single copy of its pages. A high-resolution tabulation ships with the package (see `TABULATION_FILENAME`).
+
+    With "spline" interpolation, values are interpolated with FITPACK splines. With "hermite" interpolation, each branch is resampled from those splines onto uniform grids of `hermite_points` points -- in position for motive vs. position and in the square root of motive for position vs. motive -- and values are interpolated with cubic Hermite polynomials (see :class:`HermiteTable`). Hermite interpolation is several times cheaper per call; use :meth:`max_difference` to compare the two.
+
+    When `accuracy` is given, each branch is solved with an adaptive integrator at the requested tolerances and the interpolations are built from its dense output (see :meth:`calc_adaptive_branch`), so the points are concentrated where the solution curves most -- near the origin and, on the left-hand side, near the singularity. The presets trade construction time and memory for accuracy; the errors below are the maximum absolute errors in position, relative to :meth:`quadrature_position`, for motive up to the blend windows, and the time and memory are those of constructing both branches (measured with `bench/langmuir_accuracy.py`):
+
+    =========  =====  =====  ============  ==========  =====  ======  ======
+    preset     rtol   atol   subdivisions  points      error  time    memory
+    =========  =====  =====  ============  ==========  =====  ======  ======
+    fast       1e-5   1e-8   2             91 / 43     4e-5   10 ms   5 kB
+    default    1e-8   1e-11  2             307 / 125   4e-7   25 ms   14 kB
+    reference  1e-11  1e-14  4             2357 / 893  5e-10  90 ms   105 kB
+    =========  =====  =====  ============  ==========  =====  ======  ======
+
+    Points are given for the left- and right-hand sides; the left-hand side needs more since its solution diverges near its endpoint. For comparison, the construction without `accuracy` (1000 points per branch, position vs. motive interpolated linearly) takes about 5 ms and 64 kB for an error of 8e-5, and loading the shipped tabulation takes no time beyond mapping the file.
     """
 
-    def __init__(self):
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    _branches = [("lhs", -2.5538), ("rhs", 100)]
+
+    hermite_points = 4097
+
+    # Tolerances of the adaptive integrator and the number of points
+    # sampled from its dense output per step; see
+    # `calc_adaptive_branch`.
+    accuracy_presets = {"fast": {"rtol": 1e-5, "atol": 1e-8, "subdivisions": 2},
+                        "default": {"rtol": 1e-8, "atol": 1e-11, "subdivisions": 2},
+                        "reference": {"rtol": 1e-11, "atol": 1e-14, "subdivisions": 4}, }
+
+    def __init__(self, tabulation=None, interpolation="spline", accuracy=None):
+        if interpolation not in ["spline", "hermite"]:
+            raise ValueError("interpolation must either be 'spline' or 'hermite'.")
+        if tabulation is not None and accuracy is not None:
+            raise ValueError("tabulation and accuracy cannot both be specified.")
+        accuracy = self._resolve_accuracy(accuracy)
+
         # Here is the algorithm:
         # 1. Set up the default ode solver parameters.
         # 2. Check to see if either the rhs or lhs params were passed as arguments. If not, use the default params.
@@ -21,8 +229,28 @@ class DimensionlessLangmuirPoissonSoln(dict):
         # 4. Solve both the lhs and rhs odes.
         # 5. Create the lhs and rhs interpolation objects.
 
-        self["lhs"] = self.calc_branch(-2.5538)
-        self["rhs"] = self.calc_branch(100)
+        if accuracy is not None:
+            for branch, endpoint in self._branches:
+                self[branch] = self.calc_adaptive_branch(endpoint, **accuracy)
+        elif tabulation is None:
+            self["lhs"] = self.calc_branch(-2.5538)
+            self["rhs"] = self.calc_branch(100)
+        else:
+            # Each branch is stored as four rows: the knots and
+            # coefficients of motive_v_position (cubic), then those of
+            # position_v_motive (linear). The linear spline has two
+            # fewer knots; its rows are padded at the end.
+            data = np.load(tabulation, mmap_mode="r")
+            num_knots = data.shape[-1]
+
+            for indx, (branch, endpoint) in enumerate(self._branches):
+                rows = data[indx]
+                self[branch] = {"motive_v_position": TabulatedSpline(rows[0], rows[1], 3),
+                                "position_v_motive": TabulatedSpline(rows[2, :num_knots - 2], rows[3, :num_knots - 2], 1)}
+
+        if interpolation == "hermite":
+            for branch, endpoint in self._branches:
+                self[branch] = self.calc_hermite_branch(self[branch], endpoint, self.hermite_points)
 
         # data = np.loadtxt("tec/models/kleynen_langmuir.dat")
         # rhs = data[565:-1,:]
@@ -33,6 +261,149 @@ class DimensionlessLangmuirPoissonSoln(dict):
         # self["rhs"]["position_v_motive"] = \
         #         interpolate.InterpolatedUnivariateSpline(rhs[:,1],rhs[:,0],k=1)
 
+    @classmethod
+    def _resolve_accuracy(cls, accuracy):
+        """
+        Dictionary of the arguments of :meth:`calc_adaptive_branch` for the `accuracy` argument of the constructor, or `None`.
+        """
+        if accuracy is None:
+            return None
+
+        if isinstance(accuracy, basestring):
+            if accuracy not in cls.accuracy_presets:
+                raise ValueError("accuracy must be one of %s." % ", ".join("'%s'" % name for name in sorted(cls.accuracy_presets)))
+            return cls.accuracy_presets[accuracy]
+
+        if not isinstance(accuracy, dict):
+            raise TypeError("accuracy must be the name of a preset or a dictionary.")
+        if set(accuracy) != set(cls.accuracy_presets["default"]):
+            raise ValueError("accuracy must have the keys %s." % ", ".join("'%s'" % name for name in sorted(cls.accuracy_presets["default"])))
+
+        return accuracy
+
+    @classmethod
+    def shared(cls, interpolation="spline", accuracy=None):
+        """
+        Process-wide, read-only solution shared by all callers
+
+        :param str interpolation: Either "spline" (the default) or "hermite".
+        :param accuracy: Name of one of the `accuracy_presets`, a dictionary with the same keys as a preset, or `None` (the default).
+
+        If `accuracy` is `None`, the solution is loaded from the tabulation shipped with the package the first time this method is called (or computed, if the tabulation is missing); otherwise it is computed with the given tolerances. Subsequent calls (from any thread) with the same `interpolation` and tolerances, whether given by name or by dictionary, return the same object. The returned object cannot be modified.
+
+        :rtype: :class:`DimensionlessLangmuirPoissonSoln`
+        """
+        accuracy = cls._resolve_accuracy(accuracy)
+        key = (interpolation, None if accuracy is None else tuple(sorted(accuracy.items())))
+        dps = cls._shared.get(key)
+
+        if dps is None:
+            with cls._shared_lock:
+                dps = cls._shared.get(key)
+                if dps is None:
+                    if accuracy is not None:
+                        dps = cls(interpolation=interpolation, accuracy=accuracy)
+                    elif os.path.exists(TABULATION_FILENAME):
+                        dps = cls(tabulation=TABULATION_FILENAME, interpolation=interpolation)
+                    else:
+                        dps = cls(interpolation=interpolation)
+                    # The branches are made read-only along with the
+                    # solution, since every caller shares them too.
+                    for branch, _ in cls._branches:
+                        dps[branch] = _GuardedDict(dps[branch])
+                        dps[branch]._read_only = True
+                    dps._read_only = True
+                    cls._shared[key] = dps
+
+        return dps
+
+    @classmethod
+    def tabulate(cls, filename=TABULATION_FILENAME, num_points=10001):
+        """
+        Write a tabulation of the solution to disk.
+
+        :param str filename: Destination; the file is in `numpy` `.npy` format.
+        :param int num_points: Number of points for ode solver to use on each branch.
+
+        The ode is solved on each branch exactly as in :meth:`calc_branch`; the knots and coefficients of the resulting interpolations are written so that they can be read back with the `tabulation` argument of the constructor. Call this method without arguments to regenerate the tabulation shipped with the package.
+        """
+        data = np.empty([len(cls._branches), 4, num_points + 4])
+        data.fill(np.nan)
+
+        for indx, (branch, endpoint) in enumerate(cls._branches):
+            position_array, motive_array = cls.solve_branch(endpoint, num_points)
+
+            order = np.argsort(position_array)
+            t, c, k = interpolate.splrep(position_array[order], motive_array[order], k=3, s=0)
+            data[indx, 0, :len(t)] = t
+            data[indx, 1, :len(t)] = c[:len(t)]
+
+            order = np.argsort(motive_array)
+            t, c, k = interpolate.splrep(motive_array[order], position_array[order], k=1, s=0)
+            data[indx, 2, :len(t)] = t
+            data[indx, 3, :len(t)] = c[:len(t)]
+
+        np.save(filename, data)
+
+    def tabulation_error(self, num_points=997):
+        """
+        Maximum error of this solution relative to the ode solver.
+
+        :param int num_points: Number of points at which to solve the ode on each branch.
+        :rtype: dict
+
+        The ode is solved on each branch at `num_points` positions and the results are compared with the interpolations of this object. The returned dictionary has keys "lhs" and "rhs"; each value is a dictionary with items "motive_v_position", the maximum relative error in motive, and "position_v_motive", the maximum absolute error in position. Motive above 18.7 on the left-hand side is excluded from the comparison since :meth:`position` clamps it. This method is the accuracy check for tabulations written by :meth:`tabulate`.
+        """
+        errors = {}
+
+        for branch, endpoint in self._branches:
+            position_array, motive_array = self.solve_branch(endpoint, num_points)
+            mask = (motive_array > 0) & (motive_array <= 18.7)
+
+            motive = self[branch]["motive_v_position"](position_array[mask])
+            position = self[branch]["position_v_motive"](motive_array[mask])
+
+            errors[branch] = {"motive_v_position": np.max(np.abs(motive / motive_array[mask] - 1)),
+                              "position_v_motive": np.max(np.abs(position - position_array[mask]))}
+
+        return errors
+
+    def max_difference(self, other, num_points=10007):
+        """
+        Maximum difference between this solution and another.
+
+        :param other: :class:`DimensionlessLangmuirPoissonSoln` to compare against.
+        :param int num_points: Number of points at which to compare each branch.
+        :rtype: dict
+
+        :meth:`motive` and :meth:`position` of both objects are evaluated on each branch at `num_points` evenly spaced positions and motives, respectively. The returned dictionary has keys "lhs" and "rhs"; each value is a dictionary with items "motive_v_position", the maximum absolute difference in motive, and "position_v_motive", the maximum absolute difference in position. For example, use this method to find the error of "hermite" interpolation relative to "spline" interpolation.
+        """
+        differences = {}
+
+        for branch, endpoint in self._branches:
+            position = np.linspace(0, endpoint, num_points)
+            motive = np.linspace(0, other.motive(position).max(), num_points)
+
+            differences[branch] = {"motive_v_position": np.nanmax(np.abs(self.motive(position) - other.motive(position))),
+                                   "position_v_motive": np.nanmax(np.abs(self.position(motive, branch) - other.position(motive, branch)))}
+
+        return differences
+
+    @classmethod
+    def solve_branch(cls, endpoint, num_points=1000):
+        """
+        Solve either side of the ode.
+
+        :param float endpoint: Endpoint for the ode solver.
+        :param int num_points: Number of points for ode solver to use.
+        :returns: 2-tuple of numpy arrays: position and motive.
+        """
+        ics = np.array([0, 0])
+        position_array = np.linspace(0, endpoint, num_points)
+        motive_array = integrate.odeint(cls.langmuir_poisson_eq, ics, position_array)
+
+        return position_array, motive_array[:, 0]
+
     def calc_branch(self, endpoint, num_points=1000):
         """
         Numerical solution for either side of the ode.
@@ -43,9 +414,8 @@ class DimensionlessLangmuirPoissonSoln(dict):
 
         This method returns a dictionary with items, "motive_v_position" and "position_v_motive"; each item an interpolation of what its name describes.
         """
-        ics = np.array([0, 0])
-        position_array = np.linspace(0, endpoint, num_points)
-        motive_array = integrate.odeint(self.langmuir_poisson_eq, ics, position_array)
+        position_array, motive_array = self.solve_branch(endpoint, num_points)
+        motive_array = motive_array[:, np.newaxis]
 
         # Create the motive_v_position interpolation, but first check the abscissae (position_array) are monotonically increasing.
         if position_array[0] < position_array[-1]:
@@ -67,17 +437,102 @@ class DimensionlessLangmuirPoissonSoln(dict):
 
         return {"motive_v_position": motive_v_position, "position_v_motive": position_v_motive}
 
+    @classmethod
+    def solve_adaptive_branch(cls, endpoint, rtol, atol, subdivisions):
+        """
+        Solve either side of the ode with an adaptive integrator.
+
+        :param float endpoint: Endpoint for the ode solver.
+        :param float rtol: Relative tolerance of the ode solver.
+        :param float atol: Absolute tolerance of the ode solver.
+        :param int subdivisions: Number of points to sample from the dense output in each step of the ode solver.
+        :returns: 2-tuple of numpy arrays: position and motive.
+
+        The ode is solved with the explicit Runge-Kutta method of order 5(4) of `scipy.integrate.solve_ivp`, which chooses its own steps to meet `rtol` and `atol`. Each step is divided into `subdivisions` equal parts and motive is evaluated at the division points with the dense output of the solver, so the returned points are concentrated where the steps are short.
+        """
+        def fun(position, motive):
+            return cls.langmuir_poisson_eq(motive, position)
+
+        soln = integrate.solve_ivp(fun, (0, endpoint), [0, 0], rtol=rtol, atol=atol, dense_output=True)
+        if not soln.success:
+            raise RuntimeError(soln.message)
+
+        steps = soln.t
+        fractions = np.arange(subdivisions) / float(subdivisions)
+        position_array = (steps[:-1, np.newaxis] + np.diff(steps)[:, np.newaxis] * fractions).ravel()
+        position_array = np.append(position_array, steps[-1])
+
+        return position_array, soln.sol(position_array)[0]
+
+    def calc_adaptive_branch(self, endpoint, rtol, atol, subdivisions):
+        """
+        Numerical solution for either side of the ode with an adaptive integrator.
+
+        :param float endpoint: Endpoint for the ode solver.
+        :param float rtol: Relative tolerance of the ode solver.
+        :param float atol: Absolute tolerance of the ode solver.
+        :param int subdivisions: Number of points to sample from the dense output in each step of the ode solver.
+        :rtype: Dictionary of interpolation objects.
+
+        This method is the counterpart of :meth:`calc_branch` with the ode solved by :meth:`solve_adaptive_branch`; see `accuracy_presets` for typical values of the arguments. Motive vs. position is interpolated with a cubic spline, as in :meth:`calc_branch`. Position vs. motive is interpolated with a cubic spline in the square root of motive (see :class:`SquareRootSpline`) rather than linearly, so that it keeps up with the accuracy of the ode solver.
+        """
+        position_array, motive_array = self.solve_adaptive_branch(endpoint, rtol, atol, subdivisions)
+
+        order = np.argsort(position_array)
+        motive_v_position = interpolate.InterpolatedUnivariateSpline(position_array[order], motive_array[order])
+
+        order = np.argsort(motive_array)
+        position_v_motive = SquareRootSpline(motive_array[order], position_array[order])
+
+        return {"motive_v_position": motive_v_position, "position_v_motive": position_v_motive}
+
+    def calc_hermite_branch(self, branch, endpoint, num_points):
+        """
+        Uniform-grid cubic Hermite interpolations of either side of the ode.
+
+        :param dict branch: Dictionary of interpolation objects as returned by :meth:`calc_branch`.
+        :param float endpoint: Endpoint of the branch.
+        :param int num_points: Number of grid points.
+        :rtype: Dictionary of :class:`HermiteTable` objects.
+
+        Values and slopes of motive vs. position are sampled from the cubic spline of the branch on a grid uniform in position. Position vs. motive is sampled on a grid uniform in the square root of motive (position is proportional to the square root of motive near the origin); each sample is found by inverting the cubic spline with Newton's method, starting from the linear interpolation.
+        """
+        motive_v_position = branch["motive_v_position"]
+
+        # Motive vs. position.
+        position = np.linspace(min(0, endpoint), max(0, endpoint), num_points)
+        step = position[1] - position[0]
+        mvp = HermiteTable(position[0], step, motive_v_position(position), motive_v_position(position, 1))
+
+        # Position vs. square root of motive. The slope at the origin
+        # follows from the curvature of motive there.
+        root_motive = np.linspace(0, np.sqrt(motive_v_position(endpoint)), num_points)
+        motive = root_motive**2
+        position = branch["position_v_motive"](motive)
+        position[0] = 0
+        for iteration in range(4):
+            position[1:] -= (motive_v_position(position[1:]) - motive[1:]) / motive_v_position(position[1:], 1)
+
+        slopes = np.empty(num_points)
+        slopes[1:] = 2 * root_motive[1:] / motive_v_position(position[1:], 1)
+        slopes[0] = np.sign(endpoint) * np.sqrt(2 / motive_v_position(0, 2))
+        pvm = HermiteTable(0, root_motive[1] - root_motive[0], position, slopes, sqrt=True)
+
+        return {"motive_v_position": mvp, "position_v_motive": pvm}
+
     def position(self, motive, branch="lhs"):
         """
         Interpolation of dimensionless position at arbitrary dimensionless motive.
 
-        :param float motive: Argument of interpolation.
+        :param motive: float or numpy array; argument of interpolation.
         :param str branch=="lhs": Interpolate from left-hand side of solution to ode.
         :param str branch=="rhs": Interpolate from right-hand side of solution to ode.
-        :returns: Interpolated position.
+        :returns: Interpolated position; a numpy array of the same shape if `motive` is an array.
         :rtype: float
 
         The left or right hand side must be specified since the inverse of the solution to Langmuir's dimensionless Poisson's equation is not a single-valued function. Returns NaN if motive is < 0.
+
+        Above the motives in `motive_blend`, the interpolation is blended smoothly into :meth:`asymptotic_position`, so that arbitrarily large motive is handled on either side. In particular, on the left-hand side the position approaches `lhs_singularity` as motive goes to infinity.
         """
 
         if type(branch) is not str:
@@ -85,29 +540,280 @@ class DimensionlessLangmuirPoissonSoln(dict):
         # if branch is not "lhs" or "rhs":
         # raise ValueError("branch must either be 'lhs' or 'rhs'.")
 
+        if isinstance(motive, np.ndarray) and motive.ndim > 0:
+            return self._position_array(np.asarray(motive, dtype=float), branch)
+
+        motive = float(motive)
+        lo, hi = self.motive_blend[branch]
+
         if motive < 0:
             return np.NaN
-
-        # if branch is "lhs" or branch is "rhs":
-        if branch is "lhs" and motive > 18.7:
-            return -2.55389
-        else:
+        elif not motive > lo:
             return self[branch]["position_v_motive"](motive)
 
+        position = self.asymptotic_position(motive, branch)
+        if motive < hi:
+            weight = _smoothstep((motive - lo) / (hi - lo))
+            position = weight * position + (1 - weight) * self[branch]["position_v_motive"](motive)
+
+        return position
+
+    def _position_array(self, motive, branch):
+        """
+        Array counterpart of :meth:`position`; the branch selection is done with masks.
+        """
+        lo, hi = self.motive_blend[branch]
+        position = np.empty_like(motive)
+
+        with np.errstate(invalid="ignore"):
+            nan_mask = motive < 0
+            asymptotic_mask = motive > lo
+        interp_mask = ~(nan_mask | asymptotic_mask)
+
+        position[nan_mask] = np.NaN
+        if interp_mask.any():
+            position[interp_mask] = self[branch]["position_v_motive"](motive[interp_mask])
+        if asymptotic_mask.any():
+            asymptotic_motive = motive[asymptotic_mask]
+            asymptotic_position = self.asymptotic_position(asymptotic_motive, branch)
+
+            blend_mask = asymptotic_motive < hi
+            if blend_mask.any():
+                blend_motive = asymptotic_motive[blend_mask]
+                weight = _smoothstep((blend_motive - lo) / (hi - lo))
+                asymptotic_position[blend_mask] = weight * asymptotic_position[blend_mask] + (1 - weight) * self[branch]["position_v_motive"](blend_motive)
+
+            position[asymptotic_mask] = asymptotic_position
+
+        return position
+
     def motive(self, position):
         """
         Value of motive relative to ground for given value(s) of position in J.
 
         :param position: float or numpy array at which motive is to be evaluated. Returns NaN if position falls outside of the interelectrode space.
+
+        Beyond the positions in `position_blend`, the interpolation is blended smoothly into :meth:`asymptotic_motive`, so that arbitrarily large position is handled on the right-hand side and the divergence at `lhs_singularity` is handled on the left-hand side. Positions less than `lhs_singularity` return NaN.
         """
-        if position < -2.55389:
+        if isinstance(position, np.ndarray) and position.ndim > 0:
+            return self._motive_array(np.asarray(position, dtype=float))
+
+        position = float(position)
+
+        if position < self.lhs_singularity:
             return np.NaN
         elif position <= 0:
-            return self["lhs"]["motive_v_position"](position)
+            branch = "lhs"
+            lo, hi = self.position_blend[branch]
+            if position > lo:
+                return self[branch]["motive_v_position"](position)
         else:
-            return self["rhs"]["motive_v_position"](position)
+            branch = "rhs"
+            lo, hi = self.position_blend[branch]
+            if not position > lo:
+                return self[branch]["motive_v_position"](position)
+
+        motive = self.asymptotic_motive(position)
+        if (position - hi) * (lo - hi) > 0:
+            weight = _smoothstep((position - lo) / (hi - lo))
+            motive = weight * motive + (1 - weight) * self[branch]["motive_v_position"](position)
+
+        return motive
+
+    def _motive_array(self, position):
+        """
+        Array counterpart of :meth:`motive`; the branch selection is done with masks.
+        """
+        motive = np.empty_like(position)
+
+        # NaN positions fall through to the rhs, as they do for scalars.
+        with np.errstate(invalid="ignore"):
+            nan_mask = position < self.lhs_singularity
+            lhs_mask = ~nan_mask & (position <= 0)
+        rhs_mask = ~(nan_mask | lhs_mask)
+
+        motive[nan_mask] = np.NaN
+        for branch, mask in [("lhs", lhs_mask), ("rhs", rhs_mask)]:
+            if not mask.any():
+                continue
+
+            lo, hi = self.position_blend[branch]
+            branch_position = position[mask]
+            branch_motive = np.empty_like(branch_position)
+
+            # Positions beyond `lo` use the asymptotic solution, blended
+            # up to `hi`.
+            with np.errstate(invalid="ignore"):
+                asymptotic_mask = (branch_position - lo) * (hi - lo) > 0
+            interp_mask = ~asymptotic_mask
+
+            if interp_mask.any():
+                branch_motive[interp_mask] = self[branch]["motive_v_position"](branch_position[interp_mask])
+            if asymptotic_mask.any():
+                asymptotic_position = branch_position[asymptotic_mask]
+                asymptotic_motive = self.asymptotic_motive(asymptotic_position)
+
+                blend_mask = (asymptotic_position - hi) * (lo - hi) > 0
+                if blend_mask.any():
+                    blend_position = asymptotic_position[blend_mask]
+                    weight = _smoothstep((blend_position - lo) / (hi - lo))
+                    asymptotic_motive[blend_mask] = weight * asymptotic_motive[blend_mask] + (1 - weight) * self[branch]["motive_v_position"](blend_position)
+
+                branch_motive[asymptotic_mask] = asymptotic_motive
+
+            motive[mask] = branch_motive
+
+        return motive
+
+    # Asymptotic solution ---------------------------------------------
+    # Langmuir's dimensionless Poisson's equation has a first integral
+    # (see `motive_gradient`). Expanding the inverse of its square
+    # root for large motive and integrating term by term gives the
+    # series in `asymptotic_position`. The constants of integration,
+    # `lhs_singularity` and `_rhs_coefficients[0]`, were evaluated
+    # with `quadrature_position`.
+    lhs_singularity = -2.553945442560938
+
+    _rhs_coefficients = [-0.508543881447622,
+                         2 * np.sqrt(2) / 3 * np.pi**0.25,
+                         np.sqrt(2) / 2 * np.pi**0.75,
+                         np.sqrt(2) * (np.pi**0.25 / 2 - 3 * np.pi**1.25 / 16),
+                         np.sqrt(2) * (np.pi**0.75 / 8 - 5 * np.pi**1.75 / 192),
+                         np.sqrt(2) * (3 * np.pi**1.25 / 64 - 7 * np.pi**0.25 / 80 - 7 * np.pi**2.25 / 1024),
+                         np.sqrt(2) * (5 * np.pi**1.75 / 256 - 27 * np.pi**0.75 / 448 - 9 * np.pi**2.75 / 4096), ]
+
+    # Blending windows between interpolation and asymptotic solution.
+    # Each 2-tuple is (start, end) of the blend; beyond the end only the
+    # asymptotic solution is used.
+    motive_blend = {"lhs": (8., 10.), "rhs": (100., 200.)}
+    position_blend = {"lhs": (lhs_singularity + np.sqrt(2) * np.exp(-4.), lhs_singularity + np.sqrt(2) * np.exp(-5.)),
+                      "rhs": (45., 75.)}
+
+    @classmethod
+    def asymptotic_position(cls, motive, branch="lhs"):
+        """
+        Asymptotic dimensionless position at large dimensionless motive.
+
+        :param motive: float or numpy array.
+        :param str branch: Either "lhs" or "rhs".
+
+        On the left-hand side, position approaches the singularity :math:`\\xi_{\\infty}` = `lhs_singularity` as
+
+        .. math::
+            \\xi = \\xi_{\\infty} + \\sqrt{2} e^{-\\gamma/2} + \\frac{1 + 2 \\sqrt{\\gamma / \\pi}}{6 \\sqrt{2}} e^{-3\\gamma/2}
+
+        which is accurate to 1e-8 for motive above 10 and to 3e-7 above 8. On the right-hand side, position grows as
+
+        .. math::
+            \\xi = c_{0} + c_{1} \\gamma^{3/4} + c_{2} \\gamma^{1/4} + c_{3} \\gamma^{-1/4} + c_{4} \\gamma^{-3/4} + c_{5} \\gamma^{-5/4} + c_{6} \\gamma^{-7/4}
 
-    def langmuir_poisson_eq(self, motive, position):
+        which is accurate to 2e-5 for motive above 100.
+        """
+        if branch == "lhs":
+            # The second term is negligible at large motive; capping the
+            # motive avoids inf * 0.
+            capped_motive = np.minimum(motive, 1000.)
+            correction = np.exp(-1.5 * capped_motive) * (1 + 2 * np.sqrt(capped_motive / np.pi)) / (6 * np.sqrt(2))
+            return cls.lhs_singularity + np.sqrt(2) * np.exp(-0.5 * motive) + correction
+        elif branch == "rhs":
+            root = motive**0.25
+            c = cls._rhs_coefficients
+            return c[0] + c[1] * root**3 + c[2] * root + c[3] / root + c[4] / root**3 + c[5] / root**5 + c[6] / root**7
+        else:
+            raise ValueError("branch must either be 'lhs' or 'rhs'.")
+
+    @classmethod
+    def asymptotic_motive(cls, position):
+        """
+        Asymptotic dimensionless motive near the singularity and at large dimensionless position.
+
+        :param position: float or numpy array; values <= 0 are on the left-hand side, values > 0 on the right-hand side.
+
+        This method inverts :meth:`asymptotic_position`: in closed form (with one fixed-point correction) on the left-hand side and with Newton's method on the right-hand side. Positions at `lhs_singularity` return infinity and positions less than it return NaN.
+        """
+        position = np.asarray(position, dtype=float)
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            # Left-hand side.
+            distance = position - cls.lhs_singularity
+            lhs_motive = -2 * np.log(distance / np.sqrt(2))
+            capped_motive = np.minimum(lhs_motive, 1000.)
+            correction = np.exp(-1.5 * capped_motive) * (1 + 2 * np.sqrt(capped_motive / np.pi)) / (6 * np.sqrt(2))
+            lhs_motive = -2 * np.log((distance - correction) / np.sqrt(2))
+
+            # Right-hand side, for the fourth root of motive.
+            c = cls._rhs_coefficients
+            root = np.cbrt(np.maximum(position - c[0], 1.) / c[1])
+            for iteration in range(4):
+                residual = c[0] + c[1] * root**3 + c[2] * root + c[3] / root + c[4] / root**3 + c[5] / root**5 + c[6] / root**7 - position
+                slope = 3 * c[1] * root**2 + c[2] - c[3] / root**2 - 3 * c[4] / root**4 - 5 * c[5] / root**6 - 7 * c[6] / root**8
+                root = root - residual / slope
+            rhs_motive = root**4
+
+            motive = np.where(position <= 0, lhs_motive, rhs_motive)
+            motive = np.where(distance < 0, np.NaN, motive)
+
+        if motive.ndim == 0:
+            motive = float(motive)
+
+        return motive
+
+    @staticmethod
+    def motive_gradient(motive, branch="lhs"):
+        """
+        Magnitude of the derivative of dimensionless motive with respect to dimensionless position.
+
+        :param motive: float or numpy array.
+        :param str branch: Either "lhs" or "rhs".
+
+        Multiplying Langmuir's dimensionless Poisson's equation by the derivative of motive and integrating from the motive maximum gives, on the left-hand side,
+
+        .. math::
+            \\left( \\frac{d\\gamma}{d\\xi} \\right)^{2} = 2 e^{\\gamma} - 1 - \\mathrm{erfcx} \\sqrt{\\gamma} - 2 \\sqrt{\\frac{\\gamma}{\\pi}}
+
+        and, on the right-hand side,
+
+        .. math::
+            \\left( \\frac{d\\gamma}{d\\xi} \\right)^{2} = \\mathrm{erfcx} \\sqrt{\\gamma} - 1 + 2 \\sqrt{\\frac{\\gamma}{\\pi}}
+
+        where :math:`\\mathrm{erfcx} \\, x = e^{x^{2}} \\mathrm{erfc} \\, x`. This method returns the square root of that quantity.
+        """
+        root = np.sqrt(motive)
+        if branch == "lhs":
+            gradient_squared = 2 * np.exp(motive) - 1 - special.erfcx(root) - 2 * root / np.sqrt(np.pi)
+        elif branch == "rhs":
+            gradient_squared = special.erfcx(root) - 1 + 2 * root / np.sqrt(np.pi)
+        else:
+            raise ValueError("branch must either be 'lhs' or 'rhs'.")
+
+        return np.sqrt(gradient_squared)
+
+    @classmethod
+    def quadrature_position(cls, motive, branch="lhs"):
+        """
+        Dimensionless position at dimensionless motive by quadrature.
+
+        :param float motive: Motive >= 0.
+        :param str branch: Either "lhs" or "rhs".
+
+        This method integrates the inverse of :meth:`motive_gradient` with `scipy.integrate.quad` (substituting the square root of motive to remove the singularity at the origin). It is slow but accurate to roughly 1e-10, and serves as a reference for the interpolated and asymptotic solutions.
+        """
+        def integrand(root):
+            if root == 0:
+                # Motive is quadratic in position at the origin.
+                return 2.
+            with np.errstate(over="ignore"):
+                return 2 * root / cls.motive_gradient(root**2, branch)
+
+        position = integrate.quad(integrand, 0, np.sqrt(motive), epsabs=1e-13, epsrel=1e-13, limit=200)[0]
+
+        if branch == "lhs":
+            position = -position
+
+        return position
+
+    @staticmethod
+    def langmuir_poisson_eq(motive, position):
         """
         Langmuir's dimensionless Poisson's equation for the ODE solver.
         """
@@ -116,12 +822,32 @@ class DimensionlessLangmuirPoissonSoln(dict):
         # motive[0] = motive.
         # motive[1] = motive[0]'
 
+        # exp(motive)*(1-erf(motive**0.5)) is evaluated as erfcx to
+        # avoid cancellation at large motive.
         if position >= 0:
-            return np.array([motive[1], 0.5*np.exp(motive[0])*(1-special.erf(motive[0]**0.5))])
+            return np.array([motive[1], 0.5*special.erfcx(motive[0]**0.5)])
         if position < 0:
             return np.array([motive[1], 0.5*np.exp(motive[0])*(1+special.erf(motive[0]**0.5))])
 
 
+def _operating_point(method):
+    """
+    Cache the value of a :class:`Langmuir` method until an electrode changes.
+
+    The cached value is made read-only, as by the memo of the electrodes.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._operating_point_cache()
+        if name not in cache:
+            cache[name] = read_only(method(self))
+        return cache[name]
+
+    return wrapper
+
+
 class Langmuir(TECBase):
     """
     Considers space charge, ignores NEA and back emission.
@@ -136,6 +862,12 @@ class Langmuir(TECBase):
     * critical_pt: Dictionary with keys "output_voltage" [V] and "output_current_density" [A m^-2] at the critical point.
     * dps: Langmuir's dimensionless Poisson's equation solution object.
 
+    By default every :class:`Langmuir` object uses the process-wide solution returned by :meth:`DimensionlessLangmuirPoissonSoln.shared`, so construction is cheap. Pass `shared_dps=False` to compute a private copy instead. The `interpolation` argument ("spline" or "hermite") selects the interpolation of the solution and the `accuracy` argument (`None`, the name of one of `DimensionlessLangmuirPoissonSoln.accuracy_presets` or a dictionary with the same keys) how it is constructed; see :class:`DimensionlessLangmuirPoissonSoln`.
+
+    Pickled objects hold only their electrodes and the choice of solution; the solution is reattached on unpickling.
+
+    The saturation point, critical point, operating regime and maximum motive are computed once and cached. The cache is discarded whenever the values of the electrodes' attributes differ from those at the time it was filled, so modifying an electrode (or replacing one) takes effect on the next call. The attribute `root_solves` counts the root finds performed by the object; e.g. :meth:`tec.TECBase.efficiency` in the space charge limited regime costs two of them.
+
     Examples and interface testing
     ------------------------------
     >>> from tec_langmuir import TEC_Langmuir
@@ -165,10 +897,72 @@ class Langmuir(TECBase):
     <class 'tec.dimensionlesslangmuirpoissonsoln.DimensionlessLangmuirPoissonSoln'>
     """
 
-    def __init__(self, emitter, collector, **kwargs):
+    def __init__(self, emitter, collector, shared_dps=True, interpolation="spline", accuracy=None, **kwargs):
         self.emitter = emitter
         self.collector = collector
-        self._dps = DimensionlessLangmuirPoissonSoln()
+
+        if shared_dps:
+            self._dps = DimensionlessLangmuirPoissonSoln.shared(interpolation, accuracy)
+        else:
+            self._dps = DimensionlessLangmuirPoissonSoln(interpolation=interpolation, accuracy=accuracy)
+        self._dps_args = (shared_dps, interpolation, accuracy)
+
+        self._cache = {}
+        self._cache_state = None
+        self.root_solves = 0
+
+    def __reduce__(self):
+        """
+        Pickle the electrodes and the arguments selecting the solution
+
+        The solution itself isn't pickled: unpickling reattaches the process-wide solution of :meth:`DimensionlessLangmuirPoissonSoln.shared` (or, for an object constructed with `shared_dps=False`, computes a private one). Cached values and `root_solves` start afresh.
+        """
+        return (type(self), (self.emitter, self.collector) + self._dps_args)
+
+    def _operating_point_cache(self):
+        """
+        Dictionary of cached values, emptied if an electrode has changed.
+
+        An electrode rebinds its memo to a new dictionary whenever one of its attributes is assigned (see `Metal._invalidate_memo`), so the cache is valid as long as both electrodes and their memos are the objects it was filled with. Holding them keeps their identities from being reused.
+        """
+        state = self._cache_state
+        if state is None or not (self.emitter is state[0] and self.emitter._memo is state[1] and self.collector is state[2] and self.collector._memo is state[3]):
+            for electrode in [self.emitter, self.collector]:
+                if any(getattr(electrode, name).ndim for name, _ in electrode.schema()):
+                    raise TypeError("Langmuir requires electrodes with scalar attributes; see Langmuir.operating_points for arrays.")
+            self._cache = {}
+            self._cache_state = (self.emitter, self.emitter._memo, self.collector, self.collector._memo)
+
+        return self._cache
+
+    def _brentq(self, f, a, b, args=()):
+        """
+        `scipy.optimize.brentq`, counted in `root_solves`.
+        """
+        self.root_solves += 1
+        return optimize.brentq(f, a, b, args=args)
+
+    @_operating_point
+    def _target_params(self):
+        """
+        Plain-float parameters of the target function kernels.
+
+        The returned dictionary has the following items, all floats:
+
+        * saturation_current_density: :meth:`saturation_point_current_density` in units of :math:`A cm^{-2}`.
+        * spacing: Dimensionless interelectrode spacing at a current density of :math:`1 A cm^{-2}`; the spacing at current density :math:`J` is this value times :math:`\sqrt{J}`.
+        * thermal_voltage: :math:`kT_{E}/e` in units of :math:`V`.
+        * contact_potential: :meth:`contact_potential` in units of :math:`V`.
+        * output_voltage: :meth:`output_voltage` in units of :math:`V`.
+        """
+        spacing = self.interelectrode_spacing() / self.normalization_length(1)
+        thermal_voltage = constants.k_B * self.emitter.temp / constants.e.si
+
+        return {"saturation_current_density": self.saturation_point_current_density().to("A cm-2").value,
+                "spacing": spacing.decompose().value,
+                "thermal_voltage": thermal_voltage.to("V").value,
+                "contact_potential": self.contact_potential().to("V").value,
+                "output_voltage": self.output_voltage().to("V").value, }
 
 
     # Methods regarding critical and saturation points ---------------
@@ -176,25 +970,25 @@ class Langmuir(TECBase):
         """
         Normalization length for Langmuir solution
 
-        :param current_density: Current density in units of :math:`A cm^{-2}`.
+        :param current_density: Current density in units of :math:`A cm^{-2}`; may be an array.
         :returns: `astropy.units.Quantity` in units of :math:`\mu m`.
         :symbol: :math:`x_{0}`
         """
         # Coerce `current_density` to `astropy.units.Quantity`
         current_density = units.Quantity(current_density, "A cm-2")
 
-        if current_density < 0:
+        if np.any(current_density < 0):
             raise ValueError("current_density cannot be negative")
 
         prefactor = ((constants.eps0**2 * constants.k_B**3)/(2 * np.pi * constants.m_e * constants.e.si**2))**(1./4.)
 
-        if current_density == 0:
-            result = units.Quantity(np.inf, "um")
-        else:
+        # Zero current density gives an infinite normalization length.
+        with np.errstate(divide="ignore"):
             result = prefactor * self.emitter.temp**(3./4.) / current_density**(1./2.)
 
         return result.to("um")
 
+    @_operating_point
     def saturation_point_voltage(self):
         """
         Saturation point voltage
@@ -215,6 +1009,7 @@ class Langmuir(TECBase):
 
         return voltage.to("V")
 
+    @_operating_point
     def saturation_point_current_density(self):
         """
         Saturation point current density
@@ -224,6 +1019,7 @@ class Langmuir(TECBase):
         """
         return self.emitter.thermoelectron_current_density()
 
+    @_operating_point
     def critical_point_voltage(self):
         """
         Critical point voltage
@@ -243,6 +1039,7 @@ class Langmuir(TECBase):
 
         return voltage.to("V")
 
+    @_operating_point
     def critical_point_current_density(self):
         """
         Critical point current density
@@ -251,8 +1048,9 @@ class Langmuir(TECBase):
         :symbol: :math:`J_{R}`
         """
         # Rootfinder to get critical point output current density.
-        current_density_hi_limit = self.emitter.thermoelectron_current_density()
-        output_current_density = optimize.brentq(self.critical_point_target_function, current_density_hi_limit.value, 0)
+        params = self._target_params()
+        current_density_hi_limit = params["saturation_current_density"]
+        output_current_density = self._brentq(self._critical_point_target, current_density_hi_limit, 0, args=(params,))
         output_current_density = units.Quantity(output_current_density, "A cm-2")
 
         return output_current_density
@@ -263,17 +1061,28 @@ class Langmuir(TECBase):
 
         :returns: `float`.
         """
-        current_density = units.Quantity(current_density, "A cm-2")
+        current_density = units.Quantity(current_density, "A cm-2").value
+
+        return self._critical_point_target(current_density, self._target_params())
+
+    def _critical_point_target(self, current_density, params):
+        """
+        Kernel of :meth:`critical_point_target_function`.
+
+        :param float current_density: Current density in units of :math:`A cm^{-2}`.
+        :param dict params: As returned by :meth:`_target_params`.
+        """
+        if current_density < 0:
+            raise ValueError("current_density cannot be negative")
 
         # The prefix "dimensionless" is implied in the following
         # calculations.
-        position1 = -self.interelectrode_spacing() / self.normalization_length(current_density)
-        position1 = position1.value
+        position1 = -params["spacing"] * math.sqrt(current_density)
 
         if current_density == 0:
             motive = np.inf
         else:
-            motive = np.log(self.emitter.thermoelectron_current_density() / current_density)
+            motive = math.log(params["saturation_current_density"] / current_density)
 
         if motive < 0:
             raise ValueError("current_density greater than tec's emitter saturation current density")
@@ -284,6 +1093,7 @@ class Langmuir(TECBase):
 
         return difference
 
+    @_operating_point
     def operating_regime(self):
         """
         String describing regime of electron transport
@@ -303,6 +1113,7 @@ class Langmuir(TECBase):
 
 
     # Methods regarding motive ---------------------------------------
+    @_operating_point
     def max_motive(self):
         """
         Value of maximum motive relative to electrical ground
@@ -326,7 +1137,7 @@ class Langmuir(TECBase):
             if spcd == cpcd:
                 output_current_density = self.saturation_point_current_density()
             else:
-                output_current_density = optimize.brentq(self.output_voltage_target_function, spcd, cpcd)
+                output_current_density = self._brentq(self._output_voltage_target, spcd, cpcd, args=(self._target_params(),))
                 output_current_density = units.Quantity(output_current_density, "A cm-2")
 
             barrier = constants.k_B * self.emitter.temp * np.log(self.emitter.thermoelectron_current_density() / output_current_density)
@@ -339,25 +1150,196 @@ class Langmuir(TECBase):
         """
         Target function for the output voltage rootfinder.
         """
-        # For brevity, "dimensionless" prefix omitted from "position" and "motive" variable names.
-        current_density = units.Quantity(current_density, "A cm-2")
+        current_density = units.Quantity(current_density, "A cm-2").value
 
+        return self._output_voltage_target(current_density, self._target_params())
+
+    def _output_voltage_target(self, current_density, params):
+        """
+        Kernel of :meth:`output_voltage_target_function`.
 
-        # The `em_motive` calculation below could be broken into
-        # its own method because its used several places.
-        em_motive = np.log(self.emitter.thermoelectron_current_density() / current_density)
+        :param float current_density: Current density in units of :math:`A cm^{-2}`.
+        :param dict params: As returned by :meth:`_target_params`.
+        """
+        # For brevity, "dimensionless" prefix omitted from "position" and "motive" variable names.
+        em_motive = math.log(params["saturation_current_density"] / current_density)
         em_position = self._dps.position(em_motive)
 
-        normalization_length = self.normalization_length(current_density)
+        co_position = params["spacing"] * math.sqrt(current_density) + em_position
+        co_motive = self._dps.motive(co_position)
+
+        target_voltage = params["contact_potential"] + (em_motive - co_motive) * params["thermal_voltage"]
 
-        co_position = self.interelectrode_spacing() / normalization_length + em_position
+        difference = params["output_voltage"] - target_voltage
+
+        return difference
+
+
+    # Methods regarding the J-V curve ---------------------------------
+    def jv_curve(self, num_points=100, voltage_extension=1.):
+        """
+        Output current density vs. output voltage
+
+        :param int num_points: Number of points on each of the accelerating, space charge limited, and retarding branches.
+        :param voltage_extension: Extent of the accelerating and retarding branches beyond the saturation and critical points, respectively, in units of :math:`V`.
+        :returns: 2-tuple of `astropy.units.Quantity` arrays: output voltage in units of :math:`V` and output current density in units of :math:`A cm^{-2}`, in order of increasing voltage.
+
+        The curve is that of this object's electrodes with the output voltage swept; the voltages of the electrodes themselves are ignored. In the space charge limited regime, the current density is swept geometrically from the saturation point to the critical point and the voltage is computed from it in closed form, as in :meth:`output_voltage_target_function`, with vectorized calls to the solution of Langmuir's dimensionless Poisson's equation. No root is found beyond those of the saturation and critical points. The current density is that of the saturation point on the accelerating branch and decays exponentially with voltage on the retarding branch.
+        """
+        voltage_extension = units.Quantity(voltage_extension, "V")
+        kT = constants.k_B * self.emitter.temp
+
+        saturation_point_voltage = self.saturation_point_voltage()
+        saturation_point_current_density = self.saturation_point_current_density()
+        critical_point_voltage = self.critical_point_voltage()
+        critical_point_current_density = self.critical_point_current_density()
+
+        # Space charge limited branch. The prefix "dimensionless" is
+        # implied for position and motive.
+        current_density = np.logspace(np.log10(saturation_point_current_density.value), np.log10(critical_point_current_density.value), num_points)
+        # logspace doesn't reproduce its endpoints exactly; pin them so the
+        # emitter motive is not slightly negative at the saturation point.
+        # The critical point current density can exceed that of the
+        # saturation point by rounding when there is hardly any space
+        # charge.
+        current_density[0] = saturation_point_current_density.value
+        current_density[-1] = min(critical_point_current_density.value, saturation_point_current_density.value)
+        current_density = units.Quantity(current_density, "A cm-2")
+
+        em_motive = np.log(saturation_point_current_density / current_density).value
+        em_position = self._dps.position(em_motive)
+
+        co_position = (self.interelectrode_spacing() / self.normalization_length(current_density)).decompose().value + em_position
         co_motive = self._dps.motive(co_position)
 
-        target_voltage = ((self.emitter.barrier + em_motive * constants.k_B * self.emitter.temp) - (self.collector.barrier + co_motive * constants.k_B * self.emitter.temp)) / constants.e.si
+        voltage = (self.emitter.barrier - self.collector.barrier + (em_motive - co_motive) * kT) / constants.e.si
+
+        # Accelerating branch.
+        accelerating_voltage = saturation_point_voltage - voltage_extension * np.linspace(1, 0, num_points, endpoint=False)
+        accelerating_current_density = np.ones(num_points) * saturation_point_current_density
+
+        # Retarding branch.
+        retarding_voltage = critical_point_voltage + voltage_extension * np.linspace(0, 1, num_points + 1)[1:]
+        barrier = self.collector.barrier - self.emitter.barrier + constants.e.si * retarding_voltage
+        retarding_current_density = saturation_point_current_density * np.exp(-(barrier / kT).decompose())
+
+        output_voltage = units.Quantity(np.concatenate([accelerating_voltage.to("V").value, voltage.to("V").value, retarding_voltage.to("V").value]), "V")
+        output_current_density = units.Quantity(np.concatenate([accelerating_current_density.to("A cm-2").value, current_density.value, retarding_current_density.to("A cm-2").value]), "A cm-2")
+
+        return output_voltage, output_current_density
 
-        difference = self.output_voltage() - target_voltage
 
-        return difference.to("V").value
+    # Batched operating points ---------------------------------------
+    # Units of the electrode parameters accepted by `operating_points`
+    # and their defaults, as in `tec.electrode.Metal`.
+    _batch_units = {"temp": "K", "barrier": "eV", "richardson": "A/(cm2 K2)", "voltage": "V", "position": "um"}
+    _batch_defaults = {"richardson": 120, "voltage": 0, "position": 0}
+
+    @classmethod
+    def operating_points(cls, emitter, collector, interpolation="spline", accuracy=None, xtol=1e-12, maxiter=100):
+        """
+        Operating points of many devices at once
+
+        :param dict emitter: Emitter parameters; keys are the arguments of :class:`tec.electrode.Metal` ("temp", "barrier", "richardson", "voltage", "position") and values are numbers, numpy arrays, or `astropy.units.Quantity`. "richardson", "voltage" and "position" take the defaults of :class:`tec.electrode.Metal` if missing; other keys are ignored.
+        :param dict collector: Collector parameters; as `emitter`.
+        :param str interpolation: As the argument of :class:`Langmuir`.
+        :param accuracy: As the argument of :class:`Langmuir`.
+        :param float xtol: Absolute tolerance of the root finder on the dimensionless barrier, :math:`\ln (J_{S} / J)`.
+        :param int maxiter: Maximum number of iterations of the root finder.
+        :returns: Dictionary of arrays with the shape of the broadcast parameters.
+
+        All parameters are broadcast against each other, so e.g. a grid of emitter temperatures and output voltages can be given as a column and a row. The returned dictionary has the items "saturation_point_voltage", "saturation_point_current_density", "critical_point_voltage", "critical_point_current_density", "operating_regime", "max_motive" and "output_current_density", each an array of what the method of the same name returns for a single device, and "converged", a boolean array which is `False` for devices whose root finds did not converge in `maxiter` iterations (their values are NaN).
+
+        The critical points and the operating points of the devices in the space charge limited regime are each found with a single vectorized call to a bracketed root finder (Chandrupatla's method) rather than one call to `scipy.optimize.brentq` per device. The root finder works on the dimensionless barrier, which the current density depends on exponentially, so its tolerance is relative in current density. Results agree with those of :class:`Langmuir` to a relative tolerance of 1e-6 in current density and an absolute tolerance of 1e-7 V (or eV) in voltage and motive; the difference is dominated by the absolute tolerance of `scipy.optimize.brentq` on current density in the scalar path.
+        """
+        dps = DimensionlessLangmuirPoissonSoln.shared(interpolation, accuracy)
+
+        params = []
+        for electrode in [emitter, collector]:
+            for name in ["temp", "barrier", "richardson", "voltage", "position"]:
+                params.append(units.Quantity(electrode.get(name, cls._batch_defaults.get(name)), cls._batch_units[name]))
+        shape = np.broadcast(*params).shape
+        params = [units.Quantity(np.broadcast_to(param.value, shape).ravel(), param.unit) for param in params]
+        em_temp, em_barrier, em_richardson, em_voltage, em_position, co_temp, co_barrier, co_richardson, co_voltage, co_position = params
+
+        kT = constants.k_B * em_temp
+        em_motive = (em_barrier + constants.e.si * em_voltage).to("eV")
+        co_motive = (co_barrier + constants.e.si * co_voltage).to("eV")
+
+        # Saturation point. The prefix "dimensionless" is implied for
+        # position, motive and voltage.
+        with np.errstate(divide="ignore", over="ignore"):
+            exponent = (em_barrier / kT).decompose().value
+        saturation_point_current_density = (em_richardson * em_temp**2 * np.exp(-exponent)).to("A/cm2")
+
+        prefactor = ((constants.eps0**2 * constants.k_B**3)/(2 * np.pi * constants.m_e * constants.e.si**2))**(1./4.)
+        with np.errstate(divide="ignore"):
+            normalization_length = prefactor * em_temp**(3./4.) / saturation_point_current_density**(1./2.)
+        position = ((co_position - em_position) / normalization_length).decompose().value
+
+        saturation_motive = dps.motive(position)
+        saturation_point_voltage = ((em_barrier - co_barrier - saturation_motive * kT) / constants.e.si).to("V")
+
+        # Critical point: the barrier at which the collector is at the
+        # motive maximum, i.e. `critical_point_target_function`
+        # expressed in the barrier. The lhs position is bounded below
+        # by `lhs_singularity`, so the upper end of the bracket is
+        # where the normalized spacing is well below that.
+        def critical_point_target_function(barrier, indx):
+            return -position[indx] * np.exp(-barrier / 2) - dps.position(barrier)
+
+        hi = 2 * np.log(np.maximum(position, 1.)) + 20
+        critical_barrier, critical_converged = chandrupatla(critical_point_target_function, np.zeros_like(hi), hi, xtol=xtol, maxiter=maxiter)
+
+        critical_point_current_density = saturation_point_current_density * np.exp(-critical_barrier)
+        critical_point_voltage = ((em_barrier - co_barrier + critical_barrier * kT) / constants.e.si).to("V")
+
+        # Regimes.
+        output_voltage = (co_voltage - em_voltage).to("V")
+        accelerating = output_voltage < saturation_point_voltage
+        retarding = ~accelerating & (output_voltage > critical_point_voltage)
+        space_charge_limited = ~(accelerating | retarding)
+
+        # Space charge limited operating points: the barrier at which
+        # `output_voltage_target_function` vanishes.
+        voltage = ((constants.e.si * output_voltage - em_barrier + co_barrier) / kT).decompose().value
+        scl = np.flatnonzero(space_charge_limited)
+
+        def output_voltage_target_function(barrier, indx):
+            indx = scl[indx]
+            em_position = dps.position(barrier)
+            co_position = position[indx] * np.exp(-barrier / 2) + em_position
+            return voltage[indx] - barrier + dps.motive(co_position)
+
+        barrier = np.zeros_like(voltage)
+        converged = critical_converged.copy()
+        if scl.size:
+            scl_barrier, scl_converged = chandrupatla(output_voltage_target_function, np.zeros(scl.size), critical_barrier[scl], xtol=xtol, maxiter=maxiter)
+            # Devices at the saturation point have no bracket.
+            zero_width = critical_barrier[scl] == 0
+            scl_barrier[zero_width] = 0
+            barrier[scl] = scl_barrier
+            converged[scl] &= scl_converged | zero_width
+        barrier[~converged] = np.NaN
+
+        max_motive = np.where(accelerating, em_motive.value, np.where(retarding, co_motive.value, (barrier * kT).to("eV").value + em_motive.value))
+        max_motive = units.Quantity(max_motive, "eV")
+
+        output_barrier = np.where(space_charge_limited, barrier, ((max_motive - em_motive) / kT).decompose().value)
+        output_current_density = saturation_point_current_density * np.exp(-np.maximum(output_barrier, 0))
+
+        operating_regime = np.where(accelerating, "accelerating", np.where(retarding, "retarding", "space charge limited"))
+
+        result = {"saturation_point_voltage": saturation_point_voltage,
+                  "saturation_point_current_density": saturation_point_current_density,
+                  "critical_point_voltage": critical_point_voltage,
+                  "critical_point_current_density": critical_point_current_density,
+                  "operating_regime": operating_regime,
+                  "max_motive": max_motive,
+                  "output_current_density": output_current_density,
+                  "converged": converged, }
+
+        return dict((name, value.reshape(shape)) for name, value in result.items())
 
 
     # Methods regarding current and power -----------------------------
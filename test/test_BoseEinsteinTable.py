@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from scipy import integrate
+from tec.electrode import BoseEinsteinTable, Metal, SC
+import unittest
+
+
+def quadrature(order, reduced_energy):
+    """
+    Incomplete Bose-Einstein integral by adaptive quadrature
+    """
+    integrand = lambda t: t**order / np.expm1(t) if t > 0 else 0.
+    return integrate.quad(integrand, reduced_energy, np.inf, epsabs=0, epsrel=1e-13)[0]
+
+
+# Test classes
+# ============
+class Instantiation(unittest.TestCase):
+    """
+    Tests all aspects of instantiation
+    """
+    def test_tolerance(self):
+        """
+        BoseEinsteinTable instantiation requires the interpolation to meet the tolerance
+        """
+        self.assertRaises(ValueError, BoseEinsteinTable, 3, num_points=20)
+
+    def test_max_relative_error(self):
+        """
+        BoseEinsteinTable should store an error within the tolerance
+        """
+        for order in [2, 3]:
+            table = BoseEinsteinTable.shared(order)
+            self.assertLessEqual(table.max_relative_error, table.tolerance)
+
+    def test_shared(self):
+        """
+        BoseEinsteinTable.shared should return the same object for the same order
+        """
+        self.assertIs(BoseEinsteinTable.shared(2), BoseEinsteinTable.shared(2))
+        self.assertIsNot(BoseEinsteinTable.shared(2), BoseEinsteinTable.shared(3))
+
+
+class Values(unittest.TestCase):
+    """
+    Tests values of the interpolation
+    """
+    def test_complete_integral(self):
+        """
+        BoseEinsteinTable at zero should equal n! zeta(n + 1)
+        """
+        self.assertAlmostEqual(BoseEinsteinTable.shared(2)(0.) / (2 * 1.2020569031595942), 1, places=9)
+        self.assertAlmostEqual(BoseEinsteinTable.shared(3)(0.) / (np.pi**4 / 15), 1, places=9)
+
+    def test_quadrature(self):
+        """
+        BoseEinsteinTable should match quadrature within its tolerance
+        """
+        for order in [2, 3]:
+            table = BoseEinsteinTable.shared(order)
+            for reduced_energy in [1e-3, 0.37, 2.5, 11.1, 42.42, 150.]:
+                expected = quadrature(order, reduced_energy)
+                self.assertLess(abs(table(reduced_energy) / expected - 1), table.tolerance)
+
+    def test_shape(self):
+        """
+        BoseEinsteinTable should return an array of the shape of its argument
+        """
+        self.assertEqual(BoseEinsteinTable.shared(2)(np.ones((2, 3))).shape, (2, 3))
+
+    def test_outside(self):
+        """
+        BoseEinsteinTable should return NaN outside the table
+        """
+        values = BoseEinsteinTable.shared(2)(np.array([-1., 201., np.inf, np.nan]))
+        self.assertTrue(np.all(np.isnan(values)))
+
+
+class Electrodes(unittest.TestCase):
+    """
+    Tests electrode photon methods with and without the table
+    """
+    def assert_tabulated_matches(self, el):
+        """
+        Photon methods should agree with and without the table
+        """
+        tabulated = [el.photon_flux().value, el.photon_energy_flux().value]
+        el.tabulated_photon_flux = False
+        el._invalidate_memo()
+        untabulated = [el.photon_flux().value, el.photon_energy_flux().value]
+        # Precision of the table itself is tested against quadrature above.
+        np.testing.assert_allclose(tabulated, untabulated, rtol=1e-6)
+
+    def test_metal(self):
+        """
+        Metal photon methods should agree with and without the table
+        """
+        self.assert_tabulated_matches(Metal(temp=np.array([300., 1000., 1500.]), barrier=2., emissivity=0.5))
+
+    def test_sc(self):
+        """
+        SC photon methods should agree with and without the table
+        """
+        self.assert_tabulated_matches(SC(temp=1000., barrier=2., richardson=10., bandgap=np.array([0.5, 1.1, 2.]), emissivity=0.5))
+
+    def test_fallback(self):
+        """
+        SC photon methods should fall back outside the table
+        """
+        # The reduced bandgap at 50 K is about 255.
+        self.assert_tabulated_matches(SC(temp=50., barrier=2., richardson=10., bandgap=1.1, emissivity=0.5))
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from tec.electrode import Metal, SC, ElectrodeBatch
+from astropy import units
+import unittest
+import copy
+
+input_params = {"temp": np.array([300., 1000., 1500.]),
+                "barrier": 2.0,
+                "richardson": 10.,
+                "emissivity": 0.5, }
+
+sc_params = {"temp": 300.,
+             "barrier": 1.0,
+             "richardson": 100.0,
+             "bandgap": np.array([1.11, 1.42]), }
+
+
+# Base classes
+# ============
+class Base(unittest.TestCase):
+    """
+    Base class for tests
+
+    This class is intended to be subclassed so that the same `setUp` method does not have to be rewritten for each class containing tests.
+    """
+    def setUp(self):
+        """
+        Create an `ElectrodeBatch` of `Metal` electrodes
+        """
+        self.input_params = copy.copy(input_params)
+        self.batch = ElectrodeBatch(Metal, **input_params)
+
+
+# Test classes
+# ============
+class Instantiation(Base):
+    """
+    Tests all aspects of instantiation
+    """
+    def test_non_electrode_class(self):
+        """
+        ElectrodeBatch instantiation requires an electrode class
+        """
+        self.assertRaises(TypeError, ElectrodeBatch, dict, **self.input_params)
+
+    def test_missing_argument(self):
+        """
+        ElectrodeBatch instantiation requires arguments without defaults
+        """
+        del self.input_params["barrier"]
+        self.assertRaises(TypeError, ElectrodeBatch, Metal, **self.input_params)
+
+    def test_out_of_bounds(self):
+        """
+        ElectrodeBatch instantiation requires every element to satisfy constraints
+        """
+        self.input_params["emissivity"] = np.array([0.5, 1.5, 0.5])
+        self.assertRaises(ValueError, ElectrodeBatch, Metal, **self.input_params)
+
+    def test_columns(self):
+        """
+        Every column should be a contiguous float64 array
+        """
+        for name in ["temp", "barrier", "richardson", "voltage", "position", "emissivity"]:
+            column = self.batch._columns[name]
+            self.assertEqual(column.dtype, np.float64)
+            self.assertTrue(column.flags["C_CONTIGUOUS"])
+            self.assertEqual(column.shape, (3,))
+
+    def test_units(self):
+        """
+        Columns should be stored in the default unit of their attribute
+        """
+        batch = ElectrodeBatch(Metal, temp=1000., barrier=units.Quantity(2000., "meV"))
+        self.assertEqual(batch.barrier.unit, units.Unit("eV"))
+        self.assertAlmostEqual(batch.barrier[0].value, 2.)
+
+    def test_nbytes(self):
+        """
+        ElectrodeBatch should cost 8 bytes per attribute per electrode
+        """
+        self.assertEqual(self.batch.nbytes, 48 * 3)
+        self.assertEqual(ElectrodeBatch(SC, **sc_params).nbytes, 104 * 2)
+
+
+class Conversion(Base):
+    """
+    Tests conversion to and from electrode objects
+    """
+    def test_round_trip(self):
+        """
+        Converting to electrodes and back should preserve the columns
+        """
+        batch = ElectrodeBatch.from_electrodes(self.batch.to_electrodes())
+        for name, column in self.batch._columns.items():
+            np.testing.assert_array_equal(batch._columns[name], column)
+
+    def test_to_electrodes(self):
+        """
+        to_electrodes should return one electrode per row
+        """
+        electrodes = self.batch.to_electrodes()
+        self.assertEqual(len(electrodes), 3)
+        self.assertIsInstance(electrodes[1], Metal)
+        self.assertEqual(electrodes[1].temp, units.Quantity(1000., "K"))
+
+    def test_sc(self):
+        """
+        ElectrodeBatch should convert SC electrodes
+        """
+        batch = ElectrodeBatch(SC, **sc_params)
+        electrodes = batch.to_electrodes()
+        self.assertIsInstance(electrodes[0], SC)
+        self.assertEqual(ElectrodeBatch.from_electrodes(electrodes).electrode_class, SC)
+
+    def test_mixed_classes(self):
+        """
+        from_electrodes should raise TypeError with electrodes of different classes
+        """
+        electrodes = [Metal(temp=300., barrier=1.), SC(temp=300., barrier=1., richardson=10., bandgap=1.1)]
+        self.assertRaises(TypeError, ElectrodeBatch.from_electrodes, electrodes)
+
+
+class Indexing(Base):
+    """
+    Tests indexing, masking and concatenation
+    """
+    def test_integer(self):
+        """
+        Indexing with an integer should return an electrode
+        """
+        self.assertIsInstance(self.batch[0], Metal)
+
+    def test_slice(self):
+        """
+        Slicing should return an ElectrodeBatch
+        """
+        batch = self.batch[1:]
+        self.assertIsInstance(batch, ElectrodeBatch)
+        np.testing.assert_array_equal(batch.temp.value, [1000., 1500.])
+
+    def test_mask(self):
+        """
+        Masking should return an ElectrodeBatch
+        """
+        batch = self.batch[self.batch.temp.value > 500]
+        self.assertEqual(len(batch), 2)
+
+    def test_concatenate(self):
+        """
+        concatenate should join batches end to end
+        """
+        batch = ElectrodeBatch.concatenate([self.batch, self.batch[:1]])
+        np.testing.assert_array_equal(batch.temp.value, [300., 1000., 1500., 300.])
+
+    def test_concatenate_mixed_classes(self):
+        """
+        concatenate should raise TypeError with batches of different classes
+        """
+        self.assertRaises(TypeError, ElectrodeBatch.concatenate, [self.batch, ElectrodeBatch(SC, **sc_params)])
+
+
+class Methods(Base):
+    """
+    Tests batched counterparts of electrode methods
+    """
+    def test_methods(self):
+        """
+        Batched methods should match the methods of each electrode
+        """
+        electrodes = self.batch.to_electrodes()
+        for name in ["motive", "thermoelectron_current_density", "thermoelectron_energy_flux", "photon_flux", "photon_energy_flux"]:
+            expected = [getattr(electrode, name)().value for electrode in electrodes]
+            np.testing.assert_allclose(getattr(self.batch, name)().value, expected)
+
+    def test_electrode(self):
+        """
+        ElectrodeBatch.electrode should have read-only views of the columns as attributes
+        """
+        electrode = self.batch.electrode()
+        np.testing.assert_array_equal(electrode.temp.value, self.input_params["temp"])
+        with self.assertRaises(ValueError):
+            electrode.temp *= 2
+        np.testing.assert_array_equal(self.batch.temp.value, self.input_params["temp"])
+
+    def test_unknown_attribute(self):
+        """
+        ElectrodeBatch should raise AttributeError for unknown attributes
+        """
+        self.assertRaises(AttributeError, getattr, self.batch, "not_an_attribute")
+
+    def test_not_batched(self):
+        """
+        ElectrodeBatch should not batch classmethods or the storage methods of the electrode class
+        """
+        for name in ["from_dict", "schema", "_from_validated", "_invalidate_memo"]:
+            self.assertRaises(AttributeError, getattr, self.batch, name)
+
+    def test_replace(self):
+        """
+        ElectrodeBatch.replace should return a batch with the given columns changed
+        """
+        batch = self.batch.replace(barrier=2.5)
+        self.assertIsInstance(batch, ElectrodeBatch)
+        np.testing.assert_array_equal(batch.barrier.value, [2.5, 2.5, 2.5])
+        np.testing.assert_array_equal(batch.temp.value, self.batch.temp.value)
+        np.testing.assert_array_equal(self.batch.barrier.value, [2., 2., 2.])
+        self.assertRaises(TypeError, self.batch.replace, not_an_attribute=1)
+        self.assertRaises(ValueError, self.batch.replace, emissivity=2)
+
+
+class Records(unittest.TestCase):
+    """
+    Tests construction from records
+    """
+    def setUp(self):
+        """
+        Create records of `Metal` attributes
+        """
+        self.records = [{"temp": 300., "barrier": 2.0, "richardson": 10.},
+                        {"temp": 1000., "barrier": 2.5, "emissivity": 0.5},
+                        {"temp": 1500., "barrier": 3.0, "unused": "ignored"}, ]
+
+    def test_dicts(self):
+        """
+        from_records should accept a sequence of dictionaries
+        """
+        batch = ElectrodeBatch.from_records(Metal, self.records)
+        np.testing.assert_array_equal(batch.temp.value, [300., 1000., 1500.])
+        np.testing.assert_array_equal(batch.richardson.value, [10., 120., 120.])
+
+    def test_structured_array(self):
+        """
+        from_records should accept a structured array
+        """
+        records = np.array([(300., 2.), (1000., 2.5)], dtype=[("temp", float), ("barrier", float)])
+        batch = ElectrodeBatch.from_records(Metal, records)
+        np.testing.assert_array_equal(batch.barrier.value, [2., 2.5])
+        np.testing.assert_array_equal(batch.emissivity.value, [0., 0.])
+
+    def test_matches_from_dict(self):
+        """
+        Metal.from_records should match Metal.from_dict
+        """
+        electrodes = Metal.from_records(self.records)
+        for electrode, record in zip(electrodes, self.records):
+            self.assertEqual(dict(electrode), dict(Metal.from_dict(record)))
+
+    def test_batch(self):
+        """
+        Metal.from_records should return an ElectrodeBatch on request
+        """
+        self.assertIsInstance(Metal.from_records(self.records, batch=True), ElectrodeBatch)
+
+    def test_sc_defaults(self):
+        """
+        SC.from_records should take defaults which are Quantities
+        """
+        electrodes = SC.from_records([{"temp": 300., "barrier": 1., "richardson": 10., "bandgap": 1.1}])
+        self.assertEqual(electrodes[0].electron_effective_mass.unit, units.Unit("kg"))
+
+    def test_methods(self):
+        """
+        Electrodes from records should be usable like constructed ones
+        """
+        electrode = Metal.from_records(self.records)[1]
+        self.assertEqual(electrode.thermoelectron_current_density(), Metal.from_dict(self.records[1]).thermoelectron_current_density())
+        electrode.temp = 1200
+        self.assertEqual(electrode.temp, units.Quantity(1200, "K"))
+
+    def test_missing(self):
+        """
+        from_records should name the row missing a column
+        """
+        del self.records[2]["barrier"]
+        with self.assertRaisesRegexp(TypeError, "Row 2 is missing column 'barrier'"):
+            ElectrodeBatch.from_records(Metal, self.records)
+
+    def test_out_of_bounds(self):
+        """
+        from_records should name the row and column out of bounds
+        """
+        self.records[1]["emissivity"] = 1.5
+        with self.assertRaisesRegexp(ValueError, "Row 1, column 'emissivity'"):
+            ElectrodeBatch.from_records(Metal, self.records)
+
+    def test_non_numeric(self):
+        """
+        from_records should name the row and column which isn't numeric
+        """
+        self.records[2]["temp"] = "this string is non-numeric."
+        with self.assertRaisesRegexp(TypeError, "Row 2, column 'temp'"):
+            ElectrodeBatch.from_records(Metal, self.records)
+
+    def test_empty(self):
+        """
+        from_records should raise ValueError for no records
+        """
+        self.assertRaises(ValueError, ElectrodeBatch.from_records, Metal, [])
+
+    def test_to_records(self):
+        """
+        to_records should invert from_records
+        """
+        batch = ElectrodeBatch.from_records(Metal, self.records)
+        records = batch.to_records()
+        self.assertEqual(records.dtype.names, tuple(name for name, _ in Metal.schema()))
+        for name, column in ElectrodeBatch.from_records(Metal, records)._columns.items():
+            np.testing.assert_array_equal(column, batch._columns[name])
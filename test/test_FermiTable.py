@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import numpy as np
+from tec.electrode import FermiTable, SC
+import unittest
+
+# Values for Si taken from Streetman & Banerjee 9780130255389.
+input_params = {"temp": 300.,
+                "barrier": 1.0,
+                "richardson": 100.0,
+                "electron_effective_mass": 9.84e-31,
+                "hole_effective_mass": 7.38e-31,
+                "acceptor_concentration": 1e16,
+                "acceptor_ionization_energy": 45.,
+                "bandgap": 1.11}
+
+
+# Base classes
+# ============
+class Base(unittest.TestCase):
+    """
+    Base class for tests
+
+    This class is intended to be subclassed so that the same `setUp` method does not have to be rewritten for each class containing tests.
+    """
+    def setUp(self):
+        """
+        Get the shared `FermiTable` of an `SC`
+        """
+        self.el = SC(**input_params)
+        self.table = FermiTable.shared(self.el)
+
+    def exact(self, temp, acceptor_concentration):
+        """
+        Fermi energy of `SC` objects with the given temperatures and acceptor concentrations
+        """
+        return SC(**dict(input_params, temp=temp, acceptor_concentration=acceptor_concentration)).fermi_energy().value
+
+
+# Test classes
+# ============
+class Instantiation(Base):
+    """
+    Tests all aspects of instantiation
+    """
+    def test_max_error(self):
+        """
+        FermiTable should cover the whole table for Si within its tolerance
+        """
+        self.assertTrue(self.table.covered_cells.all())
+        self.assertLessEqual(self.table.max_error, self.table.tolerance)
+
+    def test_key(self):
+        """
+        FermiTable.key should hold the parameters in the default units of SC
+        """
+        self.assertEqual(self.table.key, (1.11, 9.84e-31, 7.38e-31, 45.))
+
+    def test_shared(self):
+        """
+        FermiTable.shared should return the same object for the same parameters
+        """
+        self.assertIs(FermiTable.shared(self.el.replace(temp=600., acceptor_concentration=1e18)), self.table)
+        self.assertIsNot(FermiTable.shared(self.el.replace(bandgap=1.2)), self.table)
+
+    def test_max_points(self):
+        """
+        FermiTable should not cover cells which are not within its tolerance after refinement
+        """
+        table = FermiTable(1.11, 9.84e-31, 7.38e-31, 45., num_points=33, max_points=33)
+        self.assertEqual(table.log_temp.size, 33)
+        self.assertTrue(table.covered_cells.any())
+        self.assertFalse(table.covered_cells.all())
+        self.assertLessEqual(table.max_error, table.tolerance)
+
+        rs = np.random.RandomState(1)
+        temp = rs.uniform(200., 2000., 500)
+        acceptor_concentration = 10**rs.uniform(10, 20, 500)
+        covered = table.covered(temp, acceptor_concentration)
+        error = np.abs(table(temp, acceptor_concentration) - self.exact(temp, acceptor_concentration))
+        self.assertLess(np.max(error[covered]), table.tolerance)
+        self.assertLess(np.max(error[~covered]), 1e-11)
+
+    def test_non_scalar(self):
+        """
+        FermiTable instantiation requires scalar parameters
+        """
+        self.assertRaises(TypeError, FermiTable.from_electrode, self.el.replace(bandgap=[1.1, 1.2]))
+        self.assertRaises(TypeError, FermiTable.from_electrode, {})
+
+    def test_ranges(self):
+        """
+        FermiTable instantiation requires increasing, positive ranges
+        """
+        self.assertRaises(ValueError, FermiTable, 1.11, 9.84e-31, 7.38e-31, 45., temp_range=(2000., 200.))
+        self.assertRaises(ValueError, FermiTable, 1.11, 9.84e-31, 7.38e-31, 45., acceptor_concentration_range=(0, 1e20))
+
+
+class Values(Base):
+    """
+    Tests values of the interpolation
+    """
+    def test_exact(self):
+        """
+        FermiTable should match SC.fermi_energy within its tolerance
+        """
+        rs = np.random.RandomState(0)
+        temp = rs.uniform(200., 2000., 500)
+        acceptor_concentration = 10**rs.uniform(10, 20, 500)
+        error = np.abs(self.table(temp, acceptor_concentration) - self.exact(temp, acceptor_concentration))
+        self.assertLess(np.max(error), self.table.tolerance)
+
+    def test_shape(self):
+        """
+        FermiTable should return an array of the broadcast shape of its arguments
+        """
+        self.assertEqual(self.table(np.ones((2, 1)) * 300., np.ones(3) * 1e16).shape, (2, 3))
+        self.assertEqual(self.table(300., 1e16).shape, ())
+
+    def test_outside(self):
+        """
+        FermiTable should solve exactly outside the table
+        """
+        temp = np.array([100., 300., 3000.])
+        acceptor_concentration = np.array([1e16, 1e21, 1e16])
+        self.assertFalse(self.table.covered(temp, acceptor_concentration).any())
+        np.testing.assert_allclose(self.table(temp, acceptor_concentration), self.exact(temp, acceptor_concentration), rtol=0, atol=1e-11)
+
+    def test_unsolvable(self):
+        """
+        FermiTable should return NaN where charge neutrality can't be satisfied within the bandgap
+        """
+        table = FermiTable.shared(self.el.replace(acceptor_ionization_energy=0))
+        self.assertTrue(np.isnan(table(300., 1e22)))
+        self.assertFalse(table.covered(300., 1e22))
+
+
+class Serialization(Base):
+    """
+    Tests saving and loading of tables
+    """
+    def setUp(self):
+        """
+        Get the shared `FermiTable` of an `SC` and a temporary directory
+        """
+        Base.setUp(self)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """
+        A loaded FermiTable should have the same key and values
+        """
+        filename = os.path.join(self.directory, "si.npz")
+        self.table.save(filename)
+        table = FermiTable.load(filename)
+
+        self.assertEqual(table.key, self.table.key)
+        self.assertEqual(table.max_error, self.table.max_error)
+        np.testing.assert_array_equal(table.cell_error, self.table.cell_error)
+
+        temp = np.linspace(150., 2500., 11)[:, np.newaxis]
+        acceptor_concentration = np.logspace(9, 21, 13)
+        np.testing.assert_array_equal(table(temp, acceptor_concentration), self.table(temp, acceptor_concentration))
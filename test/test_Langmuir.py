@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pickle
 from astropy import units
 import unittest
 from tec.electrode import Metal
 from tec.models import Langmuir
+from tec.models.langmuir import DimensionlessLangmuirPoissonSoln, TABULATION_FILENAME
 
 em_params = {"temp": 1000.,
              "barrier": 2.,
@@ -78,6 +80,35 @@ class Instantiation(Base):
         except TypeError:
             self.fail("Instantiation failed with additional arbitrary args")
 
+    def test_dps_shared(self):
+        """
+        Langmuir objects share one DimensionlessLangmuirPoissonSoln by default
+        """
+        el = Langmuir(em, co)
+        self.assertIs(el._dps, self.t._dps)
+
+    def test_dps_private(self):
+        """
+        Langmuir instantiated with shared_dps=False has a private DimensionlessLangmuirPoissonSoln
+        """
+        el = Langmuir(em, co, shared_dps=False)
+        self.assertIsNot(el._dps, self.t._dps)
+
+    def test_shared_dps_read_only(self):
+        """
+        Shared DimensionlessLangmuirPoissonSoln should raise TypeError when modified
+        """
+        self.assertRaises(TypeError, self.t._dps.__setitem__, "lhs", None)
+
+    def test_shared_dps_branches_read_only(self):
+        """
+        The branches of the shared DimensionlessLangmuirPoissonSoln should raise TypeError when modified
+        """
+        for branch in ["lhs", "rhs"]:
+            self.assertRaises(TypeError, self.t._dps[branch].__setitem__, "motive_v_position", None)
+            self.assertRaises(TypeError, self.t._dps[branch].pop, "motive_v_position")
+            self.assertIn("motive_v_position", self.t._dps[branch])
+
 
 class MethodsInput(Base):
     """
@@ -310,4 +341,508 @@ class MethodsReturnValues(Base):
         try:
             l.max_motive()
         except ValueError:
-            self.fail("Issue #155 not resolved")
\ No newline at end of file
+            self.fail("Issue #155 not resolved")
+
+class TargetFunctionKernels(Base):
+    """
+    Tests the plain-float kernels beneath the target functions
+    """
+    def test_critical_point_target(self):
+        """
+        _critical_point_target should agree with the unit-carrying computation
+        """
+        current_density = self.t.critical_point_current_density().value / 2
+        position1 = (-self.t.interelectrode_spacing() / self.t.normalization_length(current_density)).decompose().value
+        motive = np.log(self.em.thermoelectron_current_density().value / current_density)
+        expected = position1 - self.t._dps.position(motive)
+        self.assertAlmostEqual(self.t._critical_point_target(current_density, self.t._target_params()), expected, places=10)
+
+    def test_output_voltage_target(self):
+        """
+        output_voltage_target_function should vanish at the space charge limited operating point
+        """
+        current_density = self.t_scl.output_current_density().value
+        self.assertAlmostEqual(self.t_scl.output_voltage_target_function(current_density), 0, places=8)
+
+
+class OperatingPointCache(Base):
+    """
+    Tests caching of the operating point
+    """
+    def test_efficiency_root_solves(self):
+        """
+        efficiency in the space charge limited regime should cost two root solves
+        """
+        self.t_scl.efficiency()
+        self.assertEqual(self.t_scl.root_solves, 2)
+
+    def test_cached(self):
+        """
+        Repeated calls should not solve for the operating point again
+        """
+        self.t_scl.efficiency()
+        root_solves = self.t_scl.root_solves
+        self.t_scl.efficiency()
+        self.t_scl.max_motive()
+        self.assertEqual(self.t_scl.root_solves, root_solves)
+
+    def test_read_only(self):
+        """
+        Modifying a cached value in place should raise and leave the cache intact
+        """
+        max_motive = self.t_scl.max_motive()
+        expected = max_motive.copy()
+        with self.assertRaises(ValueError):
+            max_motive += units.Quantity(1., "eV")
+        self.assertEqual(self.t_scl.max_motive(), expected)
+
+    def test_invalidated_by_electrode(self):
+        """
+        Changing an electrode attribute should invalidate the cache
+        """
+        co_scl = Metal(**co_params)
+        co_scl.voltage = self.t_scl.collector.voltage
+        t = Langmuir(em, co_scl)
+
+        max_motive = t.max_motive()
+        co_scl.voltage = self.t_ret.collector.voltage
+        self.assertEqual(t.operating_regime(), "retarding")
+        self.assertNotEqual(t.max_motive(), max_motive)
+
+    def test_array_electrode(self):
+        """
+        Langmuir should raise TypeError for electrodes with array attributes
+        """
+        emitter = Metal(temp=np.array([1000., 1100.]), barrier=2., richardson=10.)
+        t = Langmuir(emitter, co)
+        self.assertRaises(TypeError, t.max_motive)
+
+    def test_invalidated_by_assignment(self):
+        """
+        Assigning an electrode attribute, even to the same value, should invalidate the cache
+        """
+        co_scl = Metal(**co_params)
+        co_scl.voltage = self.t_scl.collector.voltage
+        t = Langmuir(em, co_scl)
+        t.max_motive()
+        root_solves = t.root_solves
+        co_scl.voltage = co_scl.voltage
+        t.max_motive()
+        self.assertGreater(t.root_solves, root_solves)
+
+    def test_invalidated_by_replacing_electrode(self):
+        """
+        Replacing an electrode should invalidate the cache
+        """
+        t = Langmuir(em, self.t_scl.collector)
+        t.max_motive()
+        t.collector = self.t_accel.collector
+        self.assertEqual(t.operating_regime(), "accelerating")
+
+
+class Pickling(Base):
+    """
+    Tests pickling of Langmuir objects
+    """
+    def test_round_trip(self):
+        """
+        An unpickled Langmuir should give the same values
+        """
+        t = pickle.loads(pickle.dumps(self.t_scl, 2))
+        self.assertEqual(t.output_voltage(), self.t_scl.output_voltage())
+        self.assertEqual(t.output_current_density(), self.t_scl.output_current_density())
+
+    def test_shared_solution(self):
+        """
+        An unpickled Langmuir should reattach the shared solution
+        """
+        t = pickle.loads(pickle.dumps(self.t, 2))
+        self.assertIs(t._dps, self.t._dps)
+
+    def test_private_solution(self):
+        """
+        An unpickled Langmuir with a private solution should have its own
+        """
+        t = Langmuir(em, co, shared_dps=False, accuracy="fast")
+        unpickled = pickle.loads(pickle.dumps(t, 2))
+        self.assertIsNot(unpickled._dps, t._dps)
+        self.assertEqual(unpickled._dps_args, (False, "spline", "fast"))
+
+    def test_size(self):
+        """
+        A pickled Langmuir shouldn't contain the solution
+        """
+        self.assertLess(len(pickle.dumps(self.t, 2)), 1000)
+
+
+class JVCurve(Base):
+    """
+    Tests the J-V curve computed by jv_curve
+    """
+    def setUp(self):
+        Base.setUp(self)
+        self.voltage, self.current_density = self.t.jv_curve()
+
+    def test_units(self):
+        """
+        jv_curve should return voltage in V and current density in A cm^-2
+        """
+        self.assertEqual(self.voltage.unit, units.Unit("V"))
+        self.assertEqual(self.current_density.unit, units.Unit("A cm-2"))
+
+    def test_shape(self):
+        """
+        jv_curve should return num_points points on each branch
+        """
+        voltage, current_density = self.t.jv_curve(num_points=10)
+        self.assertEqual(voltage.shape, (30,))
+        self.assertEqual(current_density.shape, (30,))
+
+    def test_voltage_increasing(self):
+        """
+        jv_curve voltage should be increasing
+        """
+        self.assertTrue(np.all(np.diff(self.voltage.value) > 0))
+
+    def test_output_current_density(self):
+        """
+        jv_curve should agree with output_current_density in each regime
+        """
+        for t in [self.t_accel, self.t_scl, self.t_ret]:
+            current_density = np.interp(t.output_voltage().value, self.voltage.value, self.current_density.value)
+            self.assertAlmostEqual(current_density / t.output_current_density().value, 1., places=5)
+
+    def test_devices(self):
+        """
+        jv_curve should be finite and monotonic for a range of devices
+        """
+        for em_temp in [800., 1000., 1500., 2000.]:
+            for co_barrier in [0.5, 0.9, 1., 1.3]:
+                for spacing in [1., 10., 100.]:
+                    emitter = Metal(temp=em_temp, barrier=2., richardson=10.)
+                    collector = Metal(temp=300., barrier=co_barrier, richardson=10., position=spacing)
+                    voltage, current_density = Langmuir(emitter, collector).jv_curve(num_points=20)
+
+                    self.assertFalse(np.isnan(voltage.value).any())
+                    self.assertFalse(np.isnan(current_density.value).any())
+                    # The space charge limited branch degenerates to a point,
+                    # up to rounding, for devices whose current is too small
+                    # to form a space charge.
+                    self.assertTrue(np.all(np.diff(voltage.value) > -1e-12))
+                    self.assertTrue(np.all(np.diff(current_density.value) <= 1e-12 * current_density.value[1:]))
+
+
+class OperatingPoints(Base):
+    """
+    Tests the batched operating points computed by Langmuir.operating_points
+    """
+    def setUp(self):
+        Base.setUp(self)
+        self.ts = [self.t_accel, self.t_scl, self.t_ret]
+
+        collector = dict(co_params)
+        collector["voltage"] = units.Quantity([t.collector.voltage.value for t in self.ts], "V")
+        self.points = Langmuir.operating_points(em_params, collector)
+
+    def test_converged(self):
+        """
+        operating_points should converge for every device
+        """
+        self.assertTrue(self.points["converged"].all())
+
+    def test_operating_regime(self):
+        """
+        operating_points should agree with operating_regime
+        """
+        self.assertEqual(list(self.points["operating_regime"]), [t.operating_regime() for t in self.ts])
+
+    def test_current_density(self):
+        """
+        operating_points current densities should agree with the scalar methods
+        """
+        for name in ["saturation_point_current_density", "critical_point_current_density", "output_current_density"]:
+            expected = [getattr(t, name)().value for t in self.ts]
+            np.testing.assert_allclose(self.points[name].value, expected, rtol=1e-6)
+
+    def test_voltage(self):
+        """
+        operating_points voltages and motives should agree with the scalar methods
+        """
+        for name in ["saturation_point_voltage", "critical_point_voltage", "max_motive"]:
+            expected = [getattr(t, name)().value for t in self.ts]
+            np.testing.assert_allclose(self.points[name].value, expected, rtol=0, atol=1e-7)
+
+    def test_broadcast(self):
+        """
+        operating_points should broadcast its parameters
+        """
+        emitter = dict(em_params)
+        emitter["temp"] = np.array([[900.], [1000.], [1100.]])
+        collector = dict(co_params)
+        collector["voltage"] = np.linspace(0, 2, 4)
+        points = Langmuir.operating_points(emitter, collector)
+        self.assertEqual(points["max_motive"].shape, (3, 4))
+
+
+class Tabulation(unittest.TestCase):
+    """
+    Tests the tabulated DimensionlessLangmuirPoissonSoln shipped with the package
+    """
+    def setUp(self):
+        self.dps = DimensionlessLangmuirPoissonSoln(tabulation=TABULATION_FILENAME)
+
+    def test_shared_uses_tabulation(self):
+        """
+        DimensionlessLangmuirPoissonSoln.shared should be loaded from the tabulation
+        """
+        spl = DimensionlessLangmuirPoissonSoln.shared()["rhs"]["motive_v_position"]
+        self.assertIsInstance(spl.tck[0], np.memmap)
+
+    def test_tabulation_error(self):
+        """
+        Tabulation should agree with the ode solver
+        """
+        for branch, errors in self.dps.tabulation_error().items():
+            self.assertLess(errors["motive_v_position"], 1e-4)
+            self.assertLess(errors["position_v_motive"], 1e-4)
+
+    def test_tabulation_matches_solution(self):
+        """
+        Tabulation should agree with the solution computed at instantiation
+        """
+        dps = DimensionlessLangmuirPoissonSoln()
+        for motive in [0.1, 1., 10.]:
+            self.assertAlmostEqual(self.dps.position(motive), dps.position(motive), places=3)
+        for position in [-2., -1., 1., 10., 50.]:
+            self.assertAlmostEqual(self.dps.motive(position), dps.motive(position), places=3)
+
+
+class DimensionlessLangmuirPoissonSolnArrays(unittest.TestCase):
+    """
+    Tests DimensionlessLangmuirPoissonSoln methods with array arguments
+    """
+    def setUp(self):
+        self.dps = DimensionlessLangmuirPoissonSoln.shared()
+
+    def test_position_lhs(self):
+        """
+        position with array argument should match scalar calls on the lhs, including NaN and clamping
+        """
+        motive = np.array([-1., 0., 0.5, 5., 18.6, 18.8, 30.])
+        expected = np.array([self.dps.position(val, "lhs") for val in motive], dtype=float)
+        np.testing.assert_array_equal(self.dps.position(motive, "lhs"), expected)
+
+    def test_position_rhs(self):
+        """
+        position with array argument should match scalar calls on the rhs
+        """
+        motive = np.array([-1., 0., 0.5, 5., 18.6, 18.8, 30.])
+        expected = np.array([self.dps.position(val, "rhs") for val in motive], dtype=float)
+        np.testing.assert_array_equal(self.dps.position(motive, "rhs"), expected)
+
+    def test_motive(self):
+        """
+        motive with array argument should match scalar calls, including NaN
+        """
+        position = np.array([-3., -2.55389, -1., 0., 1e-9, 5., 100., 150.])
+        expected = np.array([self.dps.motive(val) for val in position], dtype=float)
+        np.testing.assert_array_equal(self.dps.motive(position), expected)
+
+    def test_motive_single_branch(self):
+        """
+        motive should accept arrays which lie entirely on one branch
+        """
+        position = np.array([1., 2., 3.])
+        expected = np.array([self.dps.motive(val) for val in position], dtype=float)
+        np.testing.assert_array_equal(self.dps.motive(position), expected)
+
+    def test_motive_shape(self):
+        """
+        motive should preserve the shape of its array argument
+        """
+        position = np.linspace(-2, 10, 12).reshape(3, 4)
+        self.assertEqual(self.dps.motive(position).shape, (3, 4))
+
+
+class HermiteInterpolation(unittest.TestCase):
+    """
+    Tests DimensionlessLangmuirPoissonSoln with "hermite" interpolation
+    """
+    def setUp(self):
+        self.dps = DimensionlessLangmuirPoissonSoln.shared("hermite")
+
+    def test_invalid_interpolation(self):
+        """
+        DimensionlessLangmuirPoissonSoln should raise ValueError with unknown interpolation
+        """
+        self.assertRaises(ValueError, DimensionlessLangmuirPoissonSoln, TABULATION_FILENAME, "not an interpolation")
+
+    def test_langmuir_interpolation(self):
+        """
+        Langmuir instantiated with interpolation="hermite" should use the shared hermite solution
+        """
+        el = Langmuir(em, co, interpolation="hermite")
+        self.assertIs(el._dps, self.dps)
+
+    def test_max_difference(self):
+        """
+        Hermite interpolation should agree with spline interpolation
+        """
+        differences = self.dps.max_difference(DimensionlessLangmuirPoissonSoln.shared())
+        for branch in ["lhs", "rhs"]:
+            self.assertLess(differences[branch]["position_v_motive"], 1e-4)
+        self.assertLess(differences["rhs"]["motive_v_position"], 1e-4)
+        # The lhs diverges at its endpoint.
+        self.assertLess(differences["lhs"]["motive_v_position"], 0.1)
+
+    def test_tabulation_error(self):
+        """
+        Hermite interpolation should agree with the ode solver
+        """
+        for branch, errors in self.dps.tabulation_error().items():
+            self.assertLess(errors["motive_v_position"], 1e-4)
+            self.assertLess(errors["position_v_motive"], 1e-4)
+
+    def test_position_array(self):
+        """
+        position with array argument should match scalar calls
+        """
+        motive = np.array([-1., 0., 0.5, 5., 18.6, 18.8])
+        expected = np.array([self.dps.position(val) for val in motive], dtype=float)
+        np.testing.assert_allclose(self.dps.position(motive), expected, rtol=1e-12)
+
+    def test_motive_array(self):
+        """
+        motive with array argument should match scalar calls
+        """
+        position = np.array([-3., -2.5, -1., 0., 1., 50.])
+        expected = np.array([self.dps.motive(val) for val in position], dtype=float)
+        np.testing.assert_allclose(self.dps.motive(position), expected, rtol=1e-12)
+
+
+class AsymptoticSolution(unittest.TestCase):
+    """
+    Tests DimensionlessLangmuirPoissonSoln beyond the interpolated region
+    """
+    def setUp(self):
+        self.dps = DimensionlessLangmuirPoissonSoln.shared()
+
+    def test_asymptotic_position_lhs(self):
+        """
+        asymptotic_position should agree with quadrature on the lhs
+        """
+        for motive in [12., 20.]:
+            self.assertAlmostEqual(self.dps.asymptotic_position(motive, "lhs"), self.dps.quadrature_position(motive, "lhs"), places=6)
+
+    def test_asymptotic_position_rhs(self):
+        """
+        asymptotic_position should agree with quadrature on the rhs
+        """
+        for motive in [300., 1e4]:
+            self.assertAlmostEqual(self.dps.asymptotic_position(motive, "rhs"), self.dps.quadrature_position(motive, "rhs"), places=5)
+
+    def test_asymptotic_motive(self):
+        """
+        asymptotic_motive should invert asymptotic_position
+        """
+        for motive, branch in [(12., "lhs"), (300., "rhs")]:
+            position = self.dps.asymptotic_position(motive, branch)
+            self.assertAlmostEqual(self.dps.asymptotic_motive(position) / motive, 1., places=6)
+
+    def test_position_infinite_motive(self):
+        """
+        position of infinite motive on the lhs should be the singularity
+        """
+        self.assertEqual(self.dps.position(np.inf, "lhs"), self.dps.lhs_singularity)
+
+    def test_motive_beyond_singularity(self):
+        """
+        motive should be NaN for positions left of the lhs singularity
+        """
+        self.assertTrue(np.isnan(self.dps.motive(self.dps.lhs_singularity - 1e-3)))
+
+    def test_rhs_tabulation(self):
+        """
+        position should agree with quadrature near the end of the rhs tabulation
+        """
+        for motive in [50., 90.]:
+            self.assertAlmostEqual(self.dps.position(motive, "rhs"), self.dps.quadrature_position(motive, "rhs"), places=5)
+
+    def test_blend_continuity(self):
+        """
+        position should agree with quadrature across the blend windows
+        """
+        for branch, (lo, hi) in self.dps.motive_blend.items():
+            for motive in np.linspace(lo - 1, hi + 1, 7):
+                self.assertAlmostEqual(self.dps.position(motive, branch), self.dps.quadrature_position(motive, branch), places=5)
+
+
+class AccuracyPresets(unittest.TestCase):
+    """
+    Tests DimensionlessLangmuirPoissonSoln constructed with an adaptive integrator
+    """
+    def test_invalid_accuracy(self):
+        """
+        DimensionlessLangmuirPoissonSoln should raise ValueError with unknown accuracy preset
+        """
+        self.assertRaises(ValueError, DimensionlessLangmuirPoissonSoln, accuracy="not a preset")
+
+    def test_invalid_accuracy_dict(self):
+        """
+        DimensionlessLangmuirPoissonSoln should raise ValueError with an accuracy dictionary missing keys
+        """
+        self.assertRaises(ValueError, DimensionlessLangmuirPoissonSoln, accuracy={"rtol": 1e-5})
+
+    def test_unicode_accuracy(self):
+        """
+        DimensionlessLangmuirPoissonSoln.shared should accept the name of a preset as unicode
+        """
+        self.assertIs(DimensionlessLangmuirPoissonSoln.shared(accuracy=u"fast"), DimensionlessLangmuirPoissonSoln.shared(accuracy="fast"))
+
+    def test_dict_accuracy(self):
+        """
+        Langmuir instantiated with an accuracy dictionary should share the solution of those tolerances
+        """
+        accuracy = {"rtol": 1e-5, "atol": 1e-8, "subdivisions": 3}
+        el = Langmuir(em, co, accuracy=accuracy)
+        self.assertIs(el._dps, DimensionlessLangmuirPoissonSoln.shared(accuracy=dict(accuracy)))
+        self.assertIs(DimensionlessLangmuirPoissonSoln.shared(accuracy=dict(DimensionlessLangmuirPoissonSoln.accuracy_presets["fast"])), DimensionlessLangmuirPoissonSoln.shared(accuracy="fast"))
+        self.assertAlmostEqual(el.output_current_density().value, Langmuir(em, co).output_current_density().value, places=4)
+
+    def test_tabulation_and_accuracy(self):
+        """
+        DimensionlessLangmuirPoissonSoln should raise ValueError with both tabulation and accuracy
+        """
+        self.assertRaises(ValueError, DimensionlessLangmuirPoissonSoln, TABULATION_FILENAME, accuracy="fast")
+
+    def test_shared(self):
+        """
+        DimensionlessLangmuirPoissonSoln.shared should return one object per accuracy preset
+        """
+        dps = DimensionlessLangmuirPoissonSoln.shared(accuracy="fast")
+        self.assertIs(DimensionlessLangmuirPoissonSoln.shared(accuracy="fast"), dps)
+        self.assertIsNot(DimensionlessLangmuirPoissonSoln.shared(), dps)
+
+    def test_langmuir_accuracy(self):
+        """
+        Langmuir instantiated with accuracy should use the shared solution of that preset
+        """
+        el = Langmuir(em, co, accuracy="fast")
+        self.assertIs(el._dps, DimensionlessLangmuirPoissonSoln.shared(accuracy="fast"))
+
+    def test_position(self):
+        """
+        position of each preset should agree with quadrature
+        """
+        for accuracy, places in [("fast", 4), ("default", 6), ("reference", 8)]:
+            dps = DimensionlessLangmuirPoissonSoln.shared(accuracy=accuracy)
+            for branch, motive in [("lhs", 0.01), ("lhs", 5.), ("rhs", 0.01), ("rhs", 50.)]:
+                self.assertAlmostEqual(dps.position(motive, branch), dps.quadrature_position(motive, branch), places=places)
+
+    def test_motive(self):
+        """
+        motive of the default preset should agree with the tabulation
+        """
+        dps = DimensionlessLangmuirPoissonSoln.shared(accuracy="default")
+        position = np.array([-2.5, -1., 0.1, 10., 40.])
+        np.testing.assert_allclose(dps.motive(position), DimensionlessLangmuirPoissonSoln.shared().motive(position), rtol=1e-4)
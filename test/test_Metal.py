@@ -3,9 +3,10 @@
 import collections
 import numpy as np
 from tec.electrode import Metal
-from astropy import units
+from astropy import units, constants
 import unittest
 import copy
+import pickle
 from physicalproperty import find_PhysicalProperty
 
 input_params = {"temp": 300.,
@@ -507,6 +508,55 @@ class Iteration(Base):
 
         self.assertIn("__class__", iteration_keys)
 
+    def test_schema(self):
+        """
+        Metal.schema should list the PhysicalProperty attributes in the order of the arguments of __init__
+        """
+        names = [name for name, _ in Metal.schema()]
+        self.assertEqual(names, ["temp", "barrier", "richardson", "voltage", "position", "emissivity"])
+        self.assertEqual(set(names), set(find_PhysicalProperty(self.el)))
+
+    def test_schema_cached(self):
+        """
+        Metal.schema should return the same object on every call
+        """
+        self.assertIs(Metal.schema(), Metal.schema())
+
+    def test_iteration_order(self):
+        """
+        Iteration should follow Metal.schema after `__class__`
+        """
+        keys = [itm[0] for itm in iter(self.el)]
+        self.assertEqual(keys, ["__class__"] + [name for name, _ in Metal.schema()])
+
+
+class Records(Base):
+    """
+    Tests conversion of many objects to a structured array
+    """
+    def test_to_records(self):
+        """
+        Metal.to_records should give one element per object and one field per attribute
+        """
+        electrodes = [self.el, Metal(temp=1000., barrier=2.5, emissivity=0.5)]
+        records = Metal.to_records(electrodes)
+        self.assertEqual(records.dtype.names, tuple(name for name, _ in Metal.schema()))
+        np.testing.assert_array_equal(records["temp"], [300., 1000.])
+        np.testing.assert_array_equal(records["emissivity"], [0., 0.5])
+
+    def test_round_trip(self):
+        """
+        Metal.from_records should invert Metal.to_records
+        """
+        electrodes = Metal.from_records(Metal.to_records([self.el]))
+        self.assertEqual(dict(electrodes[0]), dict(self.el))
+
+    def test_wrong_class(self):
+        """
+        Metal.to_records requires instances of the class
+        """
+        self.assertRaises(TypeError, Metal.to_records, [self.el, "not an electrode"])
+
 
 class MethodsReturnType(Base):
     """
@@ -582,4 +632,275 @@ class MethodsReturnValues(Base):
     """
     Tests values of methods against known values
     """
-    pass
+    def setUp(self):
+        """
+        Create a hot `Metal` with a bias voltage
+        """
+        self.el = Metal(temp=1500., barrier=2., richardson=10., voltage=0.5)
+
+    def test_motive(self):
+        """
+        Metal.motive should match the unit-carrying expression
+        """
+        expected = (self.el.barrier + constants.e.si * self.el.voltage).to("eV")
+        self.assertAlmostEqual(self.el.motive().value, expected.value)
+
+    def test_thermoelectron_current_density(self):
+        """
+        Metal.thermoelectron_current_density should match the unit-carrying expression
+        """
+        exponent = (self.el.barrier / (constants.k_B * self.el.temp)).decompose()
+        expected = (self.el.richardson * self.el.temp**2 * np.exp(-exponent)).to("A/cm2")
+        np.testing.assert_allclose(self.el.thermoelectron_current_density().value, expected.value, rtol=1e-12)
+
+    def test_thermoelectron_energy_flux(self):
+        """
+        Metal.thermoelectron_energy_flux should match the unit-carrying expression
+        """
+        thermal_potential = (self.el.barrier + 2 * constants.k_B * self.el.temp) / constants.e.to("C")
+        expected = (thermal_potential * self.el.thermoelectron_current_density()).to("W/cm2")
+        np.testing.assert_allclose(self.el.thermoelectron_energy_flux().value, expected.value, rtol=1e-12)
+
+    def test_thermoelectron_current_density_zero_temp(self):
+        """
+        Metal.thermoelectron_current_density should be zero at zero temperature
+        """
+        self.el.temp = 0
+        self.el.barrier = 0
+        self.assertEqual(self.el.thermoelectron_current_density().value, 0)
+
+
+class ArrayAttributes(Base):
+    """
+    Tests Metal objects whose attributes are arrays
+    """
+    def setUp(self):
+        Base.setUp(self)
+        self.input_params["temp"] = np.array([[0.], [300.], [1000.]])
+        self.input_params["barrier"] = np.array([0., 1., 2.])
+        self.input_params["emissivity"] = 0.5
+        self.el = Metal(**self.input_params)
+
+    def test_out_of_bounds_element(self):
+        """
+        Metal instantiation requires every element of an array to satisfy constraints
+        """
+        self.input_params["temp"] = np.array([300., -1.])
+        self.assertRaises(ValueError, Metal, **self.input_params)
+
+    def test_motive_shape(self):
+        """
+        Metal.motive should return an array of the broadcast shape
+        """
+        self.input_params["voltage"] = np.array([[0.], [1.]])
+        el = Metal(**self.input_params)
+        self.assertEqual(el.motive().shape, (2, 3))
+
+    def test_thermoelectron_current_density(self):
+        """
+        Metal.thermoelectron_current_density should match scalar objects elementwise
+        """
+        current_density = self.el.thermoelectron_current_density()
+        self.assertEqual(current_density.shape, (3, 3))
+        for indx, temp in enumerate(self.input_params["temp"][:, 0]):
+            for jndx, barrier in enumerate(self.input_params["barrier"]):
+                el = Metal(temp=temp, barrier=barrier, richardson=self.input_params["richardson"])
+                self.assertAlmostEqual(current_density[indx, jndx].value, el.thermoelectron_current_density().value)
+
+    def test_thermoelectron_current_density_zero_temp(self):
+        """
+        Metal.thermoelectron_current_density should be zero where temp is zero
+        """
+        current_density = self.el.thermoelectron_current_density()
+        np.testing.assert_array_equal(current_density[0].value, 0)
+
+    def test_thermoelectron_energy_flux_shape(self):
+        """
+        Metal.thermoelectron_energy_flux should return an array of the broadcast shape
+        """
+        self.assertEqual(self.el.thermoelectron_energy_flux().shape, (3, 3))
+
+    def test_photon_flux(self):
+        """
+        Metal.photon_flux should match scalar objects elementwise
+        """
+        el = Metal(temp=np.array([300., 1000.]), barrier=2., emissivity=0.5)
+        expected = [Metal(temp=temp, barrier=2., emissivity=0.5).photon_flux().value for temp in [300., 1000.]]
+        np.testing.assert_allclose(el.photon_flux().value, expected)
+
+    def test_photon_energy_flux(self):
+        """
+        Metal.photon_energy_flux should match scalar objects elementwise
+        """
+        el = Metal(temp=np.array([300., 1000.]), barrier=2., emissivity=0.5)
+        expected = [Metal(temp=temp, barrier=2., emissivity=0.5).photon_energy_flux().value for temp in [300., 1000.]]
+        np.testing.assert_allclose(el.photon_energy_flux().value, expected)
+
+
+class Memoization(Base):
+    """
+    Tests caching of the values returned by methods
+    """
+    def test_counters(self):
+        """
+        Metal should count cache misses and hits
+        """
+        self.assertEqual((self.el.memo_hits, self.el.memo_misses), (0, 0))
+        self.el.motive()
+        self.assertEqual((self.el.memo_hits, self.el.memo_misses), (0, 1))
+        self.el.motive()
+        self.assertEqual((self.el.memo_hits, self.el.memo_misses), (1, 1))
+
+    def test_cached_value(self):
+        """
+        Metal should return the cached value
+        """
+        self.assertIs(self.el.thermoelectron_current_density(), self.el.thermoelectron_current_density())
+
+    def test_read_only(self):
+        """
+        Modifying a returned value in place should raise and leave the cache intact
+        """
+        motive = self.el.motive()
+        expected = motive.copy()
+        with self.assertRaises(ValueError):
+            motive *= 2
+        self.assertEqual(self.el.motive(), expected)
+
+    def test_invalidation(self):
+        """
+        Metal should discard cached values when an attribute is assigned
+        """
+        motive = self.el.motive()
+        self.el.voltage = 1
+        self.assertEqual(self.el.motive(), motive + units.Quantity(1, "eV"))
+        self.assertEqual(self.el.memo_misses, 2)
+
+    def test_failed_assignment(self):
+        """
+        Metal should keep cached values when an assignment fails
+        """
+        self.el.motive()
+        self.assertRaises(ValueError, setattr, self.el, "temp", -1)
+        self.el.motive()
+        self.assertEqual(self.el.memo_hits, 1)
+
+    def test_copy(self):
+        """
+        Discarding the cache of a shallow copy should leave the original's cache intact
+        """
+        self.el.motive()
+        el = copy.copy(self.el)
+        el._invalidate_memo()
+        self.el.motive()
+        self.assertEqual(self.el.memo_hits, 1)
+
+
+class Replace(Base):
+    """
+    Tests derivation of objects with changed attributes
+    """
+    methods = ["motive", "thermoelectron_current_density", "thermoelectron_energy_flux", "photon_flux", "photon_energy_flux"]
+
+    def setUp(self):
+        """
+        Create a `Metal` whose methods have been called
+        """
+        self.el = Metal(temp=1500., barrier=2., richardson=10., voltage=0.5, position=1., emissivity=0.5)
+        for method in self.methods:
+            getattr(self.el, method)()
+
+    def test_values(self):
+        """
+        Metal.replace should change only the given attributes
+        """
+        el = self.el.replace(voltage=1., temp=1000.)
+        self.assertEqual(el.voltage, units.Quantity(1., "V"))
+        self.assertEqual(el.temp, units.Quantity(1000., "K"))
+        self.assertEqual(el.barrier, self.el.barrier)
+        self.assertEqual(self.el.voltage, units.Quantity(0.5, "V"))
+
+    def test_out_of_bounds(self):
+        """
+        Metal.replace should check the new values against the constraints
+        """
+        self.assertRaises(ValueError, self.el.replace, emissivity=2)
+
+    def test_unknown_attribute(self):
+        """
+        Metal.replace requires names of PhysicalProperty attributes
+        """
+        self.assertRaises(TypeError, self.el.replace, not_an_attribute=1)
+
+    def test_kept_memo(self):
+        """
+        Metal.replace should keep cached values which don't depend on the changed attributes
+        """
+        el = self.el.replace(voltage=1.)
+        self.assertIs(el.thermoelectron_current_density(), self.el.thermoelectron_current_density())
+        self.assertEqual(el.memo_hits, 1)
+
+    def test_independent(self):
+        """
+        Modifying a shared attribute of the copy in place should raise and leave the original and its cache intact
+        """
+        el = self.el.replace(voltage=1.)
+        motive = self.el.motive()
+        with self.assertRaises(ValueError):
+            el.temp *= 1.5
+        with self.assertRaises(ValueError):
+            el.barrier += units.Quantity(1., "eV")
+        el.temp = el.temp * 1.5
+        self.assertEqual(el.temp, units.Quantity(2250., "K"))
+        self.assertEqual(self.el.temp, units.Quantity(1500., "K"))
+        self.assertEqual(self.el.barrier, units.Quantity(2., "eV"))
+        self.assertEqual(self.el.motive(), motive)
+        self.assertEqual(self.el.motive(), Metal.from_dict(dict(self.el)).motive())
+
+    def test_dependencies(self):
+        """
+        Methods of objects from Metal.replace should match freshly constructed objects
+        """
+        changes = {"temp": 1000., "barrier": 2.5, "richardson": 20., "voltage": 1., "position": 2., "emissivity": 0.25}
+        for name, value in changes.items():
+            el = self.el.replace(**{name: value})
+            fresh = Metal.from_dict(dict(dict(self.el), **{name: value}))
+            for method in self.methods:
+                self.assertEqual(getattr(el, method)(), getattr(fresh, method)(), "%s after changing %s" % (method, name))
+
+
+class Pickling(Base):
+    """
+    Tests pickling of Metal objects
+    """
+    def test_round_trip(self):
+        """
+        An unpickled Metal should have the same attributes
+        """
+        self.el.thermoelectron_current_density()
+        el = pickle.loads(pickle.dumps(self.el, 2))
+        self.assertEqual(dict(el), dict(self.el))
+        self.assertEqual(el.thermoelectron_current_density(), self.el.thermoelectron_current_density())
+        self.assertEqual(el.memo_misses, 1)
+
+    def test_arrays(self):
+        """
+        An unpickled Metal should keep array-valued attributes
+        """
+        el = pickle.loads(pickle.dumps(Metal(temp=np.array([300., 1000.]), barrier=2.), 2))
+        np.testing.assert_array_equal(el.temp.value, [300., 1000.])
+
+    def test_instance_attributes(self):
+        """
+        An unpickled Metal should keep other instance attributes
+        """
+        self.el.tabulated_photon_flux = False
+        el = pickle.loads(pickle.dumps(self.el, 2))
+        self.assertFalse(el.tabulated_photon_flux)
+
+    def test_size(self):
+        """
+        A pickled Metal shouldn't contain Quantity objects
+        """
+        self.el.motive()
+        self.assertLess(len(pickle.dumps(self.el, 2)), 200)
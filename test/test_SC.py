@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-from tec.electrode import SC
-from astropy import units
+from tec.electrode import Metal, SC
+from astropy import units, constants
 import unittest
 import copy
+import pickle
 
 # Values for Si taken from Streetman & Banerjee 9780130255389.
 input_params = {"temp": 300.,
@@ -658,4 +659,337 @@ class MethodsReturnValues(Base):
     """
     Tests values of methods against known values
     """
-    pass
+    def test_cb_effective_dos(self):
+        """
+        SC.cb_effective_dos should match the unit-carrying expression
+        """
+        expected = 2 * ((2 * np.pi * self.el.electron_effective_mass * constants.k_B * self.el.temp) / (constants.h ** 2))**(3. / 2)
+        np.testing.assert_allclose(self.el.cb_effective_dos().value, expected.to("1/cm3").value, rtol=1e-12)
+
+    def test_vb_effective_dos(self):
+        """
+        SC.vb_effective_dos should match the unit-carrying expression
+        """
+        expected = 2 * ((2 * np.pi * self.el.hole_effective_mass * constants.k_B * self.el.temp) / (constants.h ** 2))**(3. / 2)
+        np.testing.assert_allclose(self.el.vb_effective_dos().value, expected.to("1/cm3").value, rtol=1e-12)
+
+    def test_fermi_energy(self):
+        """
+        SC.fermi_energy should satisfy charge neutrality
+        """
+        fermi_energy = self.el.fermi_energy()
+        kt = constants.k_B * self.el.temp
+        el_carrier_conc = self.el.cb_effective_dos() * np.exp(-((self.el.bandgap - fermi_energy) / kt).decompose())
+        ho_carrier_conc = self.el.vb_effective_dos() * np.exp(-(fermi_energy / kt).decompose())
+        ionized = self.el.acceptor_concentration / (1 + 4 * np.exp(((self.el.acceptor_ionization_energy - fermi_energy) / kt).decompose()))
+        net_charge = (el_carrier_conc - ho_carrier_conc + ionized).to("1/cm3").value
+        self.assertLess(abs(net_charge), 1e-6 * self.el.acceptor_concentration.value)
+
+    def test_fermi_energy_invalidation(self):
+        """
+        SC.fermi_energy should be recomputed when an attribute is assigned
+        """
+        fermi_energy = self.el.fermi_energy()
+        self.el.temp = 600
+        self.assertNotEqual(self.el.fermi_energy(), fermi_energy)
+
+
+class CarrierStatistics(Base):
+    """
+    Tests SC.carrier_statistics
+    """
+    keys = ["fermi_energy", "electron_concentration", "hole_concentration", "cb_effective_dos", "vb_effective_dos", "ionized_acceptor_concentration"]
+
+    def test_keys(self):
+        """
+        SC.carrier_statistics should return a Quantity for each statistic
+        """
+        stats = self.el.carrier_statistics()
+        self.assertEqual(sorted(stats), sorted(self.keys + ["fermi_energy_evaluations"]))
+        for key in self.keys:
+            self.assertIsInstance(stats[key], units.Quantity)
+
+    def test_methods(self):
+        """
+        The per-quantity methods should return the values of SC.carrier_statistics
+        """
+        stats = self.el.carrier_statistics()
+        for key in self.keys[:-1]:
+            self.assertIs(getattr(self.el, key)(), stats[key])
+
+    def test_single_solve(self):
+        """
+        Asking for the Fermi energy and both carrier concentrations should solve charge neutrality once
+        """
+        self.el.hole_concentration()
+        hits, misses = self.el.memo_hits, self.el.memo_misses
+        self.el.fermi_energy()
+        self.el.electron_concentration()
+        # Each method misses once and finds SC.carrier_statistics cached.
+        self.assertEqual(self.el.memo_misses, misses + 2)
+        self.assertEqual(self.el.memo_hits, hits + 2)
+
+    def test_charge_neutrality(self):
+        """
+        The carrier concentrations of SC.carrier_statistics should satisfy charge neutrality
+        """
+        stats = self.el.carrier_statistics()
+        net_charge = stats["electron_concentration"] - stats["hole_concentration"] + stats["ionized_acceptor_concentration"]
+        self.assertLess(abs(net_charge.value), 1e-6 * self.el.acceptor_concentration.value)
+
+    def test_invalidation(self):
+        """
+        SC.carrier_statistics should be recomputed when an attribute is assigned
+        """
+        stats = self.el.carrier_statistics()
+        self.el.acceptor_concentration = 1e16
+        self.assertNotEqual(self.el.carrier_statistics()["fermi_energy"], stats["fermi_energy"])
+
+    def test_read_only(self):
+        """
+        The Quantities of SC.carrier_statistics should be read-only
+        """
+        stats = self.el.carrier_statistics()
+        for key in self.keys:
+            self.assertFalse(stats[key].flags.writeable)
+
+
+class FermiSolver(Base):
+    """
+    Tests the solvers selected by SC.fermi_solver
+    """
+    def setUp(self):
+        """
+        Create an `SC` which solves for the Fermi energy by Newton's method
+        """
+        self.input_params = copy.copy(input_params)
+        self.el = SC(**input_params)
+        self.el.fermi_solver = "newton"
+
+    def test_default(self):
+        """
+        SC.fermi_solver should default to brentq and be settable per instance
+        """
+        self.assertEqual(SC.fermi_solver, "brentq")
+        self.assertEqual(SC(**input_params).fermi_solver, "brentq")
+
+    def test_scalar_match(self):
+        """
+        The Newton solution should match brentq to within 1e-11 eV
+        """
+        for temp in [100., 300., 1000.]:
+            for acceptor_concentration in [0, 1e12, 1e16, 1e19]:
+                params = dict(input_params, temp=temp, acceptor_concentration=acceptor_concentration)
+                el = SC(**params)
+                el.fermi_solver = "newton"
+                self.assertLess(abs((el.fermi_energy() - SC(**params).fermi_energy()).value), 1e-11)
+
+    def test_array_match(self):
+        """
+        The Newton solution should match the array solution of brentq to within 1e-11 eV
+        """
+        params = dict(input_params, temp=np.linspace(100., 1500., 8)[:, np.newaxis], acceptor_concentration=np.logspace(10, 20, 6))
+        el = SC(**params)
+        el.fermi_solver = "newton"
+        np.testing.assert_allclose(el.fermi_energy().value, SC(**params).fermi_energy().value, rtol=0, atol=1e-11)
+
+    def test_evaluations(self):
+        """
+        SC.carrier_statistics should count the evaluations of each solver
+        """
+        brentq = SC(**input_params).carrier_statistics()["fermi_energy_evaluations"]
+        newton = self.el.carrier_statistics()["fermi_energy_evaluations"]
+        self.assertGreater(newton, 2)
+        self.assertLess(newton, brentq)
+
+    def test_not_bracketed(self):
+        """
+        The Newton solution should raise ValueError for scalars and be NaN for arrays where charge neutrality can't be satisfied
+        """
+        self.el.acceptor_ionization_energy = 0
+        self.el.acceptor_concentration = 1e22
+        self.assertRaises(ValueError, self.el.fermi_energy)
+
+        self.el.acceptor_concentration = np.array([1e18, 1e22])
+        fermi_energy = self.el.fermi_energy().value
+        self.assertFalse(np.isnan(fermi_energy[0]))
+        self.assertTrue(np.isnan(fermi_energy[1]))
+
+    def test_unknown_solver(self):
+        """
+        SC.fermi_energy should raise ValueError for an unknown solver
+        """
+        self.el.fermi_solver = "secant"
+        self.assertRaises(ValueError, self.el.fermi_energy)
+
+    def test_pickling(self):
+        """
+        The solver of an instance should survive pickling and SC.replace
+        """
+        self.assertEqual(pickle.loads(pickle.dumps(self.el, 2)).fermi_solver, "newton")
+        self.assertEqual(self.el.replace(temp=600).fermi_solver, "newton")
+
+
+class CarrierStatisticsSweep(Base):
+    """
+    Tests SC.carrier_statistics_sweep
+    """
+    def test_temp(self):
+        """
+        A sweep of temp should match SC.carrier_statistics at each point
+        """
+        temp = np.linspace(100., 1500., 50)
+        stats = self.el.carrier_statistics_sweep("temp", temp)
+        expected = self.el.replace(temp=temp).carrier_statistics()
+        np.testing.assert_allclose(stats["fermi_energy"].value, expected["fermi_energy"].value, rtol=0, atol=1e-11)
+        for key in ["electron_concentration", "hole_concentration", "cb_effective_dos", "vb_effective_dos", "ionized_acceptor_concentration"]:
+            self.assertEqual(stats[key].shape, (50, ))
+            np.testing.assert_allclose(stats[key].value, expected[key].value, rtol=1e-9)
+
+    def test_acceptor_concentration(self):
+        """
+        A sweep of acceptor_concentration should match SC.fermi_energy at each point, with NaN where there is no solution
+        """
+        self.el.acceptor_ionization_energy = 0
+        acceptor_concentration = np.logspace(10, 22, 61)
+        fermi_energy = self.el.carrier_statistics_sweep("acceptor_concentration", acceptor_concentration)["fermi_energy"].value
+        expected = self.el.replace(acceptor_concentration=acceptor_concentration).fermi_energy().value
+        np.testing.assert_array_equal(np.isnan(fermi_energy), np.isnan(expected))
+        self.assertTrue(np.isnan(fermi_energy[-1]))
+        np.testing.assert_allclose(fermi_energy, expected, rtol=0, atol=1e-11)
+
+    def test_evaluations(self):
+        """
+        A fine sweep should take fewer evaluations than solving each point afresh
+        """
+        temp = np.linspace(300., 400., 101)
+        evaluations = self.el.carrier_statistics_sweep("temp", temp)["fermi_energy_evaluations"]
+        el = self.el.replace(temp=temp)
+        el.fermi_solver = "newton"
+        self.assertLess(evaluations.sum(), el.carrier_statistics()["fermi_energy_evaluations"].sum())
+
+    def test_unchanged(self):
+        """
+        SC.carrier_statistics_sweep should not change the object
+        """
+        fermi_energy = self.el.fermi_energy()
+        self.el.carrier_statistics_sweep("temp", [300., 400.])
+        self.assertEqual(self.el.temp.value, 300.)
+        self.assertIs(self.el.fermi_energy(), fermi_energy)
+
+    def test_invalid(self):
+        """
+        SC.carrier_statistics_sweep should raise ValueError for attributes the Fermi energy doesn't depend on, multidimensional values and array attributes
+        """
+        self.assertRaises(ValueError, self.el.carrier_statistics_sweep, "barrier", [1., 2.])
+        self.assertRaises(ValueError, self.el.carrier_statistics_sweep, "temp", [[300., 400.]])
+        self.el.bandgap = [1.1, 1.2]
+        self.assertRaises(ValueError, self.el.carrier_statistics_sweep, "temp", [300., 400.])
+
+
+class Schema(Base):
+    """
+    Tests the PhysicalProperty schema of the class
+    """
+    def test_schema(self):
+        """
+        SC.schema should include the attributes of Metal and of SC
+        """
+        names = [name for name, _ in SC.schema()]
+        self.assertEqual(len(names), 13)
+        self.assertEqual(names[:4], ["temp", "barrier", "richardson", "bandgap"])
+
+    def test_schema_per_class(self):
+        """
+        SC.schema should not be shared with Metal.schema
+        """
+        self.assertIsNot(SC.schema(), Metal.schema())
+        self.assertEqual(len(Metal.schema()), 6)
+
+
+class Replace(Base):
+    """
+    Tests derivation of objects with changed attributes
+    """
+    methods = ["motive", "thermoelectron_current_density", "cb_effective_dos", "vb_effective_dos", "fermi_energy", "electron_concentration", "hole_concentration", "carrier_statistics", "photon_flux", "photon_energy_flux"]
+
+    def test_dependencies(self):
+        """
+        Methods of objects from SC.replace should match freshly constructed objects
+        """
+        self.el.emissivity = 0.5
+        for method in self.methods:
+            getattr(self.el, method)()
+
+        changes = {"temp": 600., "barrier": 1.5, "richardson": 20., "voltage": 1., "bandgap": 1.42,
+                   "electron_effective_mass": 6e-32, "hole_effective_mass": 4.6e-31,
+                   "acceptor_concentration": 1e16, "acceptor_ionization_energy": 30.,
+                   "donor_concentration": 1e16, "donor_ionization_energy": 30., "emissivity": 0.25}
+        for name, value in changes.items():
+            el = self.el.replace(**{name: value})
+            fresh = SC.from_dict(dict(dict(self.el), **{name: value}))
+            for method in self.methods:
+                self.assertEqual(getattr(el, method)(), getattr(fresh, method)(), "%s after changing %s" % (method, name))
+
+
+class Pickling(Base):
+    """
+    Tests pickling of SC objects
+    """
+    def test_round_trip(self):
+        """
+        An unpickled SC should have the same attributes and Fermi energy
+        """
+        el = pickle.loads(pickle.dumps(self.el, 2))
+        self.assertIsInstance(el, SC)
+        self.assertEqual(dict(el), dict(self.el))
+        self.assertEqual(el.fermi_energy(), self.el.fermi_energy())
+
+
+class FermiEnergyArrays(Base):
+    """
+    Tests SC.fermi_energy with array-valued attributes
+    """
+    def setUp(self):
+        """
+        Create an `SC` over a grid of temperature, acceptor concentration and bandgap
+        """
+        self.input_params = copy.copy(input_params)
+        self.input_params["temp"] = np.array([100., 300., 1000.])[:, np.newaxis, np.newaxis]
+        self.input_params["acceptor_concentration"] = np.array([1e14, 1e18])[:, np.newaxis]
+        self.input_params["bandgap"] = np.array([0.5, 1.11, 2.5])
+        self.el = SC(**self.input_params)
+
+    def test_shape(self):
+        """
+        SC.fermi_energy should return an array of the broadcast shape
+        """
+        self.assertEqual(self.el.fermi_energy().shape, (3, 2, 3))
+
+    def test_scalar_match(self):
+        """
+        SC.fermi_energy should match scalar objects elementwise to within 1e-11 eV
+        """
+        fermi_energy = self.el.fermi_energy().value
+        for indx, temp in enumerate(self.input_params["temp"].ravel()):
+            for jndx, acceptor_concentration in enumerate(self.input_params["acceptor_concentration"].ravel()):
+                for kndx, bandgap in enumerate(self.input_params["bandgap"]):
+                    params = dict(input_params, temp=temp, acceptor_concentration=acceptor_concentration, bandgap=bandgap)
+                    expected = SC(**params).fermi_energy().value
+                    self.assertLess(abs(fermi_energy[indx, jndx, kndx] - expected), 1e-11)
+
+    def test_not_bracketed(self):
+        """
+        SC.fermi_energy should return NaN where charge neutrality can't be satisfied within the bandgap
+        """
+        el = SC(**dict(input_params, acceptor_concentration=np.array([1e18, 1e22]), acceptor_ionization_energy=0))
+        fermi_energy = el.fermi_energy().value
+        self.assertFalse(np.isnan(fermi_energy[0]))
+        self.assertTrue(np.isnan(fermi_energy[1]))
+
+    def test_carrier_concentrations(self):
+        """
+        SC carrier concentrations should follow array-valued Fermi energies
+        """
+        self.assertEqual(self.el.electron_concentration().shape, (3, 2, 3))
+        self.assertEqual(self.el.hole_concentration().shape, (3, 2, 3))
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pickle
+from tec.electrode import Metal, SC, SlottedMetal, SlottedSC
+from astropy import units
+import unittest
+import copy
+
+input_params = {"temp": 1500.,
+                "barrier": 2.0,
+                "richardson": 10.,
+                "voltage": 0.5,
+                "emissivity": 0.5, }
+
+sc_params = {"temp": 300.,
+             "barrier": 1.0,
+             "richardson": 100.0,
+             "acceptor_concentration": 1e18,
+             "acceptor_ionization_energy": 45.,
+             "bandgap": 1.11,
+             "emissivity": 0.5, }
+
+
+# Base classes
+# ============
+class Base(unittest.TestCase):
+    """
+    Base class for tests
+
+    This class is intended to be subclassed so that the same `setUp` method does not have to be rewritten for each class containing tests.
+    """
+    def setUp(self):
+        """
+        Create new SlottedMetal object for every test
+        """
+        self.input_params = copy.copy(input_params)
+        self.el = SlottedMetal(**input_params)
+
+
+# Test classes
+# ============
+class Instantiation(Base):
+    """
+    Tests all aspects of instantiation
+    """
+    def test_missing_argument(self):
+        """
+        SlottedMetal instantiation requires the arguments of Metal
+        """
+        del self.input_params["barrier"]
+        self.assertRaises(TypeError, SlottedMetal, **self.input_params)
+
+    def test_out_of_bounds(self):
+        """
+        SlottedMetal instantiation requires values satisfying the constraints of Metal
+        """
+        self.input_params["emissivity"] = 1.5
+        self.assertRaises(ValueError, SlottedMetal, **self.input_params)
+
+    def test_array(self):
+        """
+        SlottedMetal instantiation requires scalar values
+        """
+        self.input_params["temp"] = np.array([300., 1000.])
+        self.assertRaises(TypeError, SlottedMetal, **self.input_params)
+
+    def test_no_dict(self):
+        """
+        SlottedMetal objects should have no __dict__
+        """
+        self.assertFalse(hasattr(self.el, "__dict__"))
+        self.assertRaises(AttributeError, setattr, self.el, "not_an_attribute", 1)
+
+
+class Attributes(Base):
+    """
+    Tests getting and setting attributes
+    """
+    def test_get(self):
+        """
+        Attributes should be Quantities in their default units
+        """
+        self.assertEqual(self.el.voltage, units.Quantity(0.5, "V"))
+        self.assertEqual(self.el.emissivity.unit, units.dimensionless_unscaled)
+
+    def test_set_units(self):
+        """
+        Setting an attribute should convert it to its default unit
+        """
+        self.el.barrier = units.Quantity(1500., "meV")
+        self.assertEqual(self.el.barrier, units.Quantity(1.5, "eV"))
+
+    def test_set_out_of_bounds(self):
+        """
+        Setting an attribute should check its constraints
+        """
+        self.assertRaises(ValueError, setattr, self.el, "temp", -1)
+
+
+class Methods(Base):
+    """
+    Tests methods against those of the full classes
+    """
+    def test_metal(self):
+        """
+        SlottedMetal methods should return the values of Metal methods
+        """
+        el = Metal(**input_params)
+        for method in ["motive", "thermoelectron_current_density", "thermoelectron_energy_flux", "photon_flux", "photon_energy_flux"]:
+            self.assertEqual(getattr(self.el, method)(), getattr(el, method)())
+
+    def test_sc(self):
+        """
+        SlottedSC methods should return the values of SC methods
+        """
+        slotted, el = SlottedSC(**sc_params), SC(**sc_params)
+        for method in ["cb_effective_dos", "vb_effective_dos", "fermi_energy", "electron_concentration", "hole_concentration", "photon_flux", "photon_energy_flux"]:
+            self.assertEqual(getattr(slotted, method)(), getattr(el, method)())
+
+    def test_carrier_statistics_sweep(self):
+        """
+        SlottedSC.carrier_statistics_sweep should return the values of SC.carrier_statistics_sweep
+        """
+        slotted, el = SlottedSC(**sc_params), SC(**sc_params)
+        temp = np.linspace(300., 600., 9)
+        stats, expected = slotted.carrier_statistics_sweep("temp", temp), el.carrier_statistics_sweep("temp", temp)
+        self.assertEqual(sorted(stats), sorted(expected))
+        for key in expected:
+            np.testing.assert_array_equal(stats[key], expected[key])
+
+    def test_omitted(self):
+        """
+        SlottedMetal should omit the methods specific to the storage of Metal
+        """
+        for name in ["replace", "from_records", "to_records", "_from_validated", "_invalidate_memo"]:
+            self.assertTrue(hasattr(Metal, name))
+            self.assertFalse(hasattr(SlottedMetal, name), name)
+            self.assertFalse(hasattr(SlottedSC, name), name)
+
+    def test_not_cached(self):
+        """
+        SlottedMetal methods should follow changes of the attributes
+        """
+        motive = self.el.motive()
+        self.el.voltage = 1
+        self.assertEqual(self.el.motive(), motive + units.Quantity(0.5, "eV"))
+
+
+class Conversion(Base):
+    """
+    Tests conversion to and from the full classes
+    """
+    def test_round_trip(self):
+        """
+        Converting to Metal and back should preserve every value
+        """
+        el = self.el.to_electrode()
+        self.assertIsInstance(el, Metal)
+        self.assertEqual(dict(SlottedMetal.from_electrode(el)), dict(self.el))
+
+    def test_from_electrode(self):
+        """
+        SlottedSC.from_electrode should preserve the values of an SC
+        """
+        el = SC(**sc_params)
+        slotted = SlottedSC.from_electrode(el)
+        self.assertEqual(dict(slotted.to_electrode()), dict(el))
+
+    def test_wrong_class(self):
+        """
+        SlottedSC.from_electrode requires an SC
+        """
+        self.assertRaises(TypeError, SlottedSC.from_electrode, Metal(**input_params))
+
+    def test_iteration(self):
+        """
+        Iteration should match Metal apart from `__class__`
+        """
+        items = dict(self.el)
+        self.assertIs(items.pop("__class__"), SlottedMetal)
+        expected = dict(Metal(**input_params))
+        del expected["__class__"]
+        self.assertEqual(items, expected)
+
+    def test_pickle(self):
+        """
+        An unpickled SlottedSC should have the same values
+        """
+        el = SlottedSC(**sc_params)
+        self.assertEqual(dict(pickle.loads(pickle.dumps(el, 2))), dict(el))
+
+    def test_isinstance(self):
+        """
+        SlottedSC should be a SlottedMetal
+        """
+        self.assertIsInstance(SlottedSC(**sc_params), SlottedMetal)
@@ -7,6 +7,7 @@ from tec import TECBase
 from astropy import units
 import unittest
 import copy
+import pickle
 
 em = Metal(temp=1000., barrier=2., richardson=10.)
 co = Metal(temp=300., barrier=1., richardson=10., position=10.)
@@ -94,6 +95,21 @@ class Set(Base):
             self.fail("`collector` attribute can be assigned a non-electrode value.")
 
 
+class Pickling(Base):
+    """
+    Tests pickling of TECBase objects
+    """
+    def test_round_trip(self):
+        """
+        An unpickled TECBase should have the same electrodes
+        """
+        t = pickle.loads(pickle.dumps(self.t, 2))
+        self.assertIsInstance(t, TECBase)
+        self.assertEqual(dict(t.emitter), dict(self.t.emitter))
+        self.assertEqual(dict(t.collector), dict(self.t.collector))
+        self.assertEqual(t.output_current_density(), self.t.output_current_density())
+
+
 class Iteration(Base):
     """
     Tests class's iteration API